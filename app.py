@@ -1,36 +1,48 @@
-from flask import Flask, request, jsonify, render_template, redirect, url_for, session
+from flask import Flask, Response, request, jsonify, render_template, redirect, url_for, session, stream_with_context
 import os
 import sys
-from datetime import date, datetime, timedelta
-import configparser
+import json
+import itertools
+import io
+import click
+from datetime import timedelta
 from utils.logger import logger
 
 
 # JWT specific imports
-from flask_jwt_extended import create_access_token, jwt_required, JWTManager, get_jwt_identity, set_access_cookies, unset_jwt_cookies, verify_jwt_in_request
+from flask_jwt_extended import create_access_token, jwt_required, JWTManager, get_jwt_identity, set_access_cookies, unset_jwt_cookies, verify_jwt_in_request, current_user
 
 # Add project root to sys.path for module imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from dto.catalog import Catalog
 from dto.user import User
-from service.catalog_service import CatalogService
+from service.catalog_service import CatalogService, COUNT_EXACT, COUNT_CAPPED, COUNT_NONE, EXPORT_COLUMNS, parse_fields
+from service.catalog_import_service import CatalogImportService, IMPORT_FORMATS
 from service.user_service import UserService
 from service.authentication_service import AuthenticationService
-from exception.catalog_exception import ValidationError, DataNotFoundError, DatabaseConnectionError, AuthenticationError
-from utils.validation import validate_alphanumeric_string, validate_date, validate_future_date, validate_status
+from exception.catalog_exception import ValidationError, DataNotFoundError, DatabaseConnectionError, AuthenticationError, ServiceUnavailableError, PreconditionFailedError
+from utils.validation import validate_catalog_payload, validate_catalog_patch
+from utils.config import CONFIG_PATH, DEFAULT_JWT_SECRET_KEY, get_config
+from utils.db_pool import get_pool_stats
+from utils.export import csv_chunks, ndjson_chunks, gzip_chunks
+from utils import metrics
+from utils import compression
+from utils import assets
+from utils.logger import resolve_log_path
+from utils.query_executor import executor
+from utils.slow_query import summarize_slow_log
+from utils.serialization import serialize_catalog_for_json, catalog_etag, parse_if_match, rows_to_json, json_with_data
+from utils.catalog_schema import catalog_schema
 
 app = Flask(__name__)
 
-# Load JWT secret key from config.ini
-config = configparser.ConfigParser()
-config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config', 'config.ini')
-if not os.path.exists(config_path):
-    logger.critical(f"FATAL ERROR: Configuration file not found at: {config_path}")
+# Load JWT secret key from config.ini (parsed once and shared with the database pool)
+if not os.path.exists(CONFIG_PATH):
+    logger.critical("FATAL ERROR: Configuration file not found at: %s", CONFIG_PATH)
     sys.exit(1)
-config.read(config_path)
+config = get_config()
 
-app.config["JWT_SECRET_KEY"] = config.get('jwt', 'secret_key', fallback='super_secret_jwt_key_change_this')
+app.config["JWT_SECRET_KEY"] = config.get('jwt', 'secret_key', fallback=DEFAULT_JWT_SECRET_KEY)
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1) # Token valid for 1 hour
 app.config["JWT_TOKEN_LOCATION"] = ["cookies"] # Store JWT in cookies
 app.config["JWT_COOKIE_SECURE"] = False # Set to True in production with HTTPS
@@ -39,9 +51,40 @@ app.config["JWT_SESSION_COOKIE"] = True # Make the JWT cookie a session cookie f
 
 jwt = JWTManager(app)
 
+# Per-request timing (Server-Timing header) and Prometheus metrics at /metrics
+METRICS_ENABLED = config.getboolean('metrics', 'enabled', fallback=True)
+if METRICS_ENABLED:
+    metrics.init_app(app)
+
+# gzip/deflate for text and JSON responses, and content-hashed static files served as immutable
+compressor = compression.build_compressor(config)
+if compressor is not None:
+    compression.init_app(app, compressor)
+static_assets = assets.init_app(app, max_age=config.getint('static', 'max_age', fallback=31536000))
+
+# Export formats: format name -> (mimetype, chunk encoder)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', csv_chunks),
+    'ndjson': ('application/x-ndjson', ndjson_chunks),
+}
+EXPORT_BATCH_SIZE = config.getint('export', 'batch_size', fallback=1000)
+IMPORT_MAX_REPORTED_ERRORS = config.getint('import', 'max_reported_errors', fallback=1000)
+
 catalog_service = CatalogService()
+catalog_import_service = CatalogImportService(catalog_service, batch_size=config.getint('import', 'batch_size', fallback=500))
 user_service = UserService()
-authentication_service = AuthenticationService()
+authentication_service = AuthenticationService(user_service=user_service)
+
+@jwt.user_lookup_loader
+def load_current_user(jwt_header: dict, jwt_data: dict) -> User | None:
+    """
+    Resolves the JWT identity to a User for `current_user`, once per request.
+    Tokens issued at login carry username/email claims, so the common path needs no query;
+    older tokens fall back to the process-wide user cache.
+    """
+    if 'username' in jwt_data and 'email' in jwt_data:
+        return User.from_claims(jwt_data)
+    return user_service.get_user_by_id_cached(int(jwt_data['sub']))
 
 # --- Custom Error Handlers ---
 @app.errorhandler(404)
@@ -50,12 +93,15 @@ def page_not_found(e):
 
 @app.errorhandler(500)
 def internal_server_error(e):
-    logger.error(f"Internal Server Error: {e}", exc_info=True)
+    logger.error("Internal Server Error: %s", e, exc_info=True)
     return render_template('500.html'), 500
 
 @app.errorhandler(ValidationError)
 def handle_validation_error(e):
-    return jsonify({"message": "Validation Error", "details": str(e)}), 400
+    body = {"message": "Validation Error", "details": str(e)}
+    if getattr(e, 'errors', None):
+        body["errors"] = e.errors
+    return jsonify(body), 400
 
 @app.errorhandler(DataNotFoundError)
 def handle_data_not_found_error(e):
@@ -63,28 +109,34 @@ def handle_data_not_found_error(e):
 
 @app.errorhandler(DatabaseConnectionError)
 def handle_database_error(e):
-    logger.critical(f"Database Connection Error: {e}", exc_info=True)
+    logger.critical("Database Connection Error: %s", e, exc_info=True)
     return jsonify({"message": "Database Error", "details": "Could not connect to the database or a database operation failed."}), 500
 
 @app.errorhandler(AuthenticationError)
 def handle_authentication_error(e):
     return jsonify({"message": "Authentication Failed", "details": str(e)}), 401
 
+@app.errorhandler(ServiceUnavailableError)
+def handle_service_unavailable_error(e):
+    response = jsonify({"message": "Service Unavailable", "details": str(e)})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+@app.errorhandler(PreconditionFailedError)
+def handle_precondition_failed_error(e):
+    return jsonify({"message": "Precondition Failed", "details": str(e)}), 412
+
 @app.errorhandler(Exception)
 def handle_general_exception(e):
-    app.logger.error(f"An unexpected error occurred: {e}", exc_info=True)
+    app.logger.error("An unexpected error occurred: %s", e, exc_info=True)
     return jsonify({"message": "Internal Server Error", "details": "An unexpected error occurred. Please try again later."}), 500
 
 # --- Helper for JSON serialization of Catalog objects ---
-def serialize_catalog_for_json(catalog_data: dict) -> dict:
-    """Serializes catalog data, converting date objects to string format."""
-    if not catalog_data:
-        return None
-    serialized_data = catalog_data.copy()
-    for key in ['start_date', 'end_date']:
-        if key in serialized_data and isinstance(serialized_data[key], (date, datetime)):
-            serialized_data[key] = serialized_data[key].strftime('%Y-%m-%d')
-    return serialized_data
+def versioned_write_response(message: str, catalog_id: int, version: int) -> tuple[jsonify, int]:
+    """Builds the response of a successful PUT/PATCH, carrying the new version and its ETag."""
+    response = jsonify({"message": message, "data": {"catalog_id": catalog_id, "version": version}})
+    response.set_etag(catalog_etag(version))
+    return response, 200
 
 # --- Frontend Routes ---
 from flask_jwt_extended import verify_jwt_in_request, exceptions
@@ -131,17 +183,25 @@ def login_api():
 
     try:
         user = authentication_service.authenticate_user(username_or_email, password)
-        access_token = create_access_token(identity=str(user.user_id))
+        access_token = create_access_token(identity=str(user.user_id), additional_claims=user.to_claims())
         response = jsonify({"message": "Login successful.", "data": user.to_dict(), "redirect_to": url_for('index_page')})
         set_access_cookies(response, access_token)
         return response, 200
     except AuthenticationError as e:
         return handle_authentication_error(e)
+    except ServiceUnavailableError as e:
+        return handle_service_unavailable_error(e)
     except (ValidationError, DatabaseConnectionError) as e:
         return handle_validation_error(e)
     except Exception as e:
         return handle_general_exception(e)
 
+@app.route('/api/me', methods=['GET'])
+@jwt_required()
+def get_current_user_api() -> tuple[jsonify, int]:
+    """API endpoint returning the logged-in user's public profile."""
+    return jsonify({"message": "User retrieved successfully.", "data": current_user.to_dict()}), 200
+
 @app.route('/api/logout', methods=['POST'])
 @jwt_required()
 def logout_api():
@@ -161,18 +221,7 @@ def add_catalog_api() -> tuple[jsonify, int]:
         raise ValidationError("Request must contain JSON data.")
 
     try:
-        name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
-        description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
-        start_date = validate_future_date(data.get('start_date'), "Start Date")
-        end_date = validate_future_date(data.get('end_date'), "End Date")
-        status = validate_status(data.get('status'))
-
-        if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
-            raise ValidationError("End Date cannot be before Start Date.")
-
-        new_catalog = Catalog(name=name, description=description,
-                              start_date=start_date, end_date=end_date, status=status)
-        
+        new_catalog = validate_catalog_payload(data)
         catalog_id = catalog_service.create_catalog(new_catalog, current_user_id)
         return jsonify({"message": "Catalog created successfully.", "data": {"catalog_id": catalog_id}}), 201
     except ValidationError as e:
@@ -185,11 +234,19 @@ def add_catalog_api() -> tuple[jsonify, int]:
 @app.route('/api/catalogs/<int:catalog_id>', methods=['GET'])
 @jwt_required(optional=True)
 def get_catalog_by_id_api(catalog_id: int) -> tuple[jsonify, int]:
-    """API endpoint to retrieve a single catalog by ID. Publicly viewable, but shows ownership if logged in."""
+    """
+    API endpoint to retrieve a single catalog by ID. Publicly viewable, but shows ownership if logged in.
+    Responses carry a strong ETag derived from the row version; a matching If-None-Match yields 304
+    Not Modified, and the same ETag sent as If-Match makes PUT/PATCH/DELETE fail on concurrent changes.
+    """
     try:
         catalog_data = catalog_service.get_catalog_by_id(catalog_id)
         serialized_catalog = serialize_catalog_for_json(catalog_data)
-        return jsonify({"message": "Catalog retrieved successfully.", "data": serialized_catalog}), 200
+        response = jsonify({"message": "Catalog retrieved successfully.", "data": serialized_catalog})
+        # Strong validator: clients and proxies revalidate with If-None-Match and get a bodiless 304
+        response.set_etag(catalog_etag(catalog_data['version']))
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
     except DataNotFoundError as e:
         return handle_data_not_found_error(e)
     except DatabaseConnectionError as e:
@@ -202,71 +259,158 @@ def get_catalog_by_id_api(catalog_id: int) -> tuple[jsonify, int]:
 def get_all_catalogs_api() -> tuple[jsonify, int]:
     """
     API endpoint to retrieve all catalog entries with optional search term, status filter,
-    and pagination parameters.
+    and pagination parameters. Clients can page either with page/per_page or by passing back
+    the opaque next_cursor/prev_cursor from a previous response. count=capped stops counting
+    past the configured cap and sets total_capped; count=none skips the total.
+    order=relevance ranks search results by full-text score (page numbers only, no cursors).
+    fields=catalog_name,status,... returns only those columns (plus catalog_id) and selects only them.
     """
     search_term = request.args.get('search', '').strip()
     status_filter = request.args.get('status', '').strip().lower()
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int) # Default to 10 items per page
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 100) # Default to 10 items per page
+    cursor = request.args.get('cursor', '').strip() or None # Opaque keyset cursor from a previous response
+    count_mode = request.args.get('count', COUNT_EXACT).strip().lower() # exact | capped | none
+    order = request.args.get('order', '').strip().lower() # 'relevance' ranks search matches by score
 
     # Define allowed statuses for filtering
     allowed_filter_statuses = ['active', 'inactive']
+    allowed_count_modes = [COUNT_EXACT, COUNT_CAPPED, COUNT_NONE]
 
     try:
-        # Get total count of catalogs matching search/filter criteria (before pagination)
-        total_catalogs = catalog_service.count_catalogs(
-            search_term=search_term,
-            status_filter=status_filter if status_filter in allowed_filter_statuses else None
-        )
-
-        # Fetch paginated data
-        catalogs_data = catalog_service.get_all_catalog(
+        fields = parse_fields(request.args.get('fields'))
+        # Fetch the requested page and its total match count in one round trip;
+        # a cursor carries its own search/status filters
+        catalog_page = catalog_service.get_catalogs_page(
             search_term=search_term,
             status_filter=status_filter if status_filter in allowed_filter_statuses else None,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor,
+            count_mode=count_mode if count_mode in allowed_count_modes else COUNT_EXACT,
+            order_by_relevance=order == 'relevance',
+            fields=fields
         )
-        serialized_catalogs = [serialize_catalog_for_json(c) for c in catalogs_data]
 
-        return jsonify({
-            "message": "Catalogs retrieved successfully.",
-            "data": serialized_catalogs,
-            "total_catalogs": total_catalogs,
-            "page": page,
-            "per_page": per_page
-        }), 200
+        # Rows go from tuples straight to JSON text; no dict per row
+        with metrics.timed('json'):
+            body = json_with_data({
+                "message": "Catalogs retrieved successfully.",
+                "total_catalogs": catalog_page['total_catalogs'],
+                "total_capped": catalog_page['total_capped'],
+                "page": page,
+                "per_page": per_page,
+                "next_cursor": catalog_page['next_cursor'],
+                "prev_cursor": catalog_page['prev_cursor']
+            }, rows_to_json(catalog_page['columns'], catalog_page['catalogs']))
+        return Response(body, mimetype='application/json'), 200
+
+    except ValidationError as e:
+        return handle_validation_error(e)
+    except DatabaseConnectionError as e:
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
+
+@app.route('/api/catalogs/suggest', methods=['GET'])
+@jwt_required(optional=True)
+def suggest_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint for typeahead: catalogs whose name starts with q (case-insensitive), as
+    {catalog_id, catalog_name} in name order, at most limit of them. Answered from an in-memory
+    prefix index kept current by this process's writes; the database is not queried.
+    """
+    prefix = request.args.get('q', '').strip()
+    limit = request.args.get('limit', type=int)
+    try:
+        suggestions = catalog_service.suggest_catalogs(prefix, limit) if prefix else []
+        return jsonify({"message": "Suggestions retrieved successfully.", "data": suggestions}), 200
+    except DatabaseConnectionError as e:
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
+
+@app.route('/api/catalogs/export', methods=['GET'])
+@jwt_required(optional=True)
+def export_catalogs_api() -> Response:
+    """
+    API endpoint to download every catalog matching the search/status filters as CSV or NDJSON
+    (?format=csv|ndjson). The body is streamed in batches; ?gzip=true compresses it on the fly.
+    """
+    export_format = request.args.get('format', 'csv').strip().lower()
+    search_term = request.args.get('search', '').strip()
+    status_filter = request.args.get('status', '').strip().lower()
+    use_gzip = request.args.get('gzip', '').strip().lower() in ('1', 'true', 'yes')
+
+    if export_format not in EXPORT_FORMATS:
+        return handle_validation_error(ValidationError(f"Format must be one of: {', '.join(EXPORT_FORMATS)}."))
 
+    batches = catalog_service.iter_catalog_batches(
+        search_term=search_term,
+        status_filter=status_filter if status_filter in ['active', 'inactive'] else None,
+        batch_size=EXPORT_BATCH_SIZE
+    )
+    try:
+        # Read the first batch up front so database errors still produce a proper error response
+        first_batch = next(batches, [])
     except DatabaseConnectionError as e:
         return handle_database_error(e)
     except Exception as e:
         return handle_general_exception(e)
 
+    mimetype, encode = EXPORT_FORMATS[export_format]
+    body = encode(EXPORT_COLUMNS, itertools.chain([first_batch], batches))
+    filename = f"catalogs.{export_format}"
+    if use_gzip:
+        body, mimetype, filename = gzip_chunks(body), 'application/gzip', f"{filename}.gz"
+
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @app.route('/api/catalogs/<int:catalog_id>', methods=['PUT'])
 @jwt_required()
 def update_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
-    """API endpoint to update an existing catalog entry by its ID, protected by JWT."""
+    """
+    API endpoint to update an existing catalog entry by its ID, protected by JWT.
+    With If-Match the update only applies if the catalog is still at that version (412 otherwise).
+    """
     data = request.get_json()
     if not data:
         raise ValidationError("Request must contain JSON data.")
 
     try:
-        name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
-        description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
-        start_date = validate_future_date(data.get('start_date'), "Start Date")
-        end_date = validate_future_date(data.get('end_date'), "End Date")
-        status = validate_status(data.get('status'))
-
-        if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
-            raise ValidationError("End Date cannot be before Start Date.")
+        expected_version = parse_if_match(request.headers.get('If-Match'))
+        updated_catalog = validate_catalog_payload(data)
+        version = catalog_service.update_catalog_by_id(catalog_id, updated_catalog, expected_version)
+        return versioned_write_response(f'Catalog ID {catalog_id} updated successfully.', catalog_id, version)
+    except (ValidationError, DataNotFoundError, PreconditionFailedError, DatabaseConnectionError) as e:
+        if isinstance(e, ValidationError): return handle_validation_error(e)
+        if isinstance(e, DataNotFoundError): return handle_data_not_found_error(e)
+        if isinstance(e, PreconditionFailedError): return handle_precondition_failed_error(e)
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
 
-        updated_catalog = Catalog(name=name, description=description,
-                                  start_date=start_date, end_date=end_date, status=status)
+@app.route('/api/catalogs/<int:catalog_id>', methods=['PATCH'])
+@jwt_required()
+def patch_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
+    """
+    API endpoint to change some fields of a catalog, protected by JWT. Only the fields present in the
+    JSON body (name, description, start_date, end_date, status) are validated and written.
+    With If-Match the change only applies if the catalog is still at that version (412 otherwise).
+    """
+    data = request.get_json(silent=True)
 
-        catalog_service.update_catalog_by_id(catalog_id, updated_catalog)
-        return jsonify({"message": f'Catalog ID {catalog_id} updated successfully.'}), 200
-    except (ValidationError, DataNotFoundError, DatabaseConnectionError) as e:
+    try:
+        expected_version = parse_if_match(request.headers.get('If-Match'))
+        changes = validate_catalog_patch(data)
+        version = catalog_service.patch_catalog_by_id(catalog_id, changes, expected_version)
+        return versioned_write_response(f'Catalog ID {catalog_id} updated successfully.', catalog_id, version)
+    except (ValidationError, DataNotFoundError, PreconditionFailedError, DatabaseConnectionError) as e:
         if isinstance(e, ValidationError): return handle_validation_error(e)
         if isinstance(e, DataNotFoundError): return handle_data_not_found_error(e)
+        if isinstance(e, PreconditionFailedError): return handle_precondition_failed_error(e)
         return handle_database_error(e)
     except Exception as e:
         return handle_general_exception(e)
@@ -274,20 +418,337 @@ def update_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
 @app.route('/api/catalogs/<int:catalog_id>', methods=['DELETE'])
 @jwt_required()
 def delete_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
-    """API endpoint to delete a catalog entry by its ID, protected by JWT."""
+    """
+    API endpoint to delete a catalog entry by its ID, protected by JWT.
+    With If-Match the catalog is only deleted if it is still at that version (412 otherwise).
+    """
     try:
-        catalog_service.delete_catalog_by_id(catalog_id)
+        catalog_service.delete_catalog_by_id(catalog_id, parse_if_match(request.headers.get('If-Match')))
         return jsonify({"message": f'Catalog ID {catalog_id} deleted successfully.'}), 200
-    except (DataNotFoundError, DatabaseConnectionError) as e:
+    except (ValidationError, DataNotFoundError, PreconditionFailedError, DatabaseConnectionError) as e:
+        if isinstance(e, ValidationError): return handle_validation_error(e)
         if isinstance(e, DataNotFoundError): return handle_data_not_found_error(e)
+        if isinstance(e, PreconditionFailedError): return handle_precondition_failed_error(e)
         return handle_database_error(e)
     except Exception as e:
         return handle_general_exception(e)
 
+# --- Bulk Catalog API Endpoints (Protected by Authentication only) ---
+BULK_MAX_ITEMS = config.getint('bulk', 'max_items', fallback=10000)
+
+def parse_bulk_request(key: str) -> tuple[list, bool]:
+    """
+    Extracts the item list under `key` and the mode ('atomic' or 'best_effort') from a bulk request.
+    Returns (items, atomic). Raises ValidationError for malformed or oversized batches.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get(key), list) or not data[key]:
+        raise ValidationError(f"Request must contain a non-empty '{key}' list.")
+    if len(data[key]) > BULK_MAX_ITEMS:
+        raise ValidationError(f"A bulk request may contain at most {BULK_MAX_ITEMS} items.")
+    mode = data.get('mode', 'atomic')
+    if mode not in ('atomic', 'best_effort'):
+        raise ValidationError("Mode must be 'atomic' or 'best_effort'.")
+    return data[key], mode == 'atomic'
+
+def parse_catalog_id(value) -> int:
+    """Validates a catalog ID taken from a bulk payload."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValidationError("catalog_id must be a positive integer.")
+    return value
+
+def bulk_response(results: list, success_status: str, http_status: int = 200) -> tuple[jsonify, int]:
+    """Builds the common bulk response: one result per item plus success/failure totals."""
+    succeeded = sum(1 for result in results if result['status'] == success_status)
+    return jsonify({
+        "message": f"Bulk operation finished: {succeeded} of {len(results)} items succeeded.",
+        "data": {"results": results, "succeeded": succeeded, "failed": len(results) - succeeded}
+    }), http_status
+
+def item_validation_error(index: int, errors: list) -> dict:
+    """Bulk result for an item that failed validation: every field error plus a one-line summary."""
+    return {"index": index, "status": "error", "error": ' '.join(error['message'] for error in errors), "errors": errors}
+
+def bulk_validation_failed(results: list) -> tuple[jsonify, int]:
+    """Rejects an atomic batch that has invalid items; valid items are reported as skipped."""
+    results = [result or {"index": index, "status": "skipped"} for index, result in enumerate(results)]
+    failed = sum(1 for result in results if result['status'] == 'error')
+    return jsonify({
+        "message": "Validation Error",
+        "details": f"{failed} item(s) failed validation; nothing was written.",
+        "data": {"results": results, "succeeded": 0, "failed": failed}
+    }), 400
+
+@app.route('/api/catalogs/bulk', methods=['POST'])
+@jwt_required()
+def bulk_add_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint to create many catalogs in one request: {"items": [...], "mode": "atomic" | "best_effort"}.
+    The whole batch is validated first; rows are then written with multi-row INSERTs in chunked transactions.
+    """
+    current_user_id = get_jwt_identity()
+    try:
+        items, atomic = parse_bulk_request('items')
+        results = [None] * len(items)
+        with metrics.timed('validate'):
+            valid, invalid = catalog_schema.validate_many(items)
+        for index, errors in invalid:
+            results[index] = item_validation_error(index, errors)
+
+        if atomic and len(valid) < len(items):
+            return bulk_validation_failed(results)
+
+        created = catalog_service.bulk_create_catalogs([catalog for _, catalog in valid], current_user_id, atomic=atomic)
+        for (index, _), result in zip(valid, created):
+            results[index] = {"index": index, **result}
+        return bulk_response(results, 'created', 201 if atomic else 200)
+    except ValidationError as e:
+        return handle_validation_error(e)
+    except DatabaseConnectionError as e:
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
+
+@app.route('/api/catalogs/bulk', methods=['PUT'])
+@jwt_required()
+def bulk_update_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint to update many catalogs in one request: {"items": [{"catalog_id": ..., ...}], "mode": ...}.
+    In atomic mode a single invalid item or unknown ID rejects the whole batch.
+    """
+    try:
+        items, atomic = parse_bulk_request('items')
+        results = [None] * len(items)
+        with metrics.timed('validate'):
+            checked, invalid = catalog_schema.validate_many(items)
+        item_errors = dict(invalid)
+        catalog_ids = {}
+        for index, item in enumerate(items):
+            try:
+                catalog_ids[index] = parse_catalog_id(item.get('catalog_id') if isinstance(item, dict) else None)
+            except ValidationError as e:
+                item_errors.setdefault(index, []).insert(0, {"field": "catalog_id", "message": str(e)})
+        for index, errors in sorted(item_errors.items()):
+            results[index] = item_validation_error(index, errors)
+        valid = [(index, catalog_ids[index], catalog) for index, catalog in checked if index not in item_errors]
+
+        if atomic and len(valid) < len(items):
+            return bulk_validation_failed(results)
+
+        updated = catalog_service.bulk_update_catalogs([(catalog_id, catalog) for _, catalog_id, catalog in valid], atomic=atomic)
+        for (index, _, _), result in zip(valid, updated):
+            results[index] = {"index": index, **result}
+        return bulk_response(results, 'updated')
+    except (ValidationError, DataNotFoundError, DatabaseConnectionError) as e:
+        if isinstance(e, ValidationError): return handle_validation_error(e)
+        if isinstance(e, DataNotFoundError): return handle_data_not_found_error(e)
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
+
+@app.route('/api/catalogs/bulk', methods=['DELETE'])
+@jwt_required()
+def bulk_delete_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint to delete many catalogs in one request: {"ids": [1, 2, ...], "mode": "atomic" | "best_effort"}.
+    In atomic mode a single unknown ID rejects the whole batch.
+    """
+    try:
+        ids, atomic = parse_bulk_request('ids')
+        catalog_ids = [parse_catalog_id(catalog_id) for catalog_id in ids]
+        deleted = catalog_service.bulk_delete_catalogs(catalog_ids, atomic=atomic)
+        results = [{"index": index, **result} for index, result in enumerate(deleted)]
+        return bulk_response(results, 'deleted')
+    except (ValidationError, DataNotFoundError, DatabaseConnectionError) as e:
+        if isinstance(e, ValidationError): return handle_validation_error(e)
+        if isinstance(e, DataNotFoundError): return handle_data_not_found_error(e)
+        return handle_database_error(e)
+    except Exception as e:
+        return handle_general_exception(e)
+
+@app.route('/api/catalogs/import', methods=['POST'])
+@jwt_required()
+def import_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint to import catalogs from a CSV or NDJSON upload (?format=ndjson|csv), sent either as the
+    multipart field 'file' or as the raw request body. The upload is read as a stream and committed in batches;
+    rejected lines are reported with their line numbers. If the import stops early, resend the file with
+    ?resume_after_line=<last_committed_line> to continue after the last committed batch.
+    """
+    current_user_id = get_jwt_identity()
+    import_format = request.args.get('format', 'ndjson').strip().lower()
+    errors = []
+    progress = {}
+
+    def collect_error(line_number: int, message: str) -> None:
+        if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+            errors.append({"line": line_number, "error": message})
+
+    try:
+        resume_after_line = request.args.get('resume_after_line', 0, type=int)
+        if resume_after_line < 0:
+            raise ValidationError("resume_after_line must not be negative.")
+        upload = request.files.get('file')
+        stream = upload.stream if upload else request.stream
+        lines = io.TextIOWrapper(stream, encoding='utf-8', errors='replace', newline='' if import_format == 'csv' else None)
+        progress = catalog_import_service.import_stream(
+            lines, import_format, current_user_id, start_after_line=resume_after_line,
+            on_error=collect_error, on_progress=progress.update
+        )
+        return jsonify({
+            "message": f"Import finished: {progress['rows_imported']} rows imported, {progress['rows_failed']} rejected.",
+            "data": {**progress, "errors": errors, "errors_truncated": progress['rows_failed'] > len(errors)}
+        }), 200
+    except ValidationError as e:
+        return handle_validation_error(e)
+    except DatabaseConnectionError as e:
+        logger.critical("Import aborted after line %s: %s", progress.get('last_committed_line', 0), e, exc_info=True)
+        return jsonify({
+            "message": "Database Error",
+            "details": "The import stopped; resume it with resume_after_line set to last_committed_line.",
+            "data": {"last_committed_line": progress.get('last_committed_line', 0), "errors": errors}
+        }), 500
+    except Exception as e:
+        return handle_general_exception(e)
+
+# --- Operational Endpoints ---
+@app.route('/api/stats', methods=['GET'])
+@jwt_required()
+def get_stats_api() -> tuple[jsonify, int]:
+    """API endpoint exposing runtime statistics such as connection pool and cache usage."""
+    stats = {
+        "pool": get_pool_stats(),
+        "catalog_cache": catalog_service.cache_stats(),
+        "query_cache": catalog_service.query_cache_stats(),
+        "suggest_index": catalog_service.suggest_index_stats(),
+        "password_hashing": authentication_service.hash_pool_stats(),
+        "password_verification_cache": authentication_service.verification_cache_stats(),
+        "user_cache": user_service.user_cache_stats(),
+    }
+    return jsonify({"message": "Statistics retrieved successfully.", "data": stats}), 200
+
+SLOW_QUERY_SORT_KEYS = ('total', 'p95', 'max', 'count', 'slow')
+
+@app.route('/api/stats/slow-queries', methods=['GET'])
+@jwt_required()
+def get_slow_queries_api() -> tuple[jsonify, int]:
+    """
+    API endpoint listing the most expensive query fingerprints seen by this process
+    (?limit=20&sort=total|p95|max|count|slow), with the EXPLAIN plan captured for slow ones.
+    """
+    if executor.slow_queries is None:
+        return jsonify({"message": "Slow-query recording is disabled.", "data": []}), 200
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 500)
+    sort_by = request.args.get('sort', 'total').strip().lower()
+    if sort_by not in SLOW_QUERY_SORT_KEYS:
+        return handle_validation_error(ValidationError(f"Sort must be one of: {', '.join(SLOW_QUERY_SORT_KEYS)}."))
+    return jsonify({"message": "Slow-query report retrieved successfully.",
+                    "data": executor.slow_queries.report(limit=limit, sort_by=sort_by)}), 200
+
+@app.route('/metrics', methods=['GET'])
+def metrics_api() -> Response:
+    """Exposes request counters, latency histograms, connection pool and hash queue gauges in Prometheus text format."""
+    if not METRICS_ENABLED:
+        return page_not_found(None)
+    pool = get_pool_stats()
+    process_metrics = {
+        "catalog_db_pool_size": ("gauge", "Open pooled connections.", pool["size"]),
+        "catalog_db_pool_in_use": ("gauge", "Pooled connections currently checked out.", pool["in_use"]),
+        "catalog_db_pool_waits_total": ("counter", "Checkouts that had to wait for a free connection.", pool["waits"]),
+        "catalog_db_pool_timeouts_total": ("counter", "Checkouts that timed out.", pool["timeouts"]),
+    }
+    hashing = authentication_service.hash_pool_stats()
+    process_metrics.update({
+        "catalog_auth_hash_running": ("gauge", "Password hash checks currently running.", hashing["running"]),
+        "catalog_auth_hash_queued": ("gauge", "Password hash checks waiting for a worker.", hashing["queued"]),
+        "catalog_auth_hash_rejected_total": ("counter", "Logins rejected because the hash queue was full.", hashing["rejected"]),
+        "catalog_auth_hash_timeouts_total": ("counter", "Password hash checks that timed out.", hashing["timeouts"]),
+    })
+    return Response(metrics.registry.render(process_metrics), mimetype='text/plain; version=0.0.4')
+
+# --- CLI Commands ---
+@app.cli.command('import-catalogs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--user-id', type=int, required=True, help='Owner of the imported catalogs.')
+@click.option('--format', 'import_format', type=click.Choice(IMPORT_FORMATS),
+              help='Input format; defaults to csv for *.csv files and ndjson otherwise.')
+@click.option('--batch-size', type=click.IntRange(min=1), help='Rows committed per transaction.')
+@click.option('--resume', is_flag=True, help='Continue after the line recorded in the checkpoint file.')
+def import_catalogs_command(path: str, user_id: int, import_format: str, batch_size: int, resume: bool) -> None:
+    """
+    Imports catalogs from a CSV or NDJSON file. Rejected lines are written to PATH.errors.ndjson and the last
+    committed line to PATH.checkpoint after every batch, so an interrupted run can be continued with --resume.
+    """
+    import_format = import_format or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+    checkpoint_path, errors_path = f"{path}.checkpoint", f"{path}.errors.ndjson"
+    start_after_line = 0
+    if resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as checkpoint_file:
+            start_after_line = json.load(checkpoint_file)['last_committed_line']
+        click.echo(f"Resuming after line {start_after_line}.")
+
+    def save_checkpoint(progress: dict) -> None:
+        with open(f"{checkpoint_path}.tmp", 'w') as checkpoint_file:
+            json.dump(progress, checkpoint_file)
+        os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+        click.echo(f"Line {progress['last_committed_line']}: {progress['rows_imported']} imported, "
+                   f"{progress['rows_failed']} rejected ({progress['rows_per_second']} rows/s)")
+
+    importer = CatalogImportService(catalog_service, batch_size) if batch_size else catalog_import_service
+    with open(path, encoding='utf-8', errors='replace', newline='' if import_format == 'csv' else None) as lines, \
+            open(errors_path, 'a' if start_after_line else 'w', encoding='utf-8') as errors_file:
+        def write_error(line_number: int, message: str) -> None:
+            errors_file.write(json.dumps({"line": line_number, "error": message}) + '\n')
+
+        try:
+            progress = importer.import_stream(lines, import_format, user_id, start_after_line=start_after_line,
+                                              on_error=write_error, on_progress=save_checkpoint)
+        except DatabaseConnectionError as e:
+            # The checkpoint still names the last committed batch; exit non-zero so scripts notice
+            raise click.ClickException(f"Import stopped by a database error ({e}). Run again with --resume to continue.")
+
+    os.remove(checkpoint_path)
+    click.echo(f"Import finished in {progress['elapsed_seconds']}s: {progress['rows_imported']} imported, "
+               f"{progress['rows_failed']} rejected (see {errors_path}).")
+
+@app.cli.command('build-assets')
+def build_assets_command() -> None:
+    """
+    Copies the files in static/ to static/dist under content-hashed names, with precompressed
+    variants, so templates can reference them through asset_url() with immutable caching.
+    Run it on every deploy that changes static files.
+    """
+    manifest = assets.build_assets(app.static_folder)
+    static_assets.load_manifest()
+    click.echo(f"Built {len(manifest)} assets into {os.path.join(app.static_folder, assets.DIST_DIR)}.")
+
+@app.cli.command('slow-queries')
+@click.option('--log', 'log_path', type=click.Path(exists=True, dir_okay=False),
+              help='Log file to read; defaults to the [logging] file in config.ini.')
+@click.option('--limit', type=click.IntRange(min=1), default=20, show_default=True)
+@click.option('--sort', 'sort_by', type=click.Choice(SLOW_QUERY_SORT_KEYS), default='total', show_default=True)
+def slow_queries_command(log_path: str, limit: int, sort_by: str) -> None:
+    """
+    Summarizes the slow queries recorded in the application log by fingerprint, across all worker
+    processes. GET /api/stats/slow-queries additionally covers fast executions and EXPLAIN plans.
+    """
+    log_path = log_path or resolve_log_path(config)
+    if not log_path or not os.path.exists(log_path):
+        raise click.ClickException("No log file to read; pass --log.")
+    with open(log_path, encoding='utf-8', errors='replace') as log_file:
+        rows = summarize_slow_log(log_file, limit=limit, sort_by=sort_by)
+    if not rows:
+        click.echo("No slow queries recorded.")
+        return
+    click.echo(f"{'count':>7} {'total ms':>11} {'avg ms':>9} {'p95 ms':>9} {'max ms':>9}  fingerprint")
+    for row in rows:
+        click.echo(f"{row['count']:>7} {row['total_ms']:>11.1f} {row['avg_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+                   f"{row['max_ms']:>9.1f}  {row['fingerprint']}")
+
 if __name__ == '__main__':
     config_path_check = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config', 'config.ini')
     if not os.path.exists(config_path_check):
-        logger.critical(f"FATAL ERROR: Database configuration file not found at '{config_path_check}'.")
+        logger.critical("FATAL ERROR: Database configuration file not found at '%s'.", config_path_check)
         logger.critical("Please ensure 'config.ini' exists in the 'config' directory and is properly configured.")
         sys.exit(1)
 
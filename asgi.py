@@ -0,0 +1,347 @@
+"""
+ASGI entry point serving the /api/catalogs routes on asyncio.
+
+Every request runs as a coroutine on one event loop per worker process, and database calls go through
+mysql.connector.aio, so requests waiting on MySQL (or on slow clients) hold no OS thread. Routes, payloads,
+status codes, JWT cookie/CSRF checks and ETags match the Flask app; login, the HTML pages and the other
+/api endpoints stay on the WSGI app (app.py), e.g. behind a reverse proxy routing /api/catalogs here.
+
+Run with any ASGI server, for example:
+    uvicorn asgi:app --workers 4
+"""
+import hmac
+import json
+import re
+from http.cookies import CookieError, SimpleCookie
+from urllib.parse import parse_qs
+import jwt as pyjwt
+from dto.user import User
+from exception.catalog_exception import (ValidationError, DataNotFoundError, DatabaseConnectionError,
+                                         AuthenticationError, ServiceUnavailableError, PreconditionFailedError)
+from service.async_catalog_service import AsyncCatalogService
+from service.async_user_service import AsyncUserService
+from service.catalog_service import COUNT_EXACT, COUNT_CAPPED, COUNT_NONE, parse_fields
+from utils import compression, metrics
+from utils.async_db_pool import get_async_pool
+from utils.config import DEFAULT_JWT_SECRET_KEY, get_config
+from utils.logger import logger
+from utils.serialization import serialize_catalog_for_json, catalog_etag, parse_if_match, rows_to_json, json_with_data
+from utils.validation import validate_catalog_payload, validate_catalog_patch
+
+config = get_config()
+JWT_SECRET_KEY = config.get('jwt', 'secret_key', fallback=DEFAULT_JWT_SECRET_KEY)
+# Largest request body accepted, in bytes (larger ones get 413)
+MAX_BODY_BYTES = config.getint('asgi', 'max_body_bytes', fallback=1024 * 1024)
+METRICS_ENABLED = config.getboolean('metrics', 'enabled', fallback=True)
+# Same [compression] settings as the Flask app
+compressor = compression.build_compressor(config)
+
+# Same cookie/header names and CSRF-protected methods as Flask-JWT-Extended's defaults used by app.py
+ACCESS_COOKIE_NAME = 'access_token_cookie'
+CSRF_HEADER_NAME = 'x-csrf-token'
+CSRF_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+catalog_service = AsyncCatalogService()
+user_service = AsyncUserService()
+
+# Exception type -> (HTTP status, message), mirroring the Flask error handlers
+ERROR_RESPONSES = {
+    ValidationError: (400, "Validation Error"),
+    AuthenticationError: (401, "Authentication Failed"),
+    DataNotFoundError: (404, "Not Found"),
+    PreconditionFailedError: (412, "Precondition Failed"),
+    ServiceUnavailableError: (503, "Service Unavailable"),
+}
+
+
+class HTTPError(Exception):
+    """Ends a request early with a status code and JSON body (authentication and protocol errors)."""
+
+    def __init__(self, status: int, body: dict):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+class AsyncRequest:
+    """The parts of an ASGI HTTP request the catalog routes need."""
+
+    __slots__ = ('method', 'path', 'args', 'headers', 'body', 'endpoint')
+
+    def __init__(self, scope: dict, body: bytes):
+        self.method = scope['method']
+        self.path = scope['path']
+        self.args = {key: values[0] for key, values in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()}
+        self.headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        self.body = body
+        # Name of the matched view, used as the metrics endpoint label (same names as the Flask views)
+        self.endpoint = 'unmatched'
+
+    def arg(self, name: str, default=None, type=str):
+        """Returns a query string argument converted with type, or default when missing or invalid."""
+        try:
+            return type(self.args[name])
+        except (KeyError, ValueError):
+            return default
+
+    def get_json(self):
+        """Returns the parsed JSON body, or None when it is empty or malformed."""
+        try:
+            return json.loads(self.body) if self.body else None
+        except ValueError:
+            return None
+
+    def cookie(self, name: str) -> str | None:
+        try:
+            morsel = SimpleCookie(self.headers.get('cookie', '')).get(name)
+        except CookieError:
+            return None
+        return morsel.value if morsel else None
+
+
+async def authenticate(request: AsyncRequest, optional: bool = False) -> User | None:
+    """
+    Verifies the JWT access cookie (and the CSRF double-submit header on writes) like @jwt_required(),
+    then resolves the identity like app.load_current_user. With optional=True a missing cookie is allowed.
+    """
+    token = request.cookie(ACCESS_COOKIE_NAME)
+    if not token:
+        if optional:
+            return None
+        raise HTTPError(401, {"msg": f'Missing cookie "{ACCESS_COOKIE_NAME}"'})
+    try:
+        claims = pyjwt.decode(token, JWT_SECRET_KEY, algorithms=['HS256'])
+    except pyjwt.ExpiredSignatureError:
+        raise HTTPError(401, {"msg": "Token has expired"})
+    except pyjwt.InvalidTokenError as e:
+        raise HTTPError(422, {"msg": str(e)})
+    if claims.get('type') != 'access':
+        raise HTTPError(422, {"msg": "Only non-refresh tokens are allowed"})
+
+    if request.method in CSRF_METHODS:
+        csrf_token = request.headers.get(CSRF_HEADER_NAME)
+        if not csrf_token:
+            raise HTTPError(401, {"msg": "Missing CSRF token"})
+        # Constant-time comparison, as Flask-JWT-Extended does; bytes so non-ASCII header values cannot raise
+        if not hmac.compare_digest(csrf_token.encode('utf-8'), str(claims.get('csrf') or '').encode('utf-8')):
+            raise HTTPError(401, {"msg": "CSRF double submit tokens do not match"})
+
+    if 'username' in claims and 'email' in claims:
+        return User.from_claims(claims)
+    user = await user_service.get_user_by_id_cached(int(claims['sub']))
+    if user is None:
+        raise HTTPError(401, {"msg": f"Error loading the user {claims['sub']}"})
+    return user
+
+
+# --- Catalog routes (same behaviour as the Flask views of the same name) ---
+async def add_catalog_api(request: AsyncRequest) -> tuple:
+    user = await authenticate(request)
+    data = request.get_json()
+    if not data:
+        raise ValidationError("Request must contain JSON data.")
+    catalog_id = await catalog_service.create_catalog(validate_catalog_payload(data), user.user_id)
+    return 201, {"message": "Catalog created successfully.", "data": {"catalog_id": catalog_id}}, {}
+
+
+async def get_all_catalogs_api(request: AsyncRequest) -> tuple:
+    await authenticate(request, optional=True)
+    status_filter = request.arg('status', '').strip().lower()
+    count_mode = request.arg('count', COUNT_EXACT).strip().lower()
+    page = max(request.arg('page', 1, type=int), 1)
+    per_page = min(max(request.arg('per_page', 10, type=int), 1), 100)
+
+    fields = parse_fields(request.arg('fields'))
+    catalog_page = await catalog_service.get_catalogs_page(
+        search_term=request.arg('search', '').strip(),
+        status_filter=status_filter if status_filter in ['active', 'inactive'] else None,
+        page=page,
+        per_page=per_page,
+        cursor=request.arg('cursor', '').strip() or None,
+        count_mode=count_mode if count_mode in [COUNT_EXACT, COUNT_CAPPED, COUNT_NONE] else COUNT_EXACT,
+        order_by_relevance=request.arg('order', '').strip().lower() == 'relevance',
+        fields=fields
+    )
+    with metrics.timed('json'):
+        return 200, json_with_data({
+            "message": "Catalogs retrieved successfully.",
+            "total_catalogs": catalog_page['total_catalogs'],
+            "total_capped": catalog_page['total_capped'],
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": catalog_page['next_cursor'],
+            "prev_cursor": catalog_page['prev_cursor']
+        }, rows_to_json(catalog_page['columns'], catalog_page['catalogs'])), {}
+
+
+async def suggest_catalogs_api(request: AsyncRequest) -> tuple:
+    await authenticate(request, optional=True)
+    prefix = request.arg('q', '').strip()
+    suggestions = await catalog_service.suggest_catalogs(prefix, request.arg('limit', type=int)) if prefix else []
+    return 200, {"message": "Suggestions retrieved successfully.", "data": suggestions}, {}
+
+
+async def get_catalog_by_id_api(request: AsyncRequest, catalog_id: int) -> tuple:
+    await authenticate(request, optional=True)
+    catalog_data = await catalog_service.get_catalog_by_id(catalog_id)
+    etag = f'"{catalog_etag(catalog_data["version"])}"'
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if_none_match = request.headers.get('if-none-match', '')
+    if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+        return 304, None, headers
+    return 200, {"message": "Catalog retrieved successfully.", "data": serialize_catalog_for_json(catalog_data)}, headers
+
+
+def versioned_write_response(message: str, catalog_id: int, version: int) -> tuple:
+    return 200, {"message": message, "data": {"catalog_id": catalog_id, "version": version}}, \
+        {'ETag': f'"{catalog_etag(version)}"'}
+
+
+async def update_catalog_api(request: AsyncRequest, catalog_id: int) -> tuple:
+    await authenticate(request)
+    data = request.get_json()
+    if not data:
+        raise ValidationError("Request must contain JSON data.")
+    expected_version = parse_if_match(request.headers.get('if-match'))
+    version = await catalog_service.update_catalog_by_id(catalog_id, validate_catalog_payload(data), expected_version)
+    return versioned_write_response(f'Catalog ID {catalog_id} updated successfully.', catalog_id, version)
+
+
+async def patch_catalog_api(request: AsyncRequest, catalog_id: int) -> tuple:
+    await authenticate(request)
+    expected_version = parse_if_match(request.headers.get('if-match'))
+    changes = validate_catalog_patch(request.get_json())
+    version = await catalog_service.patch_catalog_by_id(catalog_id, changes, expected_version)
+    return versioned_write_response(f'Catalog ID {catalog_id} updated successfully.', catalog_id, version)
+
+
+async def delete_catalog_api(request: AsyncRequest, catalog_id: int) -> tuple:
+    await authenticate(request)
+    await catalog_service.delete_catalog_by_id(catalog_id, parse_if_match(request.headers.get('if-match')))
+    return 200, {"message": f'Catalog ID {catalog_id} deleted successfully.'}, {}
+
+
+# Path pattern -> {method: view}; captured groups are passed to the view as ints
+ROUTES = (
+    (re.compile(r'/api/catalogs'), {'GET': get_all_catalogs_api, 'POST': add_catalog_api}),
+    (re.compile(r'/api/catalogs/suggest'), {'GET': suggest_catalogs_api}),
+    (re.compile(r'/api/catalogs/(\d+)'), {'GET': get_catalog_by_id_api, 'PUT': update_catalog_api,
+                                          'PATCH': patch_catalog_api, 'DELETE': delete_catalog_api}),
+)
+
+
+def resolve(method: str, path: str):
+    """Returns (view, args) for a request, raising HTTPError 404/405 like the Flask router."""
+    for pattern, views in ROUTES:
+        match = pattern.fullmatch(path)
+        if match:
+            if method not in views:
+                raise HTTPError(405, {"message": "Method Not Allowed"})
+            return views[method], [int(group) for group in match.groups()]
+    raise HTTPError(404, {"message": "Not Found"})
+
+
+async def dispatch(request: AsyncRequest) -> tuple:
+    """Runs the matching view and turns exceptions into the same JSON errors as the Flask app."""
+    try:
+        view, args = resolve(request.method, request.path)
+        request.endpoint = view.__name__
+        return await view(request, *args)
+    except HTTPError as e:
+        return e.status, e.body, {}
+    except DatabaseConnectionError as e:
+        logger.critical("Database Connection Error: %s", e, exc_info=True)
+        return 500, {"message": "Database Error",
+                     "details": "Could not connect to the database or a database operation failed."}, {}
+    except tuple(ERROR_RESPONSES) as e:
+        status, message = next(value for error_type, value in ERROR_RESPONSES.items() if isinstance(e, error_type))
+        body = {"message": message, "details": str(e)}
+        if getattr(e, 'errors', None):
+            body["errors"] = e.errors
+        return status, body, {'Retry-After': '1'} if status == 503 else {}
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e, exc_info=True)
+        return 500, {"message": "Internal Server Error", "details": "An unexpected error occurred. Please try again later."}, {}
+
+
+async def read_body(receive) -> bytes:
+    """Reads the whole request body, raising HTTPError 413 past MAX_BODY_BYTES."""
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, {"message": "Payload Too Large"})
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            break
+    return b''.join(chunks)
+
+
+async def lifespan(receive, send) -> None:
+    """
+    Opens the pool's minimum connections and builds the suggestion index at startup,
+    and closes idle connections at shutdown.
+    """
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                await get_async_pool().prefill()
+                await catalog_service.build_suggest_index()
+            except Exception as e:
+                # Serve anyway: connections are opened (and the index built) on demand once the database is reachable
+                logger.error("Could not pre-open async database connections or build the suggestion index: %s", e)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await get_async_pool().close_all()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope: dict, receive, send) -> None:
+    """The ASGI application callable."""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    timings = metrics.begin_request() if METRICS_ENABLED else None
+    try:
+        request = AsyncRequest(scope, await read_body(receive))
+    except HTTPError as e:
+        request, (status, body, headers) = None, (e.status, e.body, {})
+    else:
+        status, body, headers = await dispatch(request)
+
+    with metrics.timed('json'):
+        # Views may return the body already encoded as JSON text
+        payload = b'' if body is None else (body if isinstance(body, str) else json.dumps(body, default=str)).encode('utf-8')
+    headers = dict(headers)
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+        # Like ResponseCompressor: large enough bodies only, and never under a catalog version ETag
+        if compressor is not None and request is not None and 'ETag' not in headers:
+            headers['Vary'] = 'Accept-Encoding'
+            encoding = compression.negotiate(request.headers.get('accept-encoding'), compressor.codecs)
+            if encoding and len(payload) >= compressor.min_size:
+                payload = compression.compress(payload, encoding, compressor.level)
+                headers['Content-Encoding'] = encoding
+    headers['Content-Length'] = str(len(payload))
+    if timings is not None:
+        endpoint = request.endpoint if request is not None else 'unmatched'
+        headers['Server-Timing'] = metrics.end_request(timings, endpoint, scope['method'], status)
+
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()]})
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run('asgi:app', host=config.get('asgi', 'host', fallback='127.0.0.1'),
+                port=config.getint('asgi', 'port', fallback=8000))
@@ -0,0 +1,135 @@
+"""
+Compares the synchronous data path (thread per in-flight request, utils/query_executor.py) with the
+asyncio one used by asgi.py (coroutines on one thread, utils/async_query_executor.py).
+
+Each of --concurrency in-flight requests runs the catalog listing query of /api/catalogs
+(or, with --query-delay-ms, a SELECT SLEEP() standing in for a slow query) until --requests have completed.
+Both paths get a pool of --pool-size connections, so database throughput is bounded the same way;
+what differs is how many OS threads are needed to keep that many requests in flight.
+
+Needs the MySQL database configured in config/config.ini.
+Usage: python benchmarks/bench_async.py [--concurrency 1000] [--requests 20000] [--pool-size 20] [--query-delay-ms 0]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import get_config
+
+PAGE_QUERY = ("SELECT catalog_id, catalog_name, catalog_description, start_date, end_date, status "
+              "FROM catalog ORDER BY catalog_id DESC LIMIT %s")
+
+
+class ThreadSampler:
+    """Records the peak number of live OS threads while a run is in progress."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+
+
+def statement(query_delay_ms: float) -> tuple:
+    if query_delay_ms:
+        return "SELECT SLEEP(%s)", (query_delay_ms / 1000,)
+    return PAGE_QUERY, (10,)
+
+
+def report(label: str, latencies: list, elapsed: float, peak_threads: int, errors: int) -> None:
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000 if latencies else 0.0
+
+    print(f"{label:<8} {len(latencies) / elapsed:10.1f} req/s   p50 {percentile(0.5):8.2f} ms   "
+          f"p95 {percentile(0.95):8.2f} ms   peak OS threads {peak_threads:5d}   errors {errors}")
+
+
+def run_sync(concurrency: int, requests: int, query: str, params: tuple) -> None:
+    from utils.query_executor import executor
+    latencies, errors = [], []
+
+    def one_request(_) -> None:
+        start = time.perf_counter()
+        try:
+            executor.fetch_all(query, params, row_factory=tuple)
+            latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(e)
+
+    with ThreadSampler() as sampler:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one_request, range(requests)))
+        elapsed = time.perf_counter() - start
+    report("sync", latencies, elapsed, sampler.peak, len(errors))
+
+
+async def run_async(concurrency: int, requests: int, query: str, params: tuple) -> None:
+    from utils.async_db_pool import get_async_pool
+    from utils.async_query_executor import async_executor
+    latencies, errors = [], []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await async_executor.fetch_all(query, params, row_factory=tuple)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                errors.append(e)
+
+    with ThreadSampler() as sampler:
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    await get_async_pool().close_all()
+    report("async", latencies, elapsed, sampler.peak, len(errors))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=1000, help='requests in flight at any time')
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--pool-size', type=int, default=20, help='database connections available to each path')
+    parser.add_argument('--query-delay-ms', type=float, default=0, help='run SELECT SLEEP() of this length instead')
+    parser.add_argument('--timeout', type=float, default=60, help='seconds a request may wait for a connection')
+    args = parser.parse_args()
+
+    # Both pools are built lazily from the shared config, so size them before first use
+    config = get_config()
+    for section in ('mysql_pool', 'mysql_async_pool'):
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, 'min_size', str(min(args.pool_size, config.getint(section, 'min_size', fallback=1))))
+        config.set(section, 'max_size', str(args.pool_size))
+        config.set(section, 'timeout', str(args.timeout))
+
+    query, params = statement(args.query_delay_ms)
+    print(f"{args.requests} requests, {args.concurrency} in flight, {args.pool_size} connections per path\n")
+    run_sync(args.concurrency, args.requests, query, params)
+    asyncio.run(run_async(args.concurrency, args.requests, query, params))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Measures the logging cost a single catalog request pays on the request thread.
+
+Compares the original setup (DEBUG level, synchronous FileHandler, eager f-strings that dump the
+SQL, params and result rows) with the pipeline in utils/logger.py (INFO level, lazy %-style
+arguments, QueueHandler with the file written by a background thread).
+
+Usage: python benchmarks/bench_logging.py [--requests 20000]
+"""
+import argparse
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logger import DeferredQueueHandler, JsonFormatter
+
+QUERY = """
+    SELECT catalog_id, catalog_name, catalog_description, start_date, end_date, status
+    FROM catalog WHERE catalog_id = %s
+"""
+PARAMS = (42,)
+RESULT = [{"catalog_id": 42, "catalog_name": "Summer", "catalog_description": "Seasonal catalog",
+           "start_date": "2030-06-01", "end_date": "2030-08-31", "status": "active"}]
+FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def legacy_request(log: logging.Logger) -> None:
+    """One request as originally logged: connect messages plus eager f-strings of SQL, params and rows."""
+    log.info(f"Fetching catalog with ID {PARAMS[0]}")
+    for _ in range(2):
+        log.info("Successfully connected to the MySQL database.")
+        log.debug(f"Executed query: {QUERY.strip()} | Params: {PARAMS} | Result: {RESULT}")
+
+
+def current_request(log: logging.Logger) -> None:
+    """The same request with lazy %-style records and no result dumps."""
+    log.info("Fetching catalog with ID %s", PARAMS[0])
+    for _ in range(2):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executed %s: %s | Params: %s | Result: %s", 'fetch', ' '.join(QUERY.split()), PARAMS, "1 rows")
+
+
+def make_logger(name: str, level: int, handler: logging.Handler) -> logging.Logger:
+    log = logging.getLogger(name)
+    log.handlers.clear()
+    log.setLevel(level)
+    log.propagate = False
+    log.addHandler(handler)
+    return log
+
+
+def run(label: str, request, log: logging.Logger, requests: int, flush=None) -> None:
+    start = time.perf_counter()
+    for _ in range(requests):
+        request(log)
+    on_thread = time.perf_counter() - start
+    if flush:
+        flush()
+    total = time.perf_counter() - start
+    print(f"{label:<44} {on_thread / requests * 1e6:9.2f} us/request   (incl. drain: {total / requests * 1e6:9.2f})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        def file_handler(name: str, formatter: logging.Formatter = None) -> logging.Handler:
+            handler = logging.FileHandler(os.path.join(directory, name), encoding='utf-8')
+            handler.setFormatter(formatter or logging.Formatter(FORMAT))
+            return handler
+
+        def queued(name: str, level: int, formatter: logging.Formatter = None):
+            queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+            listener = logging.handlers.QueueListener(queue_handler.queue, file_handler(name, formatter))
+            listener.start()
+            return make_logger(name, level, queue_handler), listener.stop
+
+        print(f"{args.requests} simulated requests, request-thread time per request\n")
+        run("legacy: DEBUG, sync file, eager f-strings", legacy_request,
+            make_logger('legacy', logging.DEBUG, file_handler('legacy.log')), args.requests)
+        run("current: INFO, sync file", current_request,
+            make_logger('sync', logging.INFO, file_handler('sync.log')), args.requests)
+
+        log, stop = queued('async', logging.INFO)
+        run("current: INFO, async queue", current_request, log, args.requests, stop)
+        log, stop = queued('async_json', logging.INFO, JsonFormatter())
+        run("current: INFO, async queue, JSON", current_request, log, args.requests, stop)
+        log, stop = queued('async_debug', logging.DEBUG)
+        run("current: DEBUG, async queue", current_request, log, args.requests, stop)
+
+        # Without a listener competing for the GIL this is the pure cost of enqueueing the records
+        run("current: INFO, enqueue only (no listener)", current_request,
+            make_logger('enqueue', logging.INFO, DeferredQueueHandler(queue.SimpleQueue())), args.requests)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures the CPU time and peak memory of turning one page of catalog rows into a JSON response body.
+
+Compares the original path (a dict per row from the cursor, a copy per row in
+serialize_catalog_for_json to stringify the dates, then Flask's JSON provider) with tuple rows
+written straight to JSON text by utils/serialization.rows_to_json. Also shows the effect of a
+sparse fieldset (fields=catalog_name,status).
+
+Usage: python benchmarks/bench_serialization.py [--rows 100] [--repeat 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from utils.serialization import serialize_catalog_for_json, rows_to_json, json_with_data
+
+COLUMNS = ('catalog_id', 'catalog_name', 'catalog_description', 'start_date', 'end_date', 'status', 'user_id', 'version')
+SPARSE_COLUMNS = ('catalog_id', 'catalog_name', 'status')
+ENVELOPE = {"message": "Catalogs retrieved successfully.", "total_catalogs": 100000, "total_capped": False,
+            "page": 1, "per_page": 100, "next_cursor": "eyJpZCI6MiwiZCI6Im5leHQifQ", "prev_cursor": None}
+
+
+def make_rows(count: int) -> list:
+    start = date(2030, 1, 1)
+    return [(100000 - i, f"Catalog {i}", f"Seasonal catalog number {i}", start + timedelta(days=i % 90),
+             start + timedelta(days=120 + i % 90), 'active' if i % 3 else 'inactive', 1 + i % 500, 1)
+            for i in range(count)]
+
+
+def legacy_body(provider: DefaultJSONProvider, columns: tuple, rows: list) -> str:
+    dict_rows = [dict(zip(columns, row)) for row in rows]
+    return provider.dumps({**ENVELOPE, "data": [serialize_catalog_for_json(row) for row in dict_rows]})
+
+
+def current_body(provider: DefaultJSONProvider, columns: tuple, rows: list) -> str:
+    return json_with_data(ENVELOPE, rows_to_json(columns, rows))
+
+
+def measure(label: str, build, provider, columns: tuple, rows: list, repeat: int, baseline: float = None) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = build(provider, columns, rows)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    build(provider, columns, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    speedup = f"   {baseline / elapsed:5.1f}x" if baseline else ""
+    print(f"{label:<34} {elapsed * 1e6:9.1f} us/page   peak {peak / 1024:8.1f} KiB   body {len(body):7} B{speedup}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    provider = DefaultJSONProvider(Flask(__name__))
+    rows = make_rows(args.rows)
+    sparse_rows = [(row[0], row[1], row[5]) for row in rows]
+
+    print(f"{args.rows} rows per page, {args.repeat} pages\n")
+    baseline = measure("legacy: dict rows + jsonify", legacy_body, provider, COLUMNS, rows, args.repeat)
+    measure("tuple rows -> JSON", current_body, provider, COLUMNS, rows, args.repeat, baseline)
+    measure("tuple rows -> JSON, sparse fields", current_body, provider, SPARSE_COLUMNS, sparse_rows, args.repeat, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures the typeahead suggestion index in utils/prefix_index.py over synthetic catalog names.
+
+Reports the time of the streaming build, the memory the index holds, and the per-call latency of
+prefix lookups, inserts, renames and deletes. For comparison it also times a linear scan of the same
+names (what LIKE 'q%' without an index costs, minus the database round trip).
+
+Usage: python benchmarks/bench_suggest.py [--catalogs 100000] [--lookups 20000] [--batch-size 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.prefix_index import PrefixIndex, normalize
+
+WORDS = ('Summer', 'Winter', 'Spring', 'Autumn', 'Holiday', 'Clearance', 'Outlet', 'Premium', 'Kids', 'Garden',
+         'Kitchen', 'Office', 'Sports', 'Travel', 'Books', 'Music', 'Fashion', 'Beauty', 'Toys', 'Pets')
+
+
+def make_batches(count: int, batch_size: int) -> list:
+    rng = random.Random(7)
+    rows = [(catalog_id, f"{rng.choice(WORDS)} {rng.choice(WORDS)} {catalog_id}")
+            for catalog_id in range(count, 0, -1)]
+    return [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+
+
+def make_prefixes(count: int) -> list:
+    rng = random.Random(11)
+    return [rng.choice(WORDS)[:rng.randint(1, 6)].lower() for _ in range(count)]
+
+
+def per_call(label: str, elapsed: float, calls: int) -> None:
+    print(f"{label:<30} {elapsed / calls * 1e6:9.2f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalogs', type=int, default=100000)
+    parser.add_argument('--lookups', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    batches = make_batches(args.catalogs, args.batch_size)
+    prefixes = make_prefixes(args.lookups)
+    index = PrefixIndex()
+
+    start = time.perf_counter()
+    index.build(iter(batches))
+    build = time.perf_counter() - start
+    stats = index.stats()
+    print(f"{stats['entries']} catalogs: built in {build * 1000:.1f} ms, "
+          f"{stats['memory_bytes'] / 1024 / 1024:.1f} MiB ({stats['memory_bytes'] / stats['entries']:.0f} B/catalog)\n")
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        index.search(prefix, 10)
+    per_call("index lookup, top 10", time.perf_counter() - start, len(prefixes))
+
+    names = [(normalize(name), catalog_id, name) for rows in batches for catalog_id, name in rows]
+    scans = prefixes[:max(len(prefixes) // 100, 1)]
+    start = time.perf_counter()
+    for prefix in scans:
+        sorted((key, catalog_id, name) for key, catalog_id, name in names if key.startswith(prefix))[:10]
+    per_call("linear scan, top 10", time.perf_counter() - start, len(scans))
+
+    writes = min(args.lookups, 2000)
+    start = time.perf_counter()
+    for offset in range(writes):
+        index.add(args.catalogs + 1 + offset, f"Flash Sale {offset}")
+    per_call("insert", time.perf_counter() - start, writes)
+
+    start = time.perf_counter()
+    for offset in range(writes):
+        index.add(args.catalogs + 1 + offset, f"Archived {offset}")
+    per_call("rename", time.perf_counter() - start, writes)
+
+    start = time.perf_counter()
+    for offset in range(writes):
+        index.remove(args.catalogs + 1 + offset)
+    per_call("delete", time.perf_counter() - start, writes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Measures catalog payload validation cost per record.
+
+Compares the field-by-field validators in utils/validation.py (per-character generator, two strptime
+calls per date plus two more for the start/end comparison, a warning logged per failure) with the
+compiled CatalogSchema in utils/catalog_schema.py, one record at a time and as a single
+validate_many() batch. Validator log output goes to a temporary file, not logs/.
+
+Usage: python benchmarks/bench_validation.py [--records 20000] [--invalid-every 10]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dto.catalog import Catalog
+from exception.catalog_exception import ValidationError
+from utils.catalog_schema import catalog_schema
+from utils.logger import logger
+from utils.validation import validate_alphanumeric_string, validate_future_date, validate_status
+
+
+def make_records(count: int, invalid_every: int) -> list:
+    start = date.today() + timedelta(days=30)
+    records = []
+    for i in range(count):
+        record = {
+            "name": f"Summer Sale {i % 1000}",
+            "description": "Seasonal catalog, limited offers - don't miss it!",
+            "start_date": (start + timedelta(days=i % 60)).isoformat(),
+            "end_date": (start + timedelta(days=90 + i % 60)).isoformat(),
+            "status": "active" if i % 2 else "Inactive",
+        }
+        if invalid_every and i % invalid_every == invalid_every - 1:
+            record["name"] = "Bad <name>"
+        records.append(record)
+    return records
+
+
+def legacy_validate(data: dict) -> Catalog:
+    """The original validate_catalog_payload: one validator call per field, first failure wins."""
+    if not isinstance(data, dict):
+        raise ValidationError("Catalog payload must be a JSON object.")
+    name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
+    description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
+    start_date = validate_future_date(data.get('start_date'), "Start Date")
+    end_date = validate_future_date(data.get('end_date'), "End Date")
+    status = validate_status(data.get('status'))
+    if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
+        raise ValidationError("End Date cannot be before Start Date.")
+    return Catalog(name=name, description=description, start_date=start_date, end_date=end_date, status=status)
+
+
+def run_each(validate, records: list) -> int:
+    valid = 0
+    for record in records:
+        try:
+            validate(record)
+            valid += 1
+        except ValidationError:
+            pass
+    return valid
+
+
+def report(label: str, elapsed: float, records: int, valid: int, baseline: float = None) -> None:
+    speedup = f"   {baseline / elapsed:5.1f}x" if baseline else ""
+    print(f"{label:<36} {elapsed / records * 1e6:8.2f} us/record   ({valid} valid){speedup}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--invalid-every', type=int, default=10, help="make every Nth record invalid (0 = none)")
+    args = parser.parse_args()
+    records = make_records(args.records, args.invalid_every)
+
+    with tempfile.TemporaryDirectory() as directory:
+        handler = logging.FileHandler(os.path.join(directory, 'validation.log'), encoding='utf-8')
+        handlers, logger.handlers = logger.handlers, [handler]
+        try:
+            invalid = f"every {args.invalid_every}th invalid" if args.invalid_every else "all valid"
+            print(f"{args.records} records, {invalid}\n")
+            start = time.perf_counter()
+            valid = run_each(legacy_validate, records)
+            baseline = time.perf_counter() - start
+            report("legacy field validators", baseline, args.records, valid)
+
+            start = time.perf_counter()
+            valid = run_each(catalog_schema.validate, records)
+            report("CatalogSchema.validate", time.perf_counter() - start, args.records, valid, baseline)
+
+            start = time.perf_counter()
+            valid, _ = catalog_schema.validate_many(records)
+            report("CatalogSchema.validate_many", time.perf_counter() - start, args.records, len(valid), baseline)
+        finally:
+            logger.handlers = handlers
+            handler.close()
+
+
+if __name__ == '__main__':
+    main()
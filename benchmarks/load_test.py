@@ -0,0 +1,378 @@
+"""
+Load test harness for the catalog API.
+
+  seed     Fills the database from config/config.ini with benchmark users and catalogs
+           (rows are prefixed 'Bench' / 'bench_user_' so --reset can remove them again) and
+           writes a manifest the run step reads.
+  run      Drives a running server over HTTP with concurrent keep-alive clients using a weighted
+           mix of operations, then reports throughput and p50/p95/p99 latency per operation.
+           --save writes the result as JSON; --baseline compares against an earlier result.
+  compare  Compares two saved results and exits with status 1 if any operation regressed
+           past --threshold percent (p95 latency up or throughput down).
+
+Example:
+  python benchmarks/load_test.py seed --catalogs 100000 --users 10000 --reset
+  python app.py &
+  python benchmarks/load_test.py run --clients 16 --duration 60 --save benchmarks/results/baseline.json
+  python benchmarks/load_test.py run --clients 16 --duration 60 --baseline benchmarks/results/baseline.json
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+
+DEFAULT_MANIFEST = os.path.join(BENCH_DIR, 'results', 'seed_manifest.json')
+BENCH_PASSWORD = 'bench-password'
+WORDS = ('summer', 'winter', 'spring', 'autumn', 'garden', 'kitchen', 'outdoor', 'office', 'sports', 'travel',
+         'classic', 'premium', 'budget', 'family', 'holiday', 'festival', 'clearance', 'launch', 'limited', 'seasonal')
+DEFAULT_MIX = 'list=20,search=15,filter=10,deep_page=10,get_by_id=25,create=6,update=5,delete=4,login=5'
+PER_PAGE = 20
+
+
+# --- Seeding ---
+def _catalog_rows(count: int, user_ids: list, rng: random.Random):
+    today = date.today()
+    for i in range(count):
+        start = today + timedelta(days=rng.randint(1, 365))
+        yield (f"Bench {rng.choice(WORDS)} {rng.choice(WORDS)} {i}"[:30],
+               f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} catalog for load testing",
+               start, start + timedelta(days=rng.randint(1, 180)),
+               'active' if rng.random() < 0.7 else 'inactive', rng.choice(user_ids))
+
+
+def seed(args) -> None:
+    import bcrypt
+    from utils.query_executor import executor
+
+    rng = random.Random(args.seed)
+    if args.reset:
+        print("Removing earlier benchmark rows...")
+        while executor.execute("DELETE FROM catalog WHERE catalog_name LIKE %s LIMIT 10000", ('Bench %',)):
+            pass
+        while executor.execute("DELETE FROM users WHERE username LIKE %s LIMIT 10000", ('bench\\_user\\_%',)):
+            pass
+
+    # One hash shared by every benchmark user keeps seeding fast; logins still pay the full bcrypt cost
+    password_hash = bcrypt.hashpw(BENCH_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    started = time.perf_counter()
+    user_ids = []
+    for start in range(0, args.users, args.batch_size):
+        rows = [(f"bench_user_{i}", f"bench_user_{i}@example.com", password_hash)
+                for i in range(start, min(start + args.batch_size, args.users))]
+        first_id = executor.insert_many("INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)", rows)
+        user_ids.extend(range(first_id, first_id + len(rows)))
+    print(f"Inserted {len(user_ids)} users in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    catalog_ids = []
+    batch = []
+    query = """
+        INSERT INTO catalog (catalog_name, catalog_description, start_date, end_date, status, user_id)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    for row in _catalog_rows(args.catalogs, user_ids, rng):
+        batch.append(row)
+        if len(batch) == args.batch_size:
+            first_id = executor.insert_many(query, batch)
+            catalog_ids.extend((first_id, first_id + len(batch) - 1))
+            batch = []
+    if batch:
+        first_id = executor.insert_many(query, batch)
+        catalog_ids.extend((first_id, first_id + len(batch) - 1))
+    print(f"Inserted {args.catalogs} catalogs in {time.perf_counter() - started:.1f}s")
+
+    manifest = {
+        "catalogs": args.catalogs,
+        "users": args.users,
+        "catalog_id_min": min(catalog_ids) if catalog_ids else None,
+        "catalog_id_max": max(catalog_ids) if catalog_ids else None,
+        "usernames": [f"bench_user_{i}" for i in range(min(args.users, 1000))],
+        "password": BENCH_PASSWORD,
+        "seeded_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    os.makedirs(os.path.dirname(args.manifest), exist_ok=True)
+    with open(args.manifest, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    print(f"Wrote {args.manifest}")
+
+
+# --- Load generation ---
+class ApiClient:
+    """One keep-alive HTTP connection with the JWT/CSRF cookies of a logged-in benchmark user."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self.cookies = {}
+
+    def request(self, method: str, path: str, body: dict = None) -> tuple[int, bytes]:
+        headers = {'Accept': 'application/json'}
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f"{name}={value}" for name, value in self.cookies.items())
+        if 'csrf_access_token' in self.cookies and method != 'GET':
+            headers['X-CSRF-TOKEN'] = self.cookies['csrf_access_token']
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        try:
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            # Drop the broken keep-alive connection; the next request reconnects
+            self.connection.close()
+            raise
+        for header in response.headers.get_all('Set-Cookie') or []:
+            for name, morsel in SimpleCookie(header).items():
+                self.cookies[name] = morsel.value
+        return response.status, data
+
+
+class Worker(threading.Thread):
+    """Runs randomly chosen operations until the deadline and records their latencies."""
+
+    def __init__(self, index: int, args, manifest: dict, operations: list, weights: list, barrier: threading.Barrier):
+        super().__init__(name=f"client-{index}", daemon=True)
+        self.args = args
+        self.manifest = manifest
+        self.operations = operations
+        self.weights = weights
+        self.barrier = barrier
+        self.rng = random.Random(args.seed + index)
+        self.client = ApiClient(args.url, args.timeout)
+        self.created_ids = []
+        self.latencies = {name: [] for name in operations}
+        self.errors = {name: 0 for name in operations}
+        self.measure_from = None
+        self.deadline = None
+
+    def _catalog_payload(self) -> dict:
+        start = date.today() + timedelta(days=self.rng.randint(1, 365))
+        return {"name": f"Bench load {self.rng.choice(WORDS)} {self.rng.randint(0, 10**6)}",
+                "description": f"{self.rng.choice(WORDS).title()} load test catalog",
+                "start_date": start.isoformat(), "end_date": (start + timedelta(days=30)).isoformat(),
+                "status": self.rng.choice(('active', 'inactive'))}
+
+    def _login(self) -> tuple[str, str, dict]:
+        return 'POST', '/api/login', {"username_or_email": self.rng.choice(self.manifest['usernames']),
+                                       "password": self.manifest['password']}
+
+    def _next_request(self, operation: str):
+        """Returns (method, path, body) for an operation, or None if it cannot run yet."""
+        rng = self.rng
+        if operation == 'list':
+            return 'GET', '/api/catalogs?' + urlencode({"per_page": PER_PAGE, "count": "capped"}), None
+        if operation == 'search':
+            return 'GET', '/api/catalogs?' + urlencode({"search": rng.choice(WORDS), "per_page": PER_PAGE}), None
+        if operation == 'filter':
+            return 'GET', '/api/catalogs?' + urlencode({"status": rng.choice(('active', 'inactive')),
+                                                        "per_page": PER_PAGE}), None
+        if operation == 'deep_page':
+            last_page = max(self.manifest['catalogs'] // PER_PAGE, 1)
+            return 'GET', '/api/catalogs?' + urlencode({"page": rng.randint(last_page // 2, last_page),
+                                                        "per_page": PER_PAGE}), None
+        if operation == 'get_by_id':
+            return 'GET', f"/api/catalogs/{rng.randint(self.manifest['catalog_id_min'], self.manifest['catalog_id_max'])}", None
+        if operation == 'create':
+            return 'POST', '/api/catalogs', self._catalog_payload()
+        if operation == 'update':
+            return ('PUT', f"/api/catalogs/{rng.choice(self.created_ids)}", self._catalog_payload()) \
+                if self.created_ids else None
+        if operation == 'delete':
+            return ('DELETE', f"/api/catalogs/{self.created_ids.pop(rng.randrange(len(self.created_ids)))}", None) \
+                if self.created_ids else None
+        if operation == 'login':
+            return self._login()
+        raise ValueError(f"Unknown operation: {operation}")
+
+    def run(self) -> None:
+        status, _ = self.client.request(*self._login())
+        if status != 200:
+            print(f"{self.name}: login failed with HTTP {status}", file=sys.stderr)
+        self.barrier.wait()
+        self.measure_from = time.perf_counter() + self.args.warmup
+        self.deadline = self.measure_from + self.args.duration
+
+        while True:
+            now = time.perf_counter()
+            if now >= self.deadline:
+                break
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            request = self._next_request(operation)
+            if request is None:
+                operation, request = 'create', self._next_request('create')
+            started = time.perf_counter()
+            try:
+                status, body = self.client.request(*request)
+            except (http.client.HTTPException, OSError):
+                status, body = None, b''
+            elapsed = time.perf_counter() - started
+            if operation == 'create' and status == 201:
+                self.created_ids.append(json.loads(body)['data']['catalog_id'])
+            if started < self.measure_from:
+                continue
+            self.latencies[operation].append(elapsed * 1000)
+            # A missing ID under get_by_id is expected once other clients start deleting
+            if status is None or (status >= 400 and not (operation == 'get_by_id' and status == 404)):
+                self.errors[operation] += 1
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] if ordered else 0.0
+
+
+def _summarize(latencies: list, errors: int, duration: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / duration, 2),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50), 3),
+        "p95_ms": round(_percentile(ordered, 0.95), 3),
+        "p99_ms": round(_percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _print_result(result: dict) -> None:
+    print(f"\n{'operation':<12} {'count':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in list(result['operations'].items()) + [('TOTAL', result['total'])]:
+        print(f"{name:<12} {stats['count']:>8} {stats['errors']:>7} {stats['rps']:>9.1f} "
+              f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
+
+
+def run(args) -> int:
+    with open(args.manifest) as manifest_file:
+        manifest = json.load(manifest_file)
+    mix = dict(item.split('=') for item in args.mix.split(','))
+    operations, weights = list(mix), [float(weight) for weight in mix.values()]
+
+    barrier = threading.Barrier(args.clients)
+    workers = [Worker(index, args, manifest, operations, weights, barrier) for index in range(args.clients)]
+    print(f"Running {args.clients} clients against {args.url} for {args.duration}s (+{args.warmup}s warm-up)...")
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    duration = args.duration
+    result = {
+        "meta": {
+            "url": args.url, "clients": args.clients, "duration_s": duration, "warmup_s": args.warmup,
+            "mix": args.mix, "catalogs": manifest['catalogs'], "users": manifest['users'],
+            "git_revision": _git_revision(), "python": platform.python_version(),
+            "recorded_at": datetime.now().isoformat(timespec='seconds'),
+        },
+        "operations": {
+            name: _summarize([ms for worker in workers for ms in worker.latencies[name]],
+                             sum(worker.errors[name] for worker in workers), duration)
+            for name in operations
+        },
+    }
+    result["total"] = _summarize([ms for worker in workers for latencies in worker.latencies.values() for ms in latencies],
+                                 sum(sum(worker.errors.values()) for worker in workers), duration)
+    _print_result(result)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w') as result_file:
+            json.dump(result, result_file, indent=2)
+        print(f"\nSaved result to {args.save}")
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            return _compare(json.load(baseline_file), result, args.threshold)
+    return 0
+
+
+# --- Comparison ---
+def _compare(baseline: dict, current: dict, threshold: float) -> int:
+    """Prints per-operation changes and returns 1 if any operation regressed past threshold percent."""
+    regressions = []
+    print(f"\n{'operation':<12} {'p95 base':>9} {'p95 now':>9} {'change':>8} {'rps base':>9} {'rps now':>9} {'change':>8}")
+    rows = [(name, stats, current['operations'][name])
+            for name, stats in baseline['operations'].items() if name in current['operations']]
+    for name, base, now in rows + [('TOTAL', baseline['total'], current['total'])]:
+        p95_change = (now['p95_ms'] - base['p95_ms']) / base['p95_ms'] * 100 if base['p95_ms'] else 0.0
+        rps_change = (now['rps'] - base['rps']) / base['rps'] * 100 if base['rps'] else 0.0
+        regressed = p95_change > threshold or rps_change < -threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<12} {base['p95_ms']:>9.2f} {now['p95_ms']:>9.2f} {p95_change:>+7.1f}% "
+              f"{base['rps']:>9.1f} {now['rps']:>9.1f} {rps_change:>+7.1f}%{'  REGRESSED' if regressed else ''}")
+
+    if regressions:
+        print(f"\nRegression past {threshold}% in: {', '.join(regressions)}")
+        return 1
+    print(f"\nNo regression past {threshold}%.")
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline) as baseline_file, open(args.current) as current_file:
+        return _compare(json.load(baseline_file), json.load(current_file), args.threshold)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = commands.add_parser('seed', help='Insert benchmark users and catalogs.')
+    seed_parser.add_argument('--catalogs', type=int, default=10000, help='e.g. 10000, 100000 or 1000000')
+    seed_parser.add_argument('--users', type=int, default=1000)
+    seed_parser.add_argument('--batch-size', type=int, default=1000)
+    seed_parser.add_argument('--reset', action='store_true', help='Delete earlier benchmark rows first.')
+    seed_parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible data.')
+    seed_parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+
+    run_parser = commands.add_parser('run', help='Drive the HTTP API and report latency percentiles.')
+    run_parser.add_argument('--url', default='http://127.0.0.1:5000')
+    run_parser.add_argument('--clients', type=int, default=8)
+    run_parser.add_argument('--duration', type=float, default=30, help='Measured seconds.')
+    run_parser.add_argument('--warmup', type=float, default=5, help='Unmeasured seconds before measuring.')
+    run_parser.add_argument('--mix', default=DEFAULT_MIX, help='Comma-separated operation=weight pairs.')
+    run_parser.add_argument('--timeout', type=float, default=30)
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+    run_parser.add_argument('--save', help='Write the result JSON here.')
+    run_parser.add_argument('--baseline', help='Compare against this saved result and fail on regression.')
+    run_parser.add_argument('--threshold', type=float, default=10, help='Allowed regression in percent.')
+
+    compare_parser = commands.add_parser('compare', help='Compare two saved results.')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=10, help='Allowed regression in percent.')
+
+    args = parser.parse_args()
+    if args.command == 'seed':
+        seed(args)
+        return 0
+    if args.command == 'run':
+        return run(args)
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,6 +3,9 @@ class Catalog:
     Data Transfer Object (DTO) for a Catalog item.
     Encapsulates catalog properties for consistent data structure.
     """
+    # No per-instance __dict__: bulk writes and imports hold thousands of these at once
+    __slots__ = ('catalog_id', 'name', 'description', 'start_date', 'end_date', 'status')
+
     def __init__(self, name: str, description: str, start_date: str, end_date: str, status: str, catalog_id: int = None):
         self.catalog_id = catalog_id
         self.name = name
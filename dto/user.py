@@ -5,6 +5,9 @@ class User:
     Data Transfer Object (DTO) for a User entry.
     Encapsulates user properties for consistent data structure.
     """
+    # No per-instance __dict__: one instance per cached user
+    __slots__ = ('user_id', 'username', 'password_hash', 'email', 'created_at')
+
     def __init__(self, username: str, password_hash: str, email: str, user_id: int = None, created_at: datetime = None):
         self.user_id = user_id
         self.username = username
@@ -12,6 +15,37 @@ class User:
         self.email = email
         self.created_at = created_at
 
+    @classmethod
+    def from_row(cls, row: dict) -> 'User':
+        """Builds a User from a database row dictionary."""
+        return cls(
+            user_id=row['user_id'],
+            username=row['username'],
+            email=row['email'],
+            password_hash=row['password_hash'],
+            created_at=row['created_at']
+        )
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> 'User':
+        """Builds a User from a tuple row in USER_SELECT column order (user_id, username, email, password_hash, created_at)."""
+        user_id, username, email, password_hash, created_at = row
+        return cls(username=username, password_hash=password_hash, email=email, user_id=user_id, created_at=created_at)
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> 'User':
+        """Builds a User from JWT claims created with to_claims(); password_hash is not available."""
+        return cls(
+            user_id=int(claims['sub']),
+            username=claims['username'],
+            email=claims['email'],
+            password_hash=None
+        )
+
+    def to_claims(self) -> dict:
+        """Returns the non-sensitive fields to embed as additional JWT claims."""
+        return {"username": self.username, "email": self.email}
+
     def to_dict(self) -> dict:
         """Converts the User object to a dictionary for JSON serialization."""
         return {
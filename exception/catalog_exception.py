@@ -3,8 +3,10 @@ class CatalogError(Exception):
     pass
 
 class ValidationError(CatalogError):
-    """Exception raised for invalid input data."""
-    pass
+    """Exception raised for invalid input data. errors optionally lists each invalid field ({"field", "message"})."""
+    def __init__(self, message: str, errors: list = None):
+        super().__init__(message)
+        self.errors = errors or []
 
 class DataNotFoundError(CatalogError):
     """Exception raised when requested data is not found."""
@@ -14,6 +16,18 @@ class DatabaseConnectionError(CatalogError):
     """Exception raised for database connection or operation errors."""
     pass
 
+class DataIntegrityError(DatabaseConnectionError):
+    """Exception raised when the database rejects a statement because of the row's data (constraint violation, invalid value); the connection stays usable."""
+    pass
+
 class AuthenticationError(CatalogError):
     """Exception raised for authentication failures."""
-    pass
\ No newline at end of file
+    pass
+
+class ServiceUnavailableError(CatalogError):
+    """Exception raised when a bounded resource is saturated and the request should be retried later."""
+    pass
+
+class PreconditionFailedError(CatalogError):
+    """Exception raised when a conditional write finds the catalog changed since the client's If-Match version."""
+    pass
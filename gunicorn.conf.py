@@ -0,0 +1,72 @@
+"""
+gunicorn settings for wsgi:app, read from the [server] section of config/config.ini.
+
+The master preloads the application once and forks `workers` processes (one per CPU core by default),
+each serving `threads` requests concurrently. Workers restart gracefully: on SIGHUP, after max_requests,
+or on shutdown (SIGTERM), a worker stops accepting connections and finishes the requests in flight
+for up to graceful_timeout seconds.
+"""
+import multiprocessing
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.config import get_config
+from utils.query_cache import check_query_cache_backend
+
+_config = get_config()
+
+bind = _config.get('server', 'bind', fallback='127.0.0.1:5000')
+# 0 = one worker per CPU core
+workers = _config.getint('server', 'workers', fallback=0) or multiprocessing.cpu_count()
+worker_class = 'gthread'
+threads = _config.getint('server', 'threads', fallback=4)
+# Load the app (and config.ini) once in the master; workers inherit it copy-on-write
+preload_app = True
+timeout = _config.getint('server', 'timeout', fallback=30)
+graceful_timeout = _config.getint('server', 'graceful_timeout', fallback=30)
+keepalive = _config.getint('server', 'keepalive', fallback=5)
+# Recycle workers after this many requests (0 = never); jitter keeps them from restarting together
+max_requests = _config.getint('server', 'max_requests', fallback=0)
+max_requests_jitter = _config.getint('server', 'max_requests_jitter', fallback=0)
+accesslog = _config.get('server', 'access_log', fallback='') or None
+
+# Set when the [query_cache] backend is per process: workers then run without the query cache
+_query_cache_warning = check_query_cache_backend(_config, workers)
+
+
+def on_starting(server):
+    from utils.logger import use_external_rotation
+    if workers > 1 and use_external_rotation(_config):
+        server.log.warning("[logging] rotation = %s cannot be shared by %s workers; the log file is now only "
+                           "reopened after it is moved. Rotate it with logrotate (or set rotation = external).",
+                           _config.get('logging', 'rotation', fallback='size'), workers)
+    pool_size = _config.getint('mysql_pool', 'max_size', fallback=10)
+    if threads > pool_size:
+        server.log.warning("threads (%s) exceeds [mysql_pool] max_size (%s); requests will queue for connections.",
+                           threads, pool_size)
+    if workers > 1 and _config.getboolean('catalog_cache', 'enabled', fallback=False):
+        server.log.warning("[catalog_cache] is per process; with %s workers GET /api/catalogs/<id> may serve rows "
+                           "(and ETags) up to %ss stale after writes through another worker.",
+                           workers, _config.getfloat('catalog_cache', 'ttl', fallback=5))
+    if _query_cache_warning:
+        server.log.warning(_query_cache_warning)
+
+
+def post_worker_init(worker):
+    # Runs in each worker after the app is loaded and before it accepts connections
+    from wsgi import warm_worker
+    if _query_cache_warning:
+        from app import catalog_service
+        catalog_service.query_cache.disable()
+    warm_worker()
+
+
+def worker_exit(server, worker):
+    # Close pooled connections and flush queued log records before the worker process goes away
+    import utils.logger as logging_setup
+    from utils.db_pool import get_pool
+    get_pool().close_all()
+    if logging_setup.async_logging is not None:
+        logging_setup.async_logging.stop()
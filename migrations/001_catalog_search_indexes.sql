@@ -0,0 +1,12 @@
+-- Indexes backing catalog search, status filtering and keyset pagination.
+-- Apply once per database: mysql -u root -p <database> < migrations/001_catalog_search_indexes.sql
+-- (<database> is the [mysql] database in config/config.ini)
+
+-- Word/prefix search over name and description (MATCH ... AGAINST ... IN BOOLEAN MODE)
+ALTER TABLE catalog ADD FULLTEXT INDEX ft_catalog_name_description (catalog_name, catalog_description);
+
+-- Name prefix lookups for search terms shorter than innodb_ft_min_token_size
+ALTER TABLE catalog ADD INDEX idx_catalog_name (catalog_name);
+
+-- Status filter combined with catalog_id ordering / keyset cursors
+ALTER TABLE catalog ADD INDEX idx_catalog_status_id (status, catalog_id);
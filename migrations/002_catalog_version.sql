@@ -0,0 +1,6 @@
+-- Row version used for optimistic concurrency: every write bumps it, and conditional
+-- writes (If-Match) only apply when the version the client read is still current.
+-- Apply once per database: mysql -u root -p <database> < migrations/002_catalog_version.sql
+-- (<database> is the [mysql] database in config/config.ini)
+
+ALTER TABLE catalog ADD COLUMN version INT UNSIGNED NOT NULL DEFAULT 1;
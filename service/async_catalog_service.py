@@ -0,0 +1,161 @@
+import asyncio
+import time
+from dto.catalog import Catalog
+from exception.catalog_exception import DataNotFoundError
+from service.catalog_service import (CatalogService, CATALOG_VERSION_QUERY, INSERT_CATALOG_QUERY, COUNT_EXACT,
+                                     MAX_CATALOG_ID, SUGGEST_INDEX_QUERY)
+from utils.async_query_executor import async_executor
+from utils.logger import logger
+
+
+class AsyncCatalogService:
+    """
+    asyncio version of the catalog operations served by the ASGI entry point.
+    SQL building, result shaping and the entity/query caches are those of the wrapped CatalogService,
+    so both entry points behave identically; only the database I/O is awaited instead of blocking.
+    """
+
+    def __init__(self, catalog_service: CatalogService = None):
+        self.catalog_service = catalog_service or CatalogService()
+        self.db = async_executor
+        # Serializes suggestion index builds on the event loop; the task keeps a background refresh alive
+        self._suggest_build_lock = asyncio.Lock()
+        self._suggest_refresh = None
+
+    async def create_catalog(self, catalog: Catalog, user_id: int) -> int:
+        """Adds a new catalog entry associated with a user and returns its ID."""
+        logger.info("Creating new catalog for user_id=%s with name='%s'", user_id, catalog.name)
+        params = (catalog.name, catalog.description, catalog.start_date, catalog.end_date, catalog.status, user_id)
+        try:
+            catalog_id = await self.db.insert(INSERT_CATALOG_QUERY, params)
+        finally:
+            self.catalog_service.query_cache.invalidate()
+        self.catalog_service.suggest_index.add(catalog_id, catalog.name)
+        logger.info("Catalog created successfully with ID %s", catalog_id)
+        return catalog_id
+
+    async def get_catalog_by_id(self, catalog_id: int) -> dict:
+        """Retrieves a single catalog entry by its ID through the shared entity cache (when enabled); returns a copy."""
+        cache = self.catalog_service.catalog_cache
+        if cache is not None:
+            cached = cache.get(catalog_id)
+            if cached is not None:
+                return dict(cached)
+            generation = cache.generation()
+
+        logger.info("Fetching catalog with ID %s", catalog_id)
+        catalog_data = await self.db.fetch_one("SELECT * FROM catalog WHERE catalog_id = %s", (catalog_id,))
+        if not catalog_data:
+            logger.warning("Catalog with ID %s not found.", catalog_id)
+            raise DataNotFoundError(f"Catalog with ID {catalog_id} not found.")
+        if cache is not None:
+            cache.set(catalog_id, catalog_data, generation=generation)
+        return dict(catalog_data)
+
+    async def get_catalogs_page(self, search_term: str = '', status_filter: str = None, page: int = 1,
+                                per_page: int = 10, cursor: str = None, count_mode: str = COUNT_EXACT,
+                                order_by_relevance: bool = False, fields: tuple = None) -> dict:
+        """Same as CatalogService.get_catalogs_page: one page plus its total in a single round trip."""
+        service = self.catalog_service
+        cache_key = ('page', search_term, status_filter, page, per_page, cursor, count_mode, order_by_relevance, fields)
+
+        async def load() -> dict:
+            plan = service._page_plan(search_term, status_filter, page, per_page, cursor, count_mode,
+                                      order_by_relevance, fields)
+            return service._page_result(plan, *await self.db.fetch_rows(plan['query'], plan['params']))
+
+        return dict(await service.query_cache.get_or_load_async(cache_key, load))
+
+    async def _update_returning_version(self, catalog_id: int, values: dict, expected_version: int = None,
+                                        partial: bool = False) -> int:
+        service = self.catalog_service
+        query, params, checked_dates = service._update_statement(catalog_id, values, expected_version, partial)
+        try:
+            new_version = await self.db.insert(query, params)
+        finally:
+            service._invalidate_catalog(catalog_id)
+        if not new_version:
+            row = await self.db.fetch_one(CATALOG_VERSION_QUERY, (catalog_id,))
+            raise service._write_failure(row, catalog_id, expected_version, 'update', checked_dates)
+        return new_version
+
+    async def update_catalog_by_id(self, catalog_id: int, catalog: Catalog, expected_version: int = None) -> int:
+        """Replaces every field of a catalog with a single statement and returns its new version."""
+        logger.info("Updating catalog ID %s (expected version %s)", catalog_id, expected_version)
+        version = await self._update_returning_version(
+            catalog_id, self.catalog_service._catalog_values(catalog), expected_version)
+        self.catalog_service.suggest_index.add(catalog_id, catalog.name)
+        logger.info("Catalog ID %s updated successfully to version %s.", catalog_id, version)
+        return version
+
+    async def patch_catalog_by_id(self, catalog_id: int, changes: dict, expected_version: int = None) -> int:
+        """Updates only the given columns with a single statement and returns the new version."""
+        logger.info("Patching catalog ID %s columns %s (expected version %s)", catalog_id, sorted(changes), expected_version)
+        version = await self._update_returning_version(catalog_id, changes, expected_version, partial=True)
+        if 'catalog_name' in changes:
+            self.catalog_service.suggest_index.add(catalog_id, changes['catalog_name'])
+        logger.info("Catalog ID %s patched successfully to version %s.", catalog_id, version)
+        return version
+
+    async def delete_catalog_by_id(self, catalog_id: int, expected_version: int = None) -> bool:
+        """Deletes a catalog with a single statement, only at expected_version when one is given."""
+        logger.info("Deleting catalog ID %s (expected version %s)", catalog_id, expected_version)
+        service = self.catalog_service
+        where, params = service._write_condition(catalog_id, expected_version)
+        try:
+            row_count = await self.db.execute(f"DELETE FROM catalog {where}", tuple(params))
+        finally:
+            service._invalidate_catalog(catalog_id)
+        if row_count == 0:
+            row = await self.db.fetch_one(CATALOG_VERSION_QUERY, (catalog_id,))
+            raise service._write_failure(row, catalog_id, expected_version, 'deletion')
+        service.suggest_index.remove(catalog_id)
+        logger.info("Catalog ID %s deleted successfully.", catalog_id)
+        return True
+
+    async def build_suggest_index(self, batch_size: int = 1000) -> int:
+        """Rebuilds the shared suggestion index from (catalog_id, catalog_name) keyset windows read without blocking."""
+        async with self._suggest_build_lock:
+            return await self._build_suggest_index(batch_size)
+
+    async def _build_suggest_index(self, batch_size: int = 1000) -> int:
+        """Reads the names and loads them into the index; the caller holds _suggest_build_lock."""
+        index = self.catalog_service.suggest_index
+        started = time.perf_counter()
+        index.begin_build()
+        try:
+            batches = []
+            last_id = MAX_CATALOG_ID
+            while True:
+                rows = await self.db.fetch_all(SUGGEST_INDEX_QUERY, (last_id, batch_size), row_factory=tuple)
+                if rows:
+                    batches.append(rows)
+                if len(rows) < batch_size:
+                    break
+                last_id = rows[-1][0]
+        except BaseException:
+            index.cancel_build()
+            raise
+        count = index.load(batches)
+        logger.info("Suggestion index built: %s catalogs in %.1f ms.", count, (time.perf_counter() - started) * 1000)
+        return count
+
+    async def _refresh_suggest_index(self) -> None:
+        try:
+            await self.build_suggest_index()
+        except Exception as e:
+            logger.error("Could not refresh the suggestion index: %s", e)
+
+    async def suggest_catalogs(self, prefix: str, limit: int = None) -> list:
+        """Same as CatalogService.suggest_catalogs; a stale index is rebuilt by a background task."""
+        service = self.catalog_service
+        limit = min(max(limit or service.suggest_limit, 1), service.suggest_max_limit)
+        index = service.suggest_index
+        if not index.ready:
+            async with self._suggest_build_lock:
+                if not index.ready:
+                    await self._build_suggest_index()
+        elif (service.suggest_refresh_interval and time.time() - index.built_at > service.suggest_refresh_interval
+              and (self._suggest_refresh is None or self._suggest_refresh.done())):
+            self._suggest_refresh = asyncio.get_running_loop().create_task(self._refresh_suggest_index())
+        return [{"catalog_id": catalog_id, "catalog_name": name} for catalog_id, name in index.search(prefix, limit)]
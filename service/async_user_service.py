@@ -0,0 +1,49 @@
+import copy
+from dto.user import User
+from service.user_service import UserService, USER_SELECT, USER_BY_USERNAME_OR_EMAIL_QUERY
+from utils.async_query_executor import async_executor
+from utils.logger import logger
+
+
+class AsyncUserService:
+    """
+    asyncio version of the user lookups needed by the ASGI entry point.
+    Shares the user cache of the wrapped UserService, so invalidations apply to both entry points.
+    """
+
+    def __init__(self, user_service: UserService = None):
+        self.user_service = user_service or UserService()
+        self.db = async_executor
+
+    async def _fetch_user(self, query: str, params: tuple) -> User | None:
+        """Runs a USER_SELECT query and builds the User straight from the tuple row."""
+        row = await self.db.fetch_one(query, params, row_factory=tuple)
+        return User.from_tuple(row) if row else None
+
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        """Retrieves a user by their ID."""
+        logger.info("Fetching user by ID: %s", user_id)
+        user = await self._fetch_user(f"{USER_SELECT} WHERE user_id = %s", (user_id,))
+        if not user:
+            logger.warning("No user found with ID: %s", user_id)
+        return user
+
+    async def get_user_by_username_or_email(self, username_or_email: str) -> User | None:
+        """Retrieves a user whose username or email matches, in a single query."""
+        logger.info("Fetching user by username or email: %s", username_or_email)
+        params = (username_or_email, username_or_email, username_or_email)
+        user = await self._fetch_user(USER_BY_USERNAME_OR_EMAIL_QUERY, params)
+        if not user:
+            logger.warning("No user found with username or email: %s", username_or_email)
+        return user
+
+    async def get_user_by_id_cached(self, user_id: int) -> User | None:
+        """Retrieves a user by ID through the shared user cache; returns a copy the caller may modify."""
+        cache = self.user_service.user_cache
+        cached = cache.get(user_id)
+        if cached is None:
+            cached = await self.get_user_by_id(user_id)
+            if cached is None:
+                return None
+            cache.set(user_id, cached)
+        return copy.copy(cached)
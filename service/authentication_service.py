@@ -1,15 +1,42 @@
+import hashlib
+import hmac
+import secrets
 import bcrypt
 from service.user_service import UserService
-from exception.catalog_exception import AuthenticationError, DatabaseConnectionError, ValidationError
+from exception.catalog_exception import AuthenticationError, DatabaseConnectionError, ValidationError, ServiceUnavailableError
+from utils.cache import LRUCache
+from utils.config import get_config
+from utils.hash_pool import HashWorkerPool, build_hash_pool
 from utils.logger import logger
 
+# Returned for every failed login, so responses don't reveal whether an account exists
+INVALID_CREDENTIALS_MESSAGE = "Invalid username/email or password."
+
 class AuthenticationService:
     """
     Handles user authentication logic, including password hashing and verification.
+    Hash checks run on a bounded worker pool so slow bcrypt work never runs on the request thread.
     """
 
-    def __init__(self):
-        self.user_service = UserService()
+    def __init__(self, hash_pool: HashWorkerPool = None, user_service: UserService = None):
+        config = get_config()
+        # Share the application's UserService so user cache invalidations are seen everywhere
+        self.user_service = user_service or UserService()
+        self.hash_pool = hash_pool or build_hash_pool(config)
+        # bcrypt work factor for new hashes; stored hashes with a lower cost are upgraded on login
+        self.bcrypt_rounds = config.getint('auth', 'bcrypt_rounds', fallback=12)
+        # Checked against for unknown users, so that path costs the same bcrypt time as a wrong password
+        self._dummy_hash = bcrypt.hashpw(secrets.token_bytes(16), bcrypt.gensalt(self.bcrypt_rounds)).decode('utf-8')
+
+        # Optional cache of successful verifications, keyed by an HMAC under a per-process random key
+        # so neither passwords nor reusable digests are kept in memory
+        self.verification_cache = None
+        if config.getboolean('auth', 'verify_cache', fallback=False):
+            self.verification_cache = LRUCache(
+                max_entries=config.getint('auth', 'verify_cache_max_entries', fallback=10000),
+                ttl=config.getfloat('auth', 'verify_cache_ttl', fallback=300)
+            )
+        self._verification_key = secrets.token_bytes(32)
 
     def hash_password(self, password: str) -> str:
         """
@@ -20,14 +47,15 @@ class AuthenticationService:
             logger.warning("Invalid password input for hashing.")
             raise ValidationError("Password must be a non-empty string.")
         
-        hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+        hashed = self.hash_pool.run(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(self.bcrypt_rounds))
         logger.debug("Password hashed successfully.")
         return hashed.decode('utf-8')
 
     def check_password(self, password: str, hashed_password: str) -> bool:
         """
-        Checks a plain password against a hashed password.
-        Raises ValidationError or AuthenticationError on invalid input or failure.
+        Checks a plain password against a hashed password on the hash worker pool.
+        Raises ValidationError or AuthenticationError on invalid input or failure, and
+        ServiceUnavailableError if the pool is saturated or the check times out.
         """
         if not isinstance(password, str) or not password.strip():
             raise ValidationError("Password must be a non-empty string.")
@@ -36,48 +64,108 @@ class AuthenticationService:
             raise ValidationError("Hashed password must be a non-empty string.")
         
         try:
-            result = bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-            logger.debug(f"Password check result: {result}")
+            result = self.hash_pool.run(bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8'))
+            logger.debug("Password check result: %s", result)
             return result
+        except ServiceUnavailableError:
+            raise
         except ValueError:
             logger.error("Invalid bcrypt hash format provided.", exc_info=True)
             raise AuthenticationError("Invalid password hash format.")
         except Exception as e:
-            logger.error(f"Unexpected error during password check: {e}", exc_info=True)
+            logger.error("Unexpected error during password check: %s", e, exc_info=True)
             raise AuthenticationError(f"An unexpected error occurred during password check: {e}")
 
+    def _verification_cache_key(self, user_id: int, password: str, hashed_password: str) -> bytes:
+        """
+        Derives the cache key for a verified login. The stored hash is part of the message, so
+        changing the password (or upgrading the hash) makes every earlier entry unreachable.
+        """
+        message = b'\0'.join((str(user_id).encode('utf-8'), hashed_password.encode('utf-8'), password.encode('utf-8')))
+        return hmac.new(self._verification_key, message, hashlib.sha256).digest()
+
+    def _verify_user_password(self, user, password: str) -> bool:
+        """Verifies a user's password, consulting the verification cache first when it is enabled."""
+        if self.verification_cache is None:
+            return self.check_password(password, user.password_hash)
+
+        key = self._verification_cache_key(user.user_id, password, user.password_hash)
+        if self.verification_cache.get(key):
+            logger.debug("Password verification served from cache for user ID %s", user.user_id)
+            return True
+        if not self.check_password(password, user.password_hash):
+            return False
+        self.verification_cache.set(key, True)
+        return True
+
+    @staticmethod
+    def _hash_cost(hashed_password: str) -> int:
+        """Returns the work factor encoded in a bcrypt hash ($2b$<cost>$...), or 0 if it cannot be read."""
+        try:
+            return int(hashed_password.split('$')[2])
+        except (IndexError, ValueError):
+            return 0
+
+    def _upgrade_hash_if_outdated(self, user, password: str) -> None:
+        """
+        Rehashes the (just verified) password with the configured cost if the stored hash is weaker.
+        Failures are logged and never fail the login.
+        """
+        if self._hash_cost(user.password_hash) >= self.bcrypt_rounds:
+            return
+        try:
+            new_hash = self.hash_password(password)
+            if self.user_service.update_password_hash(user.user_id, new_hash, expected_hash=user.password_hash):
+                logger.info("Upgraded password hash for user ID %s to cost %s.", user.user_id, self.bcrypt_rounds)
+                user.password_hash = new_hash
+                if self.verification_cache is not None:
+                    self.verification_cache.set(self._verification_cache_key(user.user_id, password, new_hash), True)
+        except Exception as e:
+            logger.warning("Could not upgrade password hash for user ID %s: %s", user.user_id, e)
+
     def authenticate_user(self, username_or_email: str, password: str):
         """
         Authenticates a user by username/email and password.
         Returns the User DTO if authentication is successful.
-        Raises AuthenticationError or ValidationError on failure.
+        Raises AuthenticationError or ValidationError on failure, with the same message whether
+        the account is unknown or the password is wrong.
         """
         if not username_or_email or not password:
             logger.warning("Missing username/email or password during authentication.")
             raise ValidationError("Username/Email and password are required.")
 
         try:
-            logger.info(f"Authenticating user: {username_or_email}")
+            logger.info("Authenticating user: %s", username_or_email)
             
-            user = self.user_service.get_user_by_username(username_or_email) or \
-                   self.user_service.get_user_by_email(username_or_email)
+            user = self.user_service.get_user_by_username_or_email(username_or_email)
 
             if not user:
-                logger.warning(f"User '{username_or_email}' not found.")
-                raise AuthenticationError("Invalid username or email.")
+                self.check_password(password, self._dummy_hash)
+                logger.warning("User '%s' not found.", username_or_email)
+                raise AuthenticationError(INVALID_CREDENTIALS_MESSAGE)
+
+            if not self._verify_user_password(user, password):
+                logger.warning("Incorrect password for user '%s'.", username_or_email)
+                raise AuthenticationError(INVALID_CREDENTIALS_MESSAGE)
 
-            if not self.check_password(password, user.password_hash):
-                logger.warning(f"Incorrect password for user '{username_or_email}'.")
-                raise AuthenticationError("Invalid password.")
+            self._upgrade_hash_if_outdated(user, password)
 
-            logger.info(f"User '{username_or_email}' authenticated successfully.")
+            logger.info("User '%s' authenticated successfully.", username_or_email)
             return user
 
         except DatabaseConnectionError as e:
-            logger.critical(f"Database error during authentication: {e}", exc_info=True)
+            logger.critical("Database error during authentication: %s", e, exc_info=True)
             raise DatabaseConnectionError(f"Authentication failed due to database error: {e}")
-        except (ValidationError, AuthenticationError):
+        except (ValidationError, AuthenticationError, ServiceUnavailableError):
             raise  # Already logged at origin
         except Exception as e:
-            logger.error(f"Unexpected error during authentication: {e}", exc_info=True)
+            logger.error("Unexpected error during authentication: %s", e, exc_info=True)
             raise AuthenticationError(f"An unexpected error occurred during authentication: {e}")
+
+    def hash_pool_stats(self) -> dict:
+        """Returns queue depth and throughput counters of the password hash worker pool."""
+        return self.hash_pool.stats()
+
+    def verification_cache_stats(self) -> dict | None:
+        """Returns verification cache counters, or None when the cache is disabled."""
+        return self.verification_cache.stats() if self.verification_cache is not None else None
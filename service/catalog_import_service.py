@@ -0,0 +1,125 @@
+import csv
+import json
+import time
+from exception.catalog_exception import ValidationError
+from service.catalog_service import CatalogService
+from utils.logger import logger
+from utils.catalog_schema import catalog_schema
+
+IMPORT_FORMATS = ('ndjson', 'csv')
+
+
+class CatalogImportService:
+    """
+    Streams catalog records from CSV or NDJSON input into the database.
+    Records are validated and inserted a batch at a time (one transaction per batch); invalid lines and
+    rows the database rejects are reported individually instead of failing the whole file. After every
+    committed batch a progress callback receives the last committed line number, so an interrupted
+    import can be resumed from there. Any other database error (outage, broken connection, pool timeout)
+    rolls the current batch back and propagates without advancing last_committed_line.
+    """
+
+    def __init__(self, catalog_service: CatalogService, batch_size: int = 500):
+        self.catalog_service = catalog_service
+        self.batch_size = batch_size
+
+    def _records(self, lines, import_format: str):
+        """
+        Yields (line_number, record) pairs from an iterable of text lines; record is a dict,
+        or the parse error message for a malformed line. Blank lines are skipped.
+        """
+        if import_format == 'csv':
+            reader = csv.DictReader(lines)
+            for record in reader:
+                if not any(value for value in record.values() if isinstance(value, str)):
+                    continue
+                if None in record:
+                    yield reader.line_num, "Line has more fields than the header."
+                else:
+                    yield reader.line_num, record
+            return
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {e}"
+                continue
+            yield line_number, record if isinstance(record, dict) else "Line is not a JSON object."
+
+    def import_stream(self, lines, import_format: str, user_id: int, start_after_line: int = 0,
+                      on_error=None, on_progress=None) -> dict:
+        """
+        Imports catalogs from lines (any iterable of str, e.g. an open text file or upload stream).
+        Lines up to and including start_after_line are skipped, which resumes an earlier run.
+        on_error(line_number, message) is called for every rejected line, and
+        on_progress(progress_dict) after every committed batch.
+        Returns the final progress summary.
+        """
+        if import_format not in IMPORT_FORMATS:
+            raise ValidationError(f"Import format must be one of: {', '.join(IMPORT_FORMATS)}.")
+
+        started = time.monotonic()
+        progress = {
+            "rows_imported": 0,
+            "rows_failed": 0,
+            "last_committed_line": start_after_line,
+            "elapsed_seconds": 0.0,
+            "rows_per_second": 0.0,
+        }
+
+        def report_error(line_number: int, message: str) -> None:
+            progress["rows_failed"] += 1
+            if on_error:
+                on_error(line_number, message)
+
+        def flush(batch: list, last_line: int) -> None:
+            if batch:
+                # One transaction for the whole batch, so an operational error leaves none of it committed
+                with self.catalog_service.db.transaction():
+                    results = self.catalog_service.bulk_create_catalogs(
+                        [catalog for _, catalog in batch], user_id, atomic=False)
+                for (line_number, _), result in zip(batch, results):
+                    if result['status'] == 'created':
+                        progress["rows_imported"] += 1
+                    else:
+                        report_error(line_number, result.get('error', 'Insert failed.'))
+            progress["last_committed_line"] = last_line
+            progress["elapsed_seconds"] = round(time.monotonic() - started, 3)
+            progress["rows_per_second"] = round(progress["rows_imported"] / progress["elapsed_seconds"], 1) \
+                if progress["elapsed_seconds"] else 0.0
+            logger.info("Import progress: %s imported, %s failed, line %s, %s rows/s",
+                        progress['rows_imported'], progress['rows_failed'], last_line, progress['rows_per_second'])
+            if on_progress:
+                on_progress(dict(progress))
+
+        def check(pending: list) -> list:
+            """Validates pending records in one call, reports rejected lines in order and returns the valid (line_number, Catalog) pairs."""
+            valid, invalid = catalog_schema.validate_many([record for _, record in pending])
+            catalogs = dict(valid)
+            errors = dict(invalid)
+            batch = []
+            for index, (line_number, record) in enumerate(pending):
+                if isinstance(record, str):
+                    report_error(line_number, record)
+                elif index in catalogs:
+                    batch.append((line_number, catalogs[index]))
+                else:
+                    report_error(line_number, ' '.join(error['message'] for error in errors[index]))
+            return batch
+
+        pending = []
+        last_line = start_after_line
+        for line_number, record in self._records(lines, import_format):
+            if line_number <= start_after_line:
+                continue
+            last_line = line_number
+            pending.append((line_number, record))
+            if len(pending) >= self.batch_size:
+                flush(check(pending), line_number)
+                pending = []
+
+        flush(check(pending), last_line)
+        return progress
@@ -1,8 +1,55 @@
-import mysql.connector
-from utils.db_get_connection import get_connection
+import threading
+import time
+from utils.query_executor import executor
 from dto.catalog import Catalog
-from exception.catalog_exception import DataNotFoundError, DatabaseConnectionError
+from exception.catalog_exception import CatalogError, DataIntegrityError, DataNotFoundError, PreconditionFailedError, ValidationError
 from utils.logger import logger
+from utils.pagination import CURSOR_NEXT, CURSOR_PREV, decode_cursor, encode_cursor
+from utils.config import get_config
+from utils.search import build_boolean_query, escape_like
+from utils.cache import LRUCache
+from utils.query_cache import GenerationalQueryCache, build_query_cache_backend
+from utils.prefix_index import PrefixIndex
+
+# Ways of computing the total for a catalog listing page
+COUNT_EXACT = 'exact'
+COUNT_CAPPED = 'capped'
+COUNT_NONE = 'none'
+
+# Search backends: FULLTEXT index (see migrations/) or the legacy substring LIKE scan
+SEARCH_FULLTEXT = 'fulltext'
+SEARCH_LIKE = 'like'
+FULLTEXT_COLUMNS = "catalog_name, catalog_description"
+
+# Columns written by exports, in output order
+EXPORT_COLUMNS = ('catalog_id', 'catalog_name', 'catalog_description', 'start_date', 'end_date', 'status')
+# Columns a client may select with fields= (sparse fieldsets); catalog_id is always returned
+CATALOG_FIELDS = EXPORT_COLUMNS + ('user_id', 'version')
+# Columns a partial update may set (interpolated into SQL, so never taken from input as is)
+WRITABLE_COLUMNS = ('catalog_name', 'catalog_description', 'start_date', 'end_date', 'status')
+INSERT_CATALOG_QUERY = """
+    INSERT INTO catalog (catalog_name, catalog_description, start_date, end_date, status, user_id)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+# Current version of one catalog, read only to explain a failed single-row write
+CATALOG_VERSION_QUERY = "SELECT version FROM catalog WHERE catalog_id = %s"
+# Upper bound for keyset scans starting from the newest catalog (BIGINT max)
+MAX_CATALOG_ID = 2 ** 63 - 1
+# One keyset window of the names loaded into the suggestion index
+SUGGEST_INDEX_QUERY = "SELECT catalog_id, catalog_name FROM catalog WHERE catalog_id < %s ORDER BY catalog_id DESC LIMIT %s"
+
+def parse_fields(value: str | None) -> tuple | None:
+    """
+    Parses a comma-separated fields= parameter into the columns to select, catalog_id first.
+    Returns None (all columns) when the parameter is empty; unknown columns raise ValidationError.
+    """
+    requested = [field.strip() for field in (value or '').split(',') if field.strip()]
+    if not requested:
+        return None
+    unknown = [field for field in requested if field not in CATALOG_FIELDS]
+    if unknown:
+        raise ValidationError(f"Unknown field(s): {', '.join(unknown)}. Allowed fields are {', '.join(CATALOG_FIELDS)}.")
+    return ('catalog_id',) + tuple(dict.fromkeys(field for field in requested if field != 'catalog_id'))
 
 class CatalogService:
     """
@@ -11,160 +58,673 @@ class CatalogService:
     Logs key actions and errors for traceability.
     """
 
-    def _execute_query(self, query: str, params: tuple = None, fetch_one: bool = False, fetch_all: bool = False, commit: bool = False):
-        """
-        Internal helper to execute database queries, manage connections,
-        and handle common database exceptions.
-        Logs query execution results and errors.
-        """
-        conn = None
-        cursor = None
-        try:
-            conn = get_connection()
-            cursor = conn.cursor(dictionary=True) if fetch_one or fetch_all else conn.cursor()
-            cursor.execute(query, params or ())
-
-            if commit:
-                conn.commit()
-                result = cursor.lastrowid if 'INSERT' in query.upper() else cursor.rowcount
-                logger.debug(f"Executed query with commit: {query.strip()} | Params: {params} | Result: {result}")
-                return result
-            elif fetch_one:
-                result = cursor.fetchone()
-                logger.debug(f"Executed query (fetch_one): {query.strip()} | Params: {params} | Result: {result}")
-                return result
-            elif fetch_all:
-                result = cursor.fetchall()
-                logger.debug(f"Executed query (fetch_all): {query.strip()} | Params: {params} | Result count: {len(result)}")
-                return result
-            return None
-        except mysql.connector.Error as e:
-            logger.critical(f"MySQL Error: {e} | Query: {query.strip()} | Params: {params}", exc_info=True)
-            if conn and commit:
-                conn.rollback()
-            raise DatabaseConnectionError(f"Database error during operation: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error in _execute_query: {e}", exc_info=True)
-            raise Exception(f"An unexpected error occurred in service layer: {e}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+    def __init__(self):
+        self.db = executor
+        # Upper bound for COUNT_CAPPED totals (reported as "<count_cap>+")
+        self.count_cap = get_config().getint('catalog', 'count_cap', fallback=10000)
+        self.search_backend = get_config().get('search', 'backend', fallback=SEARCH_FULLTEXT)
+        # Must match the server's innodb_ft_min_token_size; shorter words are not indexed
+        self.min_token_size = get_config().getint('search', 'min_token_size', fallback=3)
+        # Read-through cache of catalog rows keyed by catalog_id, invalidated on update/delete.
+        # Off by default: it is per process, so writes through other worker processes are not seen
+        self.catalog_cache = LRUCache(
+            max_entries=get_config().getint('catalog_cache', 'max_entries', fallback=1024),
+            ttl=get_config().getfloat('catalog_cache', 'ttl', fallback=5)
+        ) if get_config().getboolean('catalog_cache', 'enabled', fallback=False) else None
+        # Bulk writes are split into statements/transactions of at most this many rows
+        self.bulk_chunk_size = get_config().getint('bulk', 'chunk_size', fallback=500)
+        # List/count results, all invalidated at once by any catalog write
+        self.query_cache = GenerationalQueryCache(
+            build_query_cache_backend(get_config()),
+            namespace='catalog_list',
+            ttl=get_config().getfloat('query_cache', 'ttl', fallback=30)
+        )
+        # Catalog names by prefix for /api/catalogs/suggest, kept current by the writes below
+        self.suggest_index = PrefixIndex()
+        self.suggest_limit = get_config().getint('suggest', 'limit', fallback=10)
+        self.suggest_max_limit = get_config().getint('suggest', 'max_limit', fallback=50)
+        # Seconds after which the index is rebuilt in the background (picks up writes made by other processes)
+        self.suggest_refresh_interval = get_config().getfloat('suggest', 'refresh_interval', fallback=300)
+        self._suggest_build_lock = threading.Lock()
+
+    def _invalidate_catalog(self, catalog_id: int) -> None:
+        """Drops cached state for a catalog after a write through this service."""
+        self._invalidate_catalogs([catalog_id])
+
+    def _invalidate_catalogs(self, catalog_ids: list) -> None:
+        """Drops cached state for several catalogs with a single query cache generation bump."""
+        if self.catalog_cache is not None:
+            for catalog_id in catalog_ids:
+                self.catalog_cache.delete(catalog_id)
+        self.query_cache.invalidate()
+
+    def cache_stats(self) -> dict:
+        """Returns hit/miss/eviction counters of the catalog entity cache."""
+        if self.catalog_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.catalog_cache.stats()}
+
+    def query_cache_stats(self) -> dict:
+        """Returns hit/miss/invalidation counters of the list/count query cache."""
+        return self.query_cache.stats()
+
+    def suggest_index_stats(self) -> dict:
+        """Returns the size and age of the suggestion prefix index."""
+        return self.suggest_index.stats()
 
     def create_catalog(self, catalog: Catalog, user_id: int) -> int:
         """
         Adds a new catalog entry to the database, associated with a user.
         Logs the creation action and the assigned catalog ID.
         """
-        logger.info(f"Creating new catalog for user_id={user_id} with name='{catalog.name}'")
-        query = """
-            INSERT INTO catalog (catalog_name, catalog_description, start_date, end_date, status, user_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
+        logger.info("Creating new catalog for user_id=%s with name='%s'", user_id, catalog.name)
+        query = INSERT_CATALOG_QUERY
         params = (catalog.name, catalog.description, catalog.start_date, catalog.end_date, catalog.status, user_id)
-        catalog_id = self._execute_query(query, params, commit=True)
-        logger.info(f"Catalog created successfully with ID {catalog_id}")
+        try:
+            catalog_id = self.db.insert(query, params)
+        finally:
+            self.query_cache.invalidate()
+        self.suggest_index.add(catalog_id, catalog.name)
+        logger.info("Catalog created successfully with ID %s", catalog_id)
         return catalog_id
 
     def get_catalog_by_id(self, catalog_id: int) -> dict:
         """
         Retrieves a single catalog entry by its ID.
         Logs the retrieval attempt and warns if the catalog is not found.
+        Served from the in-process entity cache when it is enabled; returns a copy the caller may modify.
         """
-        logger.info(f"Fetching catalog with ID {catalog_id}")
+        cache = self.catalog_cache
+        if cache is not None:
+            cached = cache.get(catalog_id)
+            if cached is not None:
+                return dict(cached)
+            generation = cache.generation()
+
+        logger.info("Fetching catalog with ID %s", catalog_id)
         query = "SELECT * FROM catalog WHERE catalog_id = %s"
         params = (catalog_id,)
         
-        catalog_data = self._execute_query(query, params, fetch_one=True)
+        catalog_data = self.db.fetch_one(query, params)
         if not catalog_data:
-            logger.warning(f"Catalog with ID {catalog_id} not found.")
+            logger.warning("Catalog with ID %s not found.", catalog_id)
             raise DataNotFoundError(f"Catalog with ID {catalog_id} not found.")
-        return catalog_data
+        if cache is not None:
+            # Not stored if an update/delete invalidated the cache while the row was being read
+            cache.set(catalog_id, catalog_data, generation=generation)
+        return dict(catalog_data)
 
-    def get_all_catalog(self, search_term: str = '', status_filter: str = None, page: int = 1, per_page: int = 10) -> list:
+    def _search_condition(self, search_term: str) -> tuple[str, list]:
         """
-        Retrieves paginated catalog entries with optional search and status filtering.
-        Logs the retrieval request parameters.
+        Builds the search part of the WHERE clause.
+        The fulltext backend matches exact catalog IDs plus word prefixes through the FULLTEXT index,
+        falling back to an index-friendly name prefix LIKE for terms too short to be indexed.
+        The like backend keeps the original substring match for databases without the index.
         """
-        logger.info(f"Retrieving all catalogs | search='{search_term}', status='{status_filter}', page={page}, per_page={per_page}")
-        query = "SELECT * FROM catalog WHERE 1=1"
+        if self.search_backend != SEARCH_FULLTEXT:
+            return ("(catalog_id = %s OR catalog_name LIKE %s OR catalog_description LIKE %s)",
+                    [search_term, f"%{search_term}%", f"%{search_term}%"])
+
+        clauses, params = [], []
+        if search_term.isdigit():
+            clauses.append("catalog_id = %s")
+            params.append(int(search_term))
+
+        boolean_query = build_boolean_query(search_term, self.min_token_size)
+        if boolean_query:
+            clauses.append(f"MATCH({FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE)")
+            params.append(boolean_query)
+        else:
+            clauses.append("catalog_name LIKE %s")
+            params.append(f"{escape_like(search_term)}%")
+
+        return f"({' OR '.join(clauses)})", params
+
+    def _build_filters(self, search_term: str = '', status_filter: str = None) -> tuple[str, list]:
+        """Builds the shared WHERE clause and its parameters for search and status filtering."""
+        where = "WHERE 1=1"
         params = []
 
         if search_term:
-            query += " AND (catalog_id = %s OR catalog_name LIKE %s OR catalog_description LIKE %s)"
-            params.extend([search_term, f"%{search_term}%", f"%{search_term}%"])
-        
+            condition, search_params = self._search_condition(search_term)
+            where += f" AND {condition}"
+            params.extend(search_params)
+
         if status_filter:
-            query += " AND status = %s"
+            where += " AND status = %s"
             params.append(status_filter)
 
-        query += " ORDER BY catalog_id DESC"
+        return where, params
+
+    def get_all_catalog(self, search_term: str = '', status_filter: str = None, page: int = 1, per_page: int = 10) -> list:
+        """
+        Retrieves paginated catalog entries with optional search and status filtering.
+        Logs the retrieval request parameters.
+        """
+        logger.info("Retrieving all catalogs | search='%s', status='%s', page=%s, per_page=%s", search_term, status_filter, page, per_page)
+        where, params = self._build_filters(search_term, status_filter)
+        query = f"SELECT * FROM catalog {where} ORDER BY catalog_id DESC LIMIT %s OFFSET %s"
         offset = (page - 1) * per_page
-        query += " LIMIT %s OFFSET %s"
         params.extend([per_page, offset])
 
-        return self._execute_query(query, tuple(params), fetch_all=True)
+        return self.db.fetch_all(query, tuple(params))
+
+    def get_catalogs_page(self, search_term: str = '', status_filter: str = None, page: int = 1,
+                          per_page: int = 10, cursor: str = None, count_mode: str = COUNT_EXACT,
+                          order_by_relevance: bool = False, fields: tuple = None) -> dict:
+        """
+        Retrieves one page of catalogs together with opaque cursors for the next and previous pages.
+        With a cursor the page is located by catalog_id (keyset pagination), so deep pages cost the
+        same as the first one; the cursor also carries the search and status filters it was issued for.
+        Without a cursor, page/per_page offsets are used.
+
+        The total number of matches is computed in the same round trip as the page. count_mode is
+        COUNT_EXACT, COUNT_CAPPED (stop counting past count_cap and flag the total as capped) or
+        COUNT_NONE (skip counting; total_catalogs is None).
+
+        order_by_relevance sorts full-text search results by match score instead of catalog_id.
+        Relevance-ordered pages are addressed by page number only, so no cursors are returned.
+
+        fields (see parse_fields) limits the selected columns; None selects them all. Rows are
+        returned as tuples in "catalogs", with their column names in "columns".
+        Results are served from the query cache until the next catalog write.
+        """
+        cache_key = ('page', search_term, status_filter, page, per_page, cursor, count_mode, order_by_relevance, fields)
+        return dict(self.query_cache.get_or_load(cache_key, lambda: self._load_catalogs_page(
+            search_term, status_filter, page, per_page, cursor, count_mode, order_by_relevance, fields)))
+
+    def _load_catalogs_page(self, search_term: str, status_filter: str, page: int, per_page: int,
+                            cursor: str, count_mode: str, order_by_relevance: bool, fields: tuple) -> dict:
+        """Runs the page (+ count) query for get_catalogs_page on a query cache miss."""
+        plan = self._page_plan(search_term, status_filter, page, per_page, cursor, count_mode, order_by_relevance, fields)
+        return self._page_result(plan, *self.db.fetch_rows(plan['query'], plan['params']))
+
+    def _page_plan(self, search_term: str, status_filter: str, page: int, per_page: int,
+                   cursor: str, count_mode: str, order_by_relevance: bool, fields: tuple = None) -> dict:
+        """
+        Builds the single page (+ count) query of get_catalogs_page, together with what
+        _page_result needs to shape its rows. Shared with AsyncCatalogService.
+        """
+        position = decode_cursor(cursor) if cursor else None
+        if position:
+            search_term, status_filter = position['search_term'], position['status_filter']
+        logger.info("Retrieving catalog page | search='%s', status='%s', page=%s, per_page=%s, cursor=%s, count=%s", search_term, status_filter, page, per_page, position, count_mode)
+
+        relevance_query = None
+        if order_by_relevance and search_term and not position and self.search_backend == SEARCH_FULLTEXT:
+            relevance_query = build_boolean_query(search_term, self.min_token_size)
+
+        where, filter_params = self._build_filters(search_term, status_filter)
+        params = list(filter_params)
+        select = ', '.join(fields) if fields else '*'
+        if position and position['direction'] == CURSOR_NEXT:
+            page_query = f"SELECT {select} FROM catalog {where} AND catalog_id < %s ORDER BY catalog_id DESC LIMIT %s"
+            params.extend([position['last_id'], per_page + 1])
+        elif position:
+            page_query = f"SELECT {select} FROM catalog {where} AND catalog_id > %s ORDER BY catalog_id ASC LIMIT %s"
+            params.extend([position['last_id'], per_page + 1])
+        elif relevance_query:
+            page_query = (f"SELECT {select}, MATCH({FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE) AS relevance "
+                          f"FROM catalog {where} ORDER BY relevance DESC, catalog_id DESC LIMIT %s OFFSET %s")
+            params = [relevance_query] + params + [per_page + 1, (page - 1) * per_page]
+        else:
+            page_query = f"SELECT {select} FROM catalog {where} ORDER BY catalog_id DESC LIMIT %s OFFSET %s"
+            params.extend([per_page + 1, (page - 1) * per_page])
+        order = "ASC" if position and position['direction'] == CURSOR_PREV else "DESC"
+        outer_order = f"c.relevance DESC, c.catalog_id {order}" if relevance_query else f"c.catalog_id {order}"
+
+        if count_mode == COUNT_NONE:
+            query = page_query
+        else:
+            if count_mode == COUNT_CAPPED:
+                count_query = f"SELECT COUNT(*) AS total_count FROM (SELECT 1 FROM catalog {where} LIMIT %s) AS capped"
+                count_params = filter_params + [self.count_cap + 1]
+            else:
+                count_query = f"SELECT COUNT(*) AS total_count FROM catalog {where}"
+                count_params = filter_params
+            # LEFT JOIN keeps the count row even when the page itself is empty
+            query = f"""
+                SELECT t.total_count, c.*
+                FROM ({count_query}) AS t
+                LEFT JOIN ({page_query}) AS c ON TRUE
+                ORDER BY {outer_order}
+            """
+            params = count_params + params
+        return {
+            "query": query, "params": tuple(params), "position": position, "search_term": search_term,
+            "status_filter": status_filter, "page": page, "per_page": per_page, "count_mode": count_mode,
+            "relevance": bool(relevance_query),
+        }
+
+    def _page_result(self, plan: dict, columns: tuple, rows: list) -> dict:
+        """Turns the tuple rows (and column names) of a _page_plan query into the get_catalogs_page result."""
+        position, search_term, status_filter = plan['position'], plan['search_term'], plan['status_filter']
+        page, per_page, count_mode, relevance_query = plan['page'], plan['per_page'], plan['count_mode'], plan['relevance']
+
+        # Leading total_count and trailing relevance columns are not part of the catalogs
+        start = 1 if count_mode != COUNT_NONE else 0
+        end = -1 if relevance_query else None
+        columns = columns[start:end]
+        id_index = columns.index('catalog_id')
+
+        total = None
+        if count_mode != COUNT_NONE:
+            total = rows[0][0] if rows else 0
+            if rows and rows[0][start + id_index] is None:
+                rows = []
+        if start or end:
+            rows = [row[start:end] for row in rows]
+
+        # One extra row tells whether another page exists in the direction of travel
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        if position and position['direction'] == CURSOR_PREV:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        elif position:
+            has_next, has_prev = has_more, True
+        else:
+            has_next, has_prev = has_more, page > 1
+
+        if relevance_query:
+            # Relevance order is not keyed on catalog_id, so catalog_id cursors would not apply
+            has_next = has_prev = False
+
+        total_capped = count_mode == COUNT_CAPPED and total is not None and total > self.count_cap
+        return {
+            "catalogs": rows,
+            "columns": columns,
+            "search_term": search_term,
+            "status_filter": status_filter,
+            "total_catalogs": self.count_cap if total_capped else total,
+            "total_capped": total_capped,
+            "next_cursor": encode_cursor(rows[-1][id_index], CURSOR_NEXT, search_term, status_filter)
+                           if rows and has_next else None,
+            "prev_cursor": encode_cursor(rows[0][id_index], CURSOR_PREV, search_term, status_filter)
+                           if rows and has_prev else None,
+        }
 
     def count_catalogs(self, search_term: str = '', status_filter: str = None) -> int:
         """
         Counts total catalog entries matching search and status filters.
         Logs the count query parameters and the resulting count.
+        Results are served from the query cache until the next catalog write.
         """
-        logger.info(f"Counting catalogs | search='{search_term}', status='{status_filter}'")
-        query = "SELECT COUNT(*) FROM catalog WHERE 1=1"
-        params = []
+        return self.query_cache.get_or_load(('count', search_term, status_filter),
+                                            lambda: self._load_catalog_count(search_term, status_filter))
 
-        if search_term:
-            query += " AND (catalog_id = %s OR catalog_name LIKE %s OR catalog_description LIKE %s)"
-            params.extend([search_term, f"%{search_term}%", f"%{search_term}%"])
-        
-        if status_filter:
-            query += " AND status = %s"
-            params.append(status_filter)
+    def _load_catalog_count(self, search_term: str, status_filter: str) -> int:
+        """Runs the COUNT(*) query for count_catalogs on a query cache miss."""
+        logger.info("Counting catalogs | search='%s', status='%s'", search_term, status_filter)
+        where, params = self._build_filters(search_term, status_filter)
+        query = f"SELECT COUNT(*) FROM catalog {where}"
 
-        result = self._execute_query(query, tuple(params), fetch_one=True)
-        count = result['COUNT(*)'] if result else 0
-        logger.debug(f"Total catalogs matched: {count}")
+        result = self.db.fetch_one(query, tuple(params), row_factory=tuple)
+        count = result[0] if result else 0
+        logger.debug("Total catalogs matched: %s", count)
         return count
 
-    def update_catalog_by_id(self, catalog_id: int, catalog: Catalog) -> bool:
+    # --- Single-row writes (statement builders are shared with AsyncCatalogService) ---
+    def _write_condition(self, catalog_id: int, expected_version: int = None) -> tuple[str, list]:
+        """Builds the WHERE clause of a single-row write, matching the client's version when one is given."""
+        if expected_version is None:
+            return "WHERE catalog_id = %s", [catalog_id]
+        return "WHERE catalog_id = %s AND version = %s", [catalog_id, expected_version]
+
+    def _update_statement(self, catalog_id: int, values: dict, expected_version: int = None,
+                          partial: bool = False) -> tuple[str, tuple, bool]:
         """
-        Updates an existing catalog entry identified by its ID.
-        Logs update attempts and success or warning if no rows affected.
+        Builds the single UPDATE writing values (keyed by column) that also bumps the row version.
+        LAST_INSERT_ID(expr) reports the bumped value back in the statement's OK packet (it stays 0 when
+        no row matched), so no follow-up SELECT is needed. When a partial update changes only one of the
+        dates, the statement itself requires it to stay ordered against the stored date.
+        Returns (query, params, checked_dates).
         """
-        logger.info(f"Updating catalog ID {catalog_id}")
-        self.get_catalog_by_id(catalog_id)
+        if not values or any(column not in WRITABLE_COLUMNS for column in values):
+            raise ValidationError(f"A catalog update may only set: {', '.join(WRITABLE_COLUMNS)}.")
+        where, params = self._write_condition(catalog_id, expected_version)
+        condition = ''
+        if partial and 'start_date' in values and 'end_date' not in values:
+            condition = " AND end_date >= %s"
+            params.append(values['start_date'])
+        elif partial and 'end_date' in values and 'start_date' not in values:
+            condition = " AND start_date <= %s"
+            params.append(values['end_date'])
+
+        assignments = ', '.join(f"{column} = %s" for column in values)
+        query = f"UPDATE catalog SET {assignments}, version = LAST_INSERT_ID(version + 1) {where}{condition}"
+        return query, tuple(values.values()) + tuple(params), bool(condition)
+
+    @staticmethod
+    def _catalog_values(catalog: Catalog) -> dict:
+        """Returns the writable columns of a Catalog DTO, keyed by column name."""
+        return {'catalog_name': catalog.name, 'catalog_description': catalog.description,
+                'start_date': catalog.start_date, 'end_date': catalog.end_date, 'status': catalog.status}
 
+    def _write_failure(self, row: dict, catalog_id: int, expected_version: int, action: str,
+                       checked_dates: bool = False) -> CatalogError:
+        """
+        Explains why a single-row write matched no row, given the catalog's current version row
+        (CATALOG_VERSION_QUERY, None if missing). Only used on that failure path, so successful writes
+        stay at one statement: the catalog is either gone, at another version, or (checked_dates,
+        for partial updates) the new date conflicts with the stored one. Returns the error to raise.
+        """
+        if not row:
+            logger.warning("Catalog with ID %s not found for %s.", catalog_id, action)
+            return DataNotFoundError(f"Catalog with ID {catalog_id} not found for {action}.")
+        if expected_version is not None and row['version'] != expected_version:
+            logger.warning("Version conflict on %s of catalog ID %s: expected %s, found %s", action, catalog_id, expected_version, row['version'])
+            return PreconditionFailedError(
+                f"Catalog ID {catalog_id} was modified by someone else (version {row['version']}, expected {expected_version}). "
+                "Reload it and try again.")
+        if checked_dates:
+            return ValidationError("End Date cannot be before Start Date.")
+        return PreconditionFailedError(f"Catalog ID {catalog_id} changed during the {action}. Reload it and try again.")
+
+    def _update_returning_version(self, catalog_id: int, values: dict, expected_version: int = None,
+                                  partial: bool = False) -> int:
+        """Runs the UPDATE built by _update_statement and returns the catalog's new version."""
+        query, params, checked_dates = self._update_statement(catalog_id, values, expected_version, partial)
+        try:
+            new_version = self.db.insert(query, params)
+        finally:
+            self._invalidate_catalog(catalog_id)
+        if not new_version:
+            row = self.db.fetch_one(CATALOG_VERSION_QUERY, (catalog_id,))
+            raise self._write_failure(row, catalog_id, expected_version, 'update', checked_dates)
+        return new_version
+
+    def update_catalog_by_id(self, catalog_id: int, catalog: Catalog, expected_version: int = None) -> int:
+        """
+        Updates an existing catalog entry identified by its ID with a single statement.
+        With expected_version the update only applies if the row is still at that version
+        (PreconditionFailedError otherwise). Returns the catalog's new version.
+        """
+        logger.info("Updating catalog ID %s (expected version %s)", catalog_id, expected_version)
+        version = self._update_returning_version(catalog_id, self._catalog_values(catalog), expected_version)
+        self.suggest_index.add(catalog_id, catalog.name)
+        logger.info("Catalog ID %s updated successfully to version %s.", catalog_id, version)
+        return version
+
+    def patch_catalog_by_id(self, catalog_id: int, changes: dict, expected_version: int = None) -> int:
+        """
+        Updates only the given columns (validated values keyed by column name, see validate_catalog_patch)
+        with a single statement. Returns the catalog's new version.
+        """
+        logger.info("Patching catalog ID %s columns %s (expected version %s)", catalog_id, sorted(changes), expected_version)
+        version = self._update_returning_version(catalog_id, changes, expected_version, partial=True)
+        if 'catalog_name' in changes:
+            self.suggest_index.add(catalog_id, changes['catalog_name'])
+        logger.info("Catalog ID %s patched successfully to version %s.", catalog_id, version)
+        return version
+
+    def delete_catalog_by_id(self, catalog_id: int, expected_version: int = None) -> bool:
+        """
+        Deletes a catalog entry by its ID with a single statement.
+        With expected_version the row is only deleted if it is still at that version
+        (PreconditionFailedError otherwise).
+        """
+        logger.info("Deleting catalog ID %s (expected version %s)", catalog_id, expected_version)
+        where, params = self._write_condition(catalog_id, expected_version)
+
+        try:
+            row_count = self.db.execute(f"DELETE FROM catalog {where}", tuple(params))
+        finally:
+            self._invalidate_catalog(catalog_id)
+        if row_count == 0:
+            row = self.db.fetch_one(CATALOG_VERSION_QUERY, (catalog_id,))
+            raise self._write_failure(row, catalog_id, expected_version, 'deletion')
+        self.suggest_index.remove(catalog_id)
+        logger.info("Catalog ID %s deleted successfully.", catalog_id)
+        return True
+
+    # --- Export ---
+    def iter_catalog_batches(self, search_term: str = '', status_filter: str = None, batch_size: int = 1000):
+        """
+        Yields every catalog matching the filters as lists of row tuples (EXPORT_COLUMNS order),
+        newest first. Rows are read in keyset windows of batch_size (WHERE catalog_id < last seen id),
+        each on a briefly borrowed pooled connection, so memory stays flat and a slow consumer
+        never holds a database connection between batches.
+        """
+        logger.info("Exporting catalogs | search='%s', status='%s', batch_size=%s", search_term, status_filter, batch_size)
+        where, params = self._build_filters(search_term, status_filter)
+        query = (f"SELECT {', '.join(EXPORT_COLUMNS)} FROM catalog {where} AND catalog_id < %s "
+                 f"ORDER BY catalog_id DESC LIMIT %s")
+
+        last_id = MAX_CATALOG_ID
+        exported = 0
+        while True:
+            rows = self.db.fetch_all(query, tuple(params + [last_id, batch_size]), row_factory=tuple)
+            if not rows:
+                break
+            exported += len(rows)
+            yield rows
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1][0]
+        logger.info("Export finished: %s catalogs.", exported)
+
+    # --- Suggestions ---
+    def iter_catalog_names(self, batch_size: int = 1000):
+        """Yields every (catalog_id, catalog_name) pair as lists of tuples, in keyset windows of batch_size."""
+        last_id = MAX_CATALOG_ID
+        while True:
+            rows = self.db.fetch_all(SUGGEST_INDEX_QUERY, (last_id, batch_size), row_factory=tuple)
+            if rows:
+                yield rows
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1][0]
+
+    def build_suggest_index(self, batch_size: int = 1000) -> int:
+        """
+        (Re)builds the suggestion index in one streaming pass over the catalog table (keyset batches,
+        as for exports). Returns the number of indexed catalogs.
+        """
+        with self._suggest_build_lock:
+            return self._build_suggest_index(self.iter_catalog_names(batch_size))
+
+    def _build_suggest_index(self, batches) -> int:
+        """Loads the index from batches of catalog rows; the caller holds _suggest_build_lock."""
+        started = time.perf_counter()
+        count = self.suggest_index.build(batches)
+        logger.info("Suggestion index built: %s catalogs in %.1f ms.", count, (time.perf_counter() - started) * 1000)
+        return count
+
+    def _refresh_suggest_index(self) -> None:
+        """Rebuilds a stale index on a background thread, unless a build is already running."""
+        if not self._suggest_build_lock.acquire(blocking=False):
+            return
+
+        def rebuild():
+            try:
+                self._build_suggest_index(self.iter_catalog_names())
+            except Exception as e:
+                logger.error("Could not refresh the suggestion index: %s", e)
+            finally:
+                self._suggest_build_lock.release()
+        threading.Thread(target=rebuild, name='suggest-index-refresh', daemon=True).start()
+
+    def _ensure_suggest_index(self) -> None:
+        """Builds the index on first use in a process that did not build it at startup; refreshes a stale one."""
+        index = self.suggest_index
+        if not index.ready:
+            with self._suggest_build_lock:
+                if not index.ready:
+                    self._build_suggest_index(self.iter_catalog_names())
+        elif self.suggest_refresh_interval and time.time() - index.built_at > self.suggest_refresh_interval:
+            self._refresh_suggest_index()
+
+    def suggest_catalogs(self, prefix: str, limit: int = None) -> list:
+        """
+        Returns up to limit {"catalog_id", "catalog_name"} dicts whose name starts with prefix
+        (case-insensitive), in name order, from the in-memory index. Only a process that has not
+        built the index yet reads the table first; a stale index keeps answering while it is rebuilt.
+        """
+        limit = min(max(limit or self.suggest_limit, 1), self.suggest_max_limit)
+        self._ensure_suggest_index()
+        return [{"catalog_id": catalog_id, "catalog_name": name}
+                for catalog_id, name in self.suggest_index.search(prefix, limit)]
+
+    # --- Bulk operations ---
+    def _chunks(self, items: list):
+        """Yields (start_index, chunk) pairs of at most bulk_chunk_size items."""
+        for start in range(0, len(items), self.bulk_chunk_size):
+            yield start, items[start:start + self.bulk_chunk_size]
+
+    def _existing_catalog_ids(self, catalog_ids: list, lock: bool = False) -> set:
+        """Returns which of catalog_ids exist, optionally locking those rows for the current transaction."""
+        placeholders = ', '.join(['%s'] * len(catalog_ids))
+        query = f"SELECT catalog_id FROM catalog WHERE catalog_id IN ({placeholders})"
+        if lock:
+            query += " FOR UPDATE"
+        return {row[0] for row in self.db.fetch_all(query, tuple(catalog_ids), row_factory=tuple)}
+
+    def bulk_create_catalogs(self, catalogs: list, user_id: int, atomic: bool = True) -> list:
+        """
+        Inserts many catalogs using one multi-row INSERT per chunk.
+        atomic=True writes every chunk in a single transaction (all or nothing, errors propagate);
+        atomic=False commits chunk by chunk and, when the database rejects a chunk's data (DataIntegrityError),
+        retries it row by row in one transaction so only the bad rows fail. Any other database error
+        (outage, broken connection, pool timeout) propagates; chunks committed before it stay committed.
+        Returns one result dict per input catalog: {"status": "created", "catalog_id": ...} or
+        {"status": "error", "error": ...}.
+        """
+        logger.info("Bulk creating %s catalogs for user_id=%s (atomic=%s)", len(catalogs), user_id, atomic)
+        query = INSERT_CATALOG_QUERY
+        results = [None] * len(catalogs)
+
+        def insert_chunk(start: int, chunk: list) -> None:
+            rows = [(c.name, c.description, c.start_date, c.end_date, c.status, user_id) for c in chunk]
+            first_id = self.db.insert_many(query, rows)
+            for offset in range(len(chunk)):
+                results[start + offset] = {"status": "created", "catalog_id": first_id + offset}
+
+        try:
+            if atomic:
+                with self.db.transaction():
+                    for start, chunk in self._chunks(catalogs):
+                        insert_chunk(start, chunk)
+            else:
+                for start, chunk in self._chunks(catalogs):
+                    try:
+                        with self.db.transaction():
+                            insert_chunk(start, chunk)
+                    except DataIntegrityError:
+                        logger.warning("Bulk insert chunk at index %s was rejected; retrying row by row.", start)
+                        # A rejected INSERT is rolled back on its own, so the good rows commit together
+                        with self.db.transaction():
+                            for offset, catalog in enumerate(chunk):
+                                try:
+                                    catalog_id = self.db.insert(query, (catalog.name, catalog.description, catalog.start_date,
+                                                                        catalog.end_date, catalog.status, user_id))
+                                    results[start + offset] = {"status": "created", "catalog_id": catalog_id}
+                                except DataIntegrityError as e:
+                                    results[start + offset] = {"status": "error", "error": str(e)}
+        finally:
+            self.query_cache.invalidate()
+
+        for catalog, result in zip(catalogs, results):
+            if result and result['status'] == 'created':
+                self.suggest_index.add(result['catalog_id'], catalog.name)
+        created = sum(1 for r in results if r and r['status'] == 'created')
+        logger.info("Bulk create finished: %s/%s catalogs created.", created, len(catalogs))
+        return results
+
+    def bulk_update_catalogs(self, updates: list, atomic: bool = True) -> list:
+        """
+        Updates many catalogs given as (catalog_id, Catalog) pairs, one transaction per chunk
+        (or one transaction overall when atomic). Existing rows are locked with a single
+        SELECT ... FOR UPDATE per chunk, then updated one statement per row.
+        In atomic mode any missing ID raises DataNotFoundError and nothing is written. Otherwise a chunk
+        whose data the database rejects (DataIntegrityError) is reported as failed and the next chunk is tried;
+        any other database error propagates, and chunks committed before it stay committed.
+        Returns one result dict per input: {"status": "updated" | "not_found" | "error", "catalog_id": ...}.
+        """
+        logger.info("Bulk updating %s catalogs (atomic=%s)", len(updates), atomic)
         query = """
             UPDATE catalog
             SET catalog_name = %s, catalog_description = %s,
-                start_date = %s, end_date = %s, status = %s
+                start_date = %s, end_date = %s, status = %s, version = version + 1
             WHERE catalog_id = %s
         """
-        params = (catalog.name, catalog.description, catalog.start_date, catalog.end_date, catalog.status, catalog_id)
-        
-        row_count = self._execute_query(query, params, commit=True)
-        if row_count == 0:
-            logger.warning(f"No rows updated for catalog ID {catalog_id}")
-            raise DataNotFoundError(f"Catalog with ID {catalog_id} not found for update.")
-        logger.info(f"Catalog ID {catalog_id} updated successfully.")
-        return True
+        results = [None] * len(updates)
+
+        def update_chunk(start: int, chunk: list) -> None:
+            existing = self._existing_catalog_ids([catalog_id for catalog_id, _ in chunk], lock=True)
+            missing = [catalog_id for catalog_id, _ in chunk if catalog_id not in existing]
+            if atomic and missing:
+                raise DataNotFoundError(f"Catalogs not found for update: {', '.join(map(str, missing))}.")
+            for offset, (catalog_id, catalog) in enumerate(chunk):
+                if catalog_id in existing:
+                    self.db.execute(query, (catalog.name, catalog.description, catalog.start_date,
+                                            catalog.end_date, catalog.status, catalog_id))
+                    results[start + offset] = {"status": "updated", "catalog_id": catalog_id}
+                else:
+                    results[start + offset] = {"status": "not_found", "catalog_id": catalog_id}
+
+        try:
+            if atomic:
+                with self.db.transaction():
+                    for start, chunk in self._chunks(updates):
+                        update_chunk(start, chunk)
+            else:
+                for start, chunk in self._chunks(updates):
+                    try:
+                        with self.db.transaction():
+                            update_chunk(start, chunk)
+                    except DataIntegrityError as e:
+                        for offset, (catalog_id, _) in enumerate(chunk):
+                            results[start + offset] = {"status": "error", "catalog_id": catalog_id, "error": str(e)}
+        finally:
+            self._invalidate_catalogs([catalog_id for catalog_id, _ in updates])
 
-    def delete_catalog_by_id(self, catalog_id: int) -> bool:
+        for (catalog_id, catalog), result in zip(updates, results):
+            if result['status'] == 'updated':
+                self.suggest_index.add(catalog_id, catalog.name)
+        return results
+
+    def bulk_delete_catalogs(self, catalog_ids: list, atomic: bool = True) -> list:
         """
-        Deletes a catalog entry by its ID.
-        Logs deletion attempts and success or warning if no rows affected.
+        Deletes many catalogs with one DELETE ... WHERE catalog_id IN (...) per chunk.
+        In atomic mode any missing ID raises DataNotFoundError and nothing is deleted. Otherwise a chunk
+        the database rejects (DataIntegrityError, e.g. a row still referenced elsewhere) is reported as failed
+        and the next chunk is tried; any other database error propagates, and chunks committed before it stay committed.
+        Returns one result dict per input ID: {"status": "deleted" | "not_found" | "error", "catalog_id": ...}.
         """
-        logger.info(f"Deleting catalog ID {catalog_id}")
-        self.get_catalog_by_id(catalog_id)
+        logger.info("Bulk deleting %s catalogs (atomic=%s)", len(catalog_ids), atomic)
+        results = [None] * len(catalog_ids)
 
-        query = "DELETE FROM catalog WHERE catalog_id = %s"
-        params = (catalog_id,)
+        def delete_chunk(start: int, chunk: list) -> None:
+            existing = self._existing_catalog_ids(chunk, lock=True)
+            missing = [catalog_id for catalog_id in chunk if catalog_id not in existing]
+            if atomic and missing:
+                raise DataNotFoundError(f"Catalogs not found for deletion: {', '.join(map(str, missing))}.")
+            if existing:
+                placeholders = ', '.join(['%s'] * len(existing))
+                self.db.execute(f"DELETE FROM catalog WHERE catalog_id IN ({placeholders})", tuple(sorted(existing)))
+            for offset, catalog_id in enumerate(chunk):
+                results[start + offset] = {"status": "deleted" if catalog_id in existing else "not_found",
+                                           "catalog_id": catalog_id}
 
-        row_count = self._execute_query(query, params, commit=True)
-        if row_count == 0:
-            logger.warning(f"No rows deleted for catalog ID {catalog_id}")
-            raise DataNotFoundError(f"Catalog with ID {catalog_id} not found for deletion.")
-        logger.info(f"Catalog ID {catalog_id} deleted successfully.")
-        return True
+        try:
+            if atomic:
+                with self.db.transaction():
+                    for start, chunk in self._chunks(catalog_ids):
+                        delete_chunk(start, chunk)
+            else:
+                for start, chunk in self._chunks(catalog_ids):
+                    try:
+                        with self.db.transaction():
+                            delete_chunk(start, chunk)
+                    except DataIntegrityError as e:
+                        for offset, catalog_id in enumerate(chunk):
+                            results[start + offset] = {"status": "error", "catalog_id": catalog_id, "error": str(e)}
+        finally:
+            self._invalidate_catalogs(catalog_ids)
+
+        for result in results:
+            if result['status'] == 'deleted':
+                self.suggest_index.remove(result['catalog_id'])
+        return results
@@ -1,9 +1,19 @@
-import mysql.connector
-from utils.db_get_connection import get_connection
+import copy
+from utils.query_executor import executor
 from dto.user import User
-from exception.catalog_exception import DataNotFoundError, DatabaseConnectionError
+from utils.cache import LRUCache
+from utils.config import get_config
 from utils.logger import logger
 
+USER_SELECT = "SELECT user_id, username, email, password_hash, created_at FROM users"
+# A username match wins over an email match if the identifier matches two different users
+USER_BY_USERNAME_OR_EMAIL_QUERY = f"""
+    {USER_SELECT}
+    WHERE username = %s OR email = %s
+    ORDER BY username = %s DESC
+    LIMIT 1
+"""
+
 class UserService:
     """
     Service layer for User operations, interacting with the database.
@@ -11,109 +21,117 @@ class UserService:
     Logs key user-related actions and errors.
     """
 
-    def _execute_query(self, query: str, params: tuple = None, fetch_one: bool = False, fetch_all: bool = False, commit: bool = False):
-        """
-        Internal helper to execute database queries, manage connections,
-        and handle common database exceptions.
-        Logs query execution details.
-        """
-        conn = None
-        cursor = None
-        try:
-            conn = get_connection()
-            cursor = conn.cursor(dictionary=True) if fetch_one or fetch_all else conn.cursor()
-            cursor.execute(query, params or ())
+    def __init__(self):
+        self.db = executor
+        # Process-wide cache of user records resolved from JWT identities (user_id -> User)
+        self.user_cache = LRUCache(
+            max_entries=get_config().getint('user_cache', 'max_entries', fallback=1024),
+            ttl=get_config().getfloat('user_cache', 'ttl', fallback=300)
+        )
 
-            if commit:
-                conn.commit()
-                result = cursor.lastrowid if 'INSERT' in query.upper() else cursor.rowcount
-                logger.debug(f"Executed query with commit: {query.strip()} | Params: {params} | Result: {result}")
-                return result
-            elif fetch_one:
-                result = cursor.fetchone()
-                logger.debug(f"Executed query (fetch_one): {query.strip()} | Params: {params} | Result: {result}")
-                return result
-            elif fetch_all:
-                result = cursor.fetchall()
-                logger.debug(f"Executed query (fetch_all): {query.strip()} | Params: {params} | Result count: {len(result)}")
-                return result
-            return None
-        except mysql.connector.Error as e:
-            logger.critical(f"MySQL Error: {e} | Query: {query.strip()} | Params: {params}", exc_info=True)
-            if conn and commit:
-                conn.rollback()
-            raise DatabaseConnectionError(f"Database error during operation: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error in _execute_query: {e}", exc_info=True)
-            raise Exception(f"An unexpected error occurred in service layer: {e}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+    def _fetch_user(self, query: str, params: tuple) -> User | None:
+        """Runs a USER_SELECT query and builds the User straight from the tuple row."""
+        row = self.db.fetch_one(query, params, row_factory=tuple)
+        return User.from_tuple(row) if row else None
 
     def get_user_by_username(self, username: str) -> User | None:
         """Retrieves a user by their username."""
-        logger.info(f"Fetching user by username: {username}")
-        query = "SELECT user_id, username, email, password_hash, created_at FROM users WHERE username = %s"
+        logger.info("Fetching user by username: %s", username)
+        query = f"{USER_SELECT} WHERE username = %s"
         params = (username,)
-        user_data = self._execute_query(query, params, fetch_one=True)
-        if user_data:
-            logger.debug(f"User found: {user_data}")
+        user = self._fetch_user(query, params)
+        if user:
+            logger.debug("User found: %s", user.user_id)
         else:
-            logger.warning(f"No user found with username: {username}")
-        return User(
-            user_id=user_data['user_id'],
-            username=user_data['username'],
-            email=user_data['email'],
-            password_hash=user_data['password_hash'],
-            created_at=user_data['created_at']
-        ) if user_data else None
+            logger.warning("No user found with username: %s", username)
+        return user
 
     def get_user_by_email(self, email: str) -> User | None:
         """Retrieves a user by their email."""
-        logger.info(f"Fetching user by email: {email}")
-        query = "SELECT user_id, username, email, password_hash, created_at FROM users WHERE email = %s"
+        logger.info("Fetching user by email: %s", email)
+        query = f"{USER_SELECT} WHERE email = %s"
         params = (email,)
-        user_data = self._execute_query(query, params, fetch_one=True)
-        if user_data:
-            logger.debug(f"User found: {user_data}")
+        user = self._fetch_user(query, params)
+        if user:
+            logger.debug("User found: %s", user.user_id)
         else:
-            logger.warning(f"No user found with email: {email}")
-        return User(
-            user_id=user_data['user_id'],
-            username=user_data['username'],
-            email=user_data['email'],
-            password_hash=user_data['password_hash'],
-            created_at=user_data['created_at']
-        ) if user_data else None
+            logger.warning("No user found with email: %s", email)
+        return user
+
+    def get_user_by_username_or_email(self, username_or_email: str) -> User | None:
+        """
+        Retrieves a user whose username or email matches, in a single query.
+        A username match wins over an email match if the identifier matches two different users.
+        """
+        logger.info("Fetching user by username or email: %s", username_or_email)
+        query = USER_BY_USERNAME_OR_EMAIL_QUERY
+        params = (username_or_email, username_or_email, username_or_email)
+        user = self._fetch_user(query, params)
+        if user:
+            logger.debug("User found: %s", user.user_id)
+        else:
+            logger.warning("No user found with username or email: %s", username_or_email)
+        return user
 
     def get_user_by_id(self, user_id: int) -> User | None:
         """Retrieves a user by their ID."""
-        logger.info(f"Fetching user by ID: {user_id}")
-        query = "SELECT user_id, username, email, password_hash, created_at FROM users WHERE user_id = %s"
+        logger.info("Fetching user by ID: %s", user_id)
+        query = f"{USER_SELECT} WHERE user_id = %s"
         params = (user_id,)
-        user_data = self._execute_query(query, params, fetch_one=True)
-        if user_data:
-            logger.debug(f"User found: {user_data}")
+        user = self._fetch_user(query, params)
+        if user:
+            logger.debug("User found: %s", user.user_id)
         else:
-            logger.warning(f"No user found with ID: {user_id}")
-        return User(
-            user_id=user_data['user_id'],
-            username=user_data['username'],
-            email=user_data['email'],
-            password_hash=user_data['password_hash'],
-            created_at=user_data['created_at']
-        ) if user_data else None
+            logger.warning("No user found with ID: %s", user_id)
+        return user
+
+    def get_user_by_id_cached(self, user_id: int) -> User | None:
+        """
+        Retrieves a user by ID through the in-process user cache; returns a copy the caller may modify.
+        Only for resolving authenticated identities: login always reads the current password hash.
+        """
+        cached = self.user_cache.get(user_id)
+        if cached is None:
+            cached = self.get_user_by_id(user_id)
+            if cached is None:
+                return None
+            self.user_cache.set(user_id, cached)
+        return copy.copy(cached)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drops a user from the in-process cache after the record changed."""
+        self.user_cache.delete(user_id)
+
+    def user_cache_stats(self) -> dict:
+        """Returns hit/miss/eviction counters of the user cache."""
+        return self.user_cache.stats()
 
     def create_user(self, user: User) -> int:
         """Adds a new user to the database."""
-        logger.info(f"Creating new user: {user.username}")
+        logger.info("Creating new user: %s", user.username)
         query = """
             INSERT INTO users (username, password_hash, email)
             VALUES (%s, %s, %s)
         """
         params = (user.username, user.password_hash, user.email)
-        user_id = self._execute_query(query, params, commit=True)
-        logger.info(f"User created successfully with ID {user_id}")
+        user_id = self.db.insert(query, params)
+        logger.info("User created successfully with ID %s", user_id)
         return user_id
+
+    def update_password_hash(self, user_id: int, password_hash: str, expected_hash: str = None) -> bool:
+        """
+        Replaces a user's password hash. With expected_hash the update only applies if the stored hash
+        is still that value, so a concurrent password change is never overwritten.
+        Returns True if a row was updated.
+        """
+        logger.info("Updating password hash for user ID %s", user_id)
+        if expected_hash is None:
+            query = "UPDATE users SET password_hash = %s WHERE user_id = %s"
+            params = (password_hash, user_id)
+        else:
+            query = "UPDATE users SET password_hash = %s WHERE user_id = %s AND password_hash = %s"
+            params = (password_hash, user_id, expected_hash)
+        try:
+            return self.db.execute(query, params) > 0
+        finally:
+            self.invalidate_user(user_id)
@@ -71,9 +71,20 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // --- State Variables ---
     let currentDeleteCatalogId = null;
+    const catalogVersions = new Map(); // catalog_id -> version last read, sent back as If-Match on writes
     let currentPage = 1; // Current page number
     const itemsPerPage = 10; // Changed back to 10
     let totalPages = 1; // Total number of pages
+    let nextCursor = null; // Opaque keyset cursor for the next page (from the API)
+    let prevCursor = null; // Opaque keyset cursor for the previous page (from the API)
+
+    // --- Client Data Layer Settings ---
+    const SEARCH_DEBOUNCE_MS = 300; // Wait for a pause in typing before searching
+    const PAGE_CACHE_TTL_MS = 30000; // Same lifetime as the server's list query cache
+    const PAGE_CACHE_MAX_ENTRIES = 50;
+    const pageCache = new Map(); // list query string -> { result, storedAt }, oldest first
+    const pendingPages = new Map(); // list query string -> { promise, controller } for requests in flight
+    let latestListRequest = 0; // Sequence number of the list request whose result may be rendered
 
     // --- UI Feedback & Modal Management ---
 
@@ -165,14 +176,15 @@ document.addEventListener('DOMContentLoaded', () => {
 
     /**
      * Handles API requests with integrated loading, error feedback, and JWT inclusion.
-     * Includes CSRF token for modifying requests (POST, PUT, DELETE).
+     * Includes CSRF token for modifying requests (POST, PUT, PATCH, DELETE).
      * @param {string} url - The API endpoint URL.
-     * @param {Object} options - Fetch API options (method, headers, body).
+     * @param {Object} options - Fetch API options (method, headers, body, signal), plus `silent`
+     *     for background requests that show neither the spinner nor error messages.
      * @returns {Promise<Object>} - The JSON data from the successful response.
-     * @throws {Error} - If the network request fails or the API returns an error.
+     * @throws {Error} - If the network request fails, is aborted, or the API returns an error.
      */
-    const apiRequest = async (url, options = {}) => {
-        showSpinner();
+    const apiRequest = async (url, { silent = false, ...options } = {}) => {
+        if (!silent) showSpinner();
         
         // Prepare headers, ensuring Content-Type for JSON and CSRF token for modifying methods
         const headers = {
@@ -181,7 +193,7 @@ document.addEventListener('DOMContentLoaded', () => {
         };
 
         const method = options.method ? options.method.toUpperCase() : 'GET';
-        if (['POST', 'PUT', 'DELETE'].includes(method)) {
+        if (['POST', 'PUT', 'PATCH', 'DELETE'].includes(method)) {
             const csrfToken = getCookie('csrf_access_token');
             if (csrfToken) {
                 headers['X-CSRF-TOKEN'] = csrfToken;
@@ -193,9 +205,14 @@ document.addEventListener('DOMContentLoaded', () => {
         try {
             const response = await fetch(url, { ...options, headers });
             const data = await response.json();
-            hideSpinner();
+            if (!silent) hideSpinner();
 
             if (!response.ok) {
+                if (response.status === 412) {
+                    // Someone else changed the catalog since it was loaded; refresh so the user sees the current data
+                    invalidatePageCache();
+                    fetchAndDisplayAllCatalogs();
+                }
                 if (response.status === 401 || response.status === 403) {
                     showMessage(data.message || 'Session expired. Please log in again.', 'error');
                     localStorage.removeItem('username');
@@ -206,87 +223,221 @@ document.addEventListener('DOMContentLoaded', () => {
             }
             return data;
         } catch (error) {
-            hideSpinner();
-            console.error('API Request Error:', error);
-            showMessage(error.message || 'Network error: Could not connect to the server.', 'error');
+            if (!silent) hideSpinner();
+            // Aborted requests were replaced by newer ones; background failures stay quiet
+            if (error.name !== 'AbortError' && !silent) {
+                console.error('API Request Error:', error);
+                showMessage(error.message || 'Network error: Could not connect to the server.', 'error');
+            }
             throw error;
         }
     };
 
-    /** Fetches and displays all catalogs, with optional search term, status filter, and pagination. */
-    const fetchAndDisplayAllCatalogs = async () => {
-        console.log('fetchAndDisplayAllCatalogs: Function called.'); 
+    // --- Catalog Page Cache, Request Coalescing & Prefetch ---
 
-        const searchTerm = ui.searchCatalog ? ui.searchCatalog.value.trim() : '';
-        const statusFilter = ui.statusFilter ? ui.statusFilter.value : '';
-        console.log(`DEBUG: statusFilter value from UI: '${statusFilter}'`);
+    /** Returns a function that runs `fn` only once `delay` ms have passed without another call. */
+    const debounce = (fn, delay) => {
+        let timer = null;
+        return (...args) => {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn(...args), delay);
+        };
+    };
 
-        let url = `/api/catalogs`;
+    /** Runs `callback` when the browser is idle (or shortly, where requestIdleCallback is unsupported). */
+    const whenIdle = (callback) => {
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(callback, { timeout: 2000 });
+        } else {
+            setTimeout(callback, 200);
+        }
+    };
+
+    /**
+     * Builds the list query string for the current search/status filters.
+     * @param {number} page - Page number.
+     * @param {string|null} cursor - Keyset cursor from a previous response, if any.
+     * @returns {string} - The query string, which is also the page cache key.
+     */
+    const buildListQuery = (page, cursor = null) => {
         const params = new URLSearchParams();
+        const searchTerm = ui.searchCatalog ? ui.searchCatalog.value.trim() : '';
+        const statusFilter = ui.statusFilter ? ui.statusFilter.value : '';
         if (searchTerm) {
             params.append('search', searchTerm);
         }
-        if (statusFilter) { 
+        if (statusFilter) {
             params.append('status', statusFilter);
         }
-        // Add pagination parameters
-        params.append('page', currentPage);
+        // The cursor, when present, locates the page on the server
+        if (cursor) {
+            params.append('cursor', cursor);
+        }
+        params.append('page', page);
         params.append('per_page', itemsPerPage);
+        params.append('count', 'capped'); // Broad searches report "N+" instead of paying for an exact count
+        return params.toString();
+    };
 
-        if (params.toString()) {
-            url += `?${params.toString()}`;
-        }
+    /** Returns a cached page result that has not expired, or null. */
+    const getCachedPage = (query) => {
+        const entry = pageCache.get(query);
+        if (!entry) return null;
+        pageCache.delete(query);
+        if (Date.now() - entry.storedAt > PAGE_CACHE_TTL_MS) return null;
+        pageCache.set(query, entry); // Re-insert as most recently used
+        return entry.result;
+    };
 
-        console.log('Fetching catalogs from URL:', url); 
-        try {
-            const result = await apiRequest(url);
-            const catalogs = result.data || [];
-            const totalCatalogs = result.total_catalogs || 0; // Get total count from API
+    /** Stores a page result, evicting the least recently used pages beyond PAGE_CACHE_MAX_ENTRIES. */
+    const storePage = (query, result) => {
+        pageCache.set(query, { result, storedAt: Date.now() });
+        while (pageCache.size > PAGE_CACHE_MAX_ENTRIES) {
+            pageCache.delete(pageCache.keys().next().value);
+        }
+    };
 
-            console.log('Received catalogs:', catalogs); 
-            console.log('Total catalogs (for pagination):', totalCatalogs);
+    /** Drops every cached page and in-flight list request; called after any catalog write. */
+    const invalidatePageCache = () => {
+        pageCache.clear();
+        pendingPages.forEach(({ controller }) => controller.abort());
+        pendingPages.clear();
+    };
 
-            // Update pagination info
-            totalPages = Math.ceil(totalCatalogs / itemsPerPage);
-            if (ui.currentPageSpan) ui.currentPageSpan.textContent = currentPage;
-            if (ui.totalPagesSpan) ui.totalPagesSpan.textContent = totalPages;
+    /** Aborts list requests in flight for any page other than `query` (e.g. an older search term). */
+    const abortStaleRequests = (query) => {
+        pendingPages.forEach(({ controller }, pendingQuery) => {
+            if (pendingQuery !== query) {
+                controller.abort();
+                pendingPages.delete(pendingQuery);
+            }
+        });
+    };
 
-            // Enable/disable pagination buttons
-            if (ui.prevPageBtn) ui.prevPageBtn.disabled = currentPage <= 1;
-            if (ui.nextPageBtn) ui.nextPageBtn.disabled = currentPage >= totalPages;
+    /**
+     * Loads one list page: from the cache, by joining a request already in flight for the same page
+     * (e.g. a prefetch), or from the API.
+     * @param {string} query - Query string from buildListQuery.
+     * @param {Object} options - `silent: true` for background prefetches.
+     * @returns {Promise<Object>} - The API response for the page.
+     */
+    const loadPage = (query, { silent = false } = {}) => {
+        const cached = getCachedPage(query);
+        if (cached) return Promise.resolve(cached);
+        const pending = pendingPages.get(query);
+        if (pending) return pending.promise;
+
+        const controller = new AbortController();
+        const promise = apiRequest(`/api/catalogs?${query}`, { signal: controller.signal, silent })
+            .then((result) => {
+                storePage(query, result);
+                return result;
+            })
+            .finally(() => {
+                if (pendingPages.get(query)?.promise === promise) pendingPages.delete(query);
+            });
+        pendingPages.set(query, { promise, controller });
+        return promise;
+    };
 
-            if (ui.catalogTableBody) {
-                ui.catalogTableBody.innerHTML = ''; // Clear existing table rows
+    /** Fetches the next page in the background once the browser is idle, so "Next" renders instantly. */
+    const prefetchNextPage = (page, cursor) => {
+        if (!cursor) return;
+        whenIdle(() => {
+            const query = buildListQuery(page, cursor);
+            if (!getCachedPage(query)) {
+                loadPage(query, { silent: true }).catch(() => {}); // A failed prefetch is simply retried on click
             }
+        });
+    };
 
-            if (catalogs.length > 0) {
-                if (ui.noCatalogsMessage) { ui.noCatalogsMessage.style.display = 'none'; }
-                catalogs.forEach(catalog => {
-                    if (ui.catalogTableBody) { // Ensure table body exists before inserting row
-                        const row = ui.catalogTableBody.insertRow();
-                        row.setAttribute('data-id', catalog.catalog_id); // Store ID on row for easy access
-                        row.innerHTML = `
-                            <td data-label="ID">${catalog.catalog_id}</td>
-                            <td data-label="Name">${catalog.catalog_name}</td>
-                            <td data-label="Description">${catalog.catalog_description}</td>
-                            <td data-label="Start Date">${catalog.start_date}</td>
-                            <td data-label="End Date">${catalog.end_date}</td>
-                            <td data-label="Status">${catalog.status}</td>
-                            <td class="actions">
-                                ${localStorage.getItem('username') ? `
-                                    <button class="btn-small btn-edit-color" data-id="${catalog.catalog_id}">Edit</button>
-                                    <button class="btn-small btn-danger-color" data-id="${catalog.catalog_id}">Delete</button>
-                                ` : ''}
-                            </td>
-                        `;
-                    }
-                });
-                console.log('Catalogs rendered successfully.'); 
-            } else {
-                if (ui.noCatalogsMessage) { ui.noCatalogsMessage.style.display = 'block'; } 
-                console.log('No catalogs found to display.');
-            }
+    /**
+     * Builds a table row for one catalog with DOM APIs (text is never parsed as HTML).
+     * @param {Object} catalog - Catalog from the API.
+     * @param {boolean} canEdit - Whether to add the Edit/Delete buttons.
+     * @returns {HTMLTableRowElement}
+     */
+    const buildCatalogRow = (catalog, canEdit) => {
+        const row = document.createElement('tr');
+        row.setAttribute('data-id', catalog.catalog_id); // Store ID on row for easy access
+        [
+            ['ID', catalog.catalog_id],
+            ['Name', catalog.catalog_name],
+            ['Description', catalog.catalog_description],
+            ['Start Date', catalog.start_date],
+            ['End Date', catalog.end_date],
+            ['Status', catalog.status],
+        ].forEach(([label, value]) => {
+            const cell = document.createElement('td');
+            cell.setAttribute('data-label', label);
+            cell.textContent = value ?? '';
+            row.appendChild(cell);
+        });
+
+        const actions = document.createElement('td');
+        actions.className = 'actions';
+        if (canEdit) {
+            [['Edit', 'btn-edit-color'], ['Delete', 'btn-danger-color']].forEach(([text, colorClass]) => {
+                const button = document.createElement('button');
+                button.className = `btn-small ${colorClass}`;
+                button.setAttribute('data-id', catalog.catalog_id);
+                button.textContent = text;
+                actions.appendChild(button);
+            });
+        }
+        row.appendChild(actions);
+        return row;
+    };
+
+    /** Renders a list page: pagination state and all rows, inserted into the table in a single DOM write. */
+    const renderCatalogPage = (result) => {
+        const catalogs = result.data || [];
+        const totalCatalogs = result.total_catalogs || 0; // Get total count from API
+
+        // Update pagination info
+        totalPages = Math.ceil(totalCatalogs / itemsPerPage);
+        nextCursor = result.next_cursor || null;
+        prevCursor = result.prev_cursor || null;
+        if (ui.currentPageSpan) ui.currentPageSpan.textContent = currentPage;
+        if (ui.totalPagesSpan) ui.totalPagesSpan.textContent = result.total_capped ? `${totalPages}+` : totalPages;
+
+        // Enable/disable pagination buttons
+        if (ui.prevPageBtn) ui.prevPageBtn.disabled = !prevCursor;
+        if (ui.nextPageBtn) ui.nextPageBtn.disabled = !nextCursor;
+
+        const canEdit = Boolean(localStorage.getItem('username'));
+        const fragment = document.createDocumentFragment();
+        catalogs.forEach(catalog => {
+            catalogVersions.set(String(catalog.catalog_id), catalog.version);
+            fragment.appendChild(buildCatalogRow(catalog, canEdit));
+        });
+        if (ui.catalogTableBody) {
+            ui.catalogTableBody.replaceChildren(fragment);
+        }
+        if (ui.noCatalogsMessage) {
+            ui.noCatalogsMessage.style.display = catalogs.length > 0 ? 'none' : 'block';
+        }
+    };
+
+    /**
+     * Fetches and displays all catalogs, with optional search term, status filter, and pagination.
+     * Pages come from the client page cache when possible; requests for other pages still in flight
+     * are aborted, and only the result of the latest call is rendered.
+     * @param {string|null} cursor - Keyset cursor from the previous response; null loads `currentPage` by offset.
+     */
+    const fetchAndDisplayAllCatalogs = async (cursor = null) => {
+        const page = currentPage;
+        const query = buildListQuery(page, cursor);
+        const requestNumber = ++latestListRequest;
+        abortStaleRequests(query);
+
+        try {
+            const result = await loadPage(query);
+            if (requestNumber !== latestListRequest) return; // A newer search or page replaced this one
+            renderCatalogPage(result);
+            prefetchNextPage(page + 1, nextCursor);
         } catch (error) {
+            if (error.name === 'AbortError' || requestNumber !== latestListRequest) return;
             // Error already handled by apiRequest, just ensure no-catalogs message is shown
             if (ui.noCatalogsMessage) { ui.noCatalogsMessage.style.display = 'block'; }
             console.error('Error fetching and displaying catalogs:', error);
@@ -299,6 +450,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const result = await apiRequest(`/api/catalogs/${catalogId}`);
             const catalog = result.data;
             if (catalog) {
+                catalogVersions.set(String(catalog.catalog_id), catalog.version);
                 if (ui.catalogId) { ui.catalogId.value = catalog.catalog_id; }
                 if (ui.catalogName) { ui.catalogName.value = catalog.catalog_name; }
                 if (ui.catalogDescription) { ui.catalogDescription.value = catalog.catalog_description; }
@@ -318,6 +470,15 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
+    /**
+     * Returns the If-Match header for a write to the given catalog, so the server rejects it (412)
+     * when the catalog changed after this page read it. Empty when the version is unknown.
+     */
+    const ifMatchHeader = (catalogId) => {
+        const version = catalogVersions.get(String(catalogId));
+        return version ? { 'If-Match': `"v${version}"` } : {};
+    };
+
     /** Sends a request to save (create or update) a catalog via the API. */
     const saveCatalog = async (catalogData, catalogId = null) => {
         const method = catalogId ? 'PUT' : 'POST';
@@ -326,7 +487,8 @@ document.addEventListener('DOMContentLoaded', () => {
         try {
             const result = await apiRequest(url, {
                 method: method,
-                // Headers are now handled by apiRequest function
+                // Content-Type and CSRF headers are added by apiRequest
+                headers: catalogId ? ifMatchHeader(catalogId) : {},
                 body: JSON.stringify(catalogData),
             });
             showMessage(result.message, 'success');
@@ -334,6 +496,7 @@ document.addEventListener('DOMContentLoaded', () => {
             // After saving, reset page to 1 to ensure new/updated item is visible
             currentPage = 1; 
             resetCatalogForm();
+            invalidatePageCache();
             fetchAndDisplayAllCatalogs();
         } catch (error) {
             if (error.message) {
@@ -361,10 +524,11 @@ document.addEventListener('DOMContentLoaded', () => {
     /** Sends a request to delete a catalog by its ID via the API. */
     const deleteCatalog = async (catalogId) => {
         try {
-            const result = await apiRequest(`/api/catalogs/${catalogId}`, { method: 'DELETE' });
+            const result = await apiRequest(`/api/catalogs/${catalogId}`, { method: 'DELETE', headers: ifMatchHeader(catalogId) });
             showMessage(result.message, 'success');
             // After deleting, reset page to 1 to ensure consistent view
             currentPage = 1;
+            invalidatePageCache();
             fetchAndDisplayAllCatalogs();
         } catch (error) {
             // Error already handled by apiRequest
@@ -485,10 +649,12 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Search and Filter listeners
     if (ui.searchCatalog) {
-        ui.searchCatalog.addEventListener('input', () => {
+        // One request per pause in typing instead of one per keystroke
+        const searchCatalogs = debounce(() => {
             currentPage = 1; // Reset to first page on new search
             fetchAndDisplayAllCatalogs();
-        });
+        }, SEARCH_DEBOUNCE_MS);
+        ui.searchCatalog.addEventListener('input', searchCatalogs);
     }
     if (ui.statusFilter) { 
         ui.statusFilter.addEventListener('change', () => { 
@@ -501,17 +667,17 @@ document.addEventListener('DOMContentLoaded', () => {
     // Pagination button listeners
     if (ui.prevPageBtn) {
         ui.prevPageBtn.addEventListener('click', () => {
-            if (currentPage > 1) {
+            if (prevCursor) {
                 currentPage--;
-                fetchAndDisplayAllCatalogs();
+                fetchAndDisplayAllCatalogs(prevCursor);
             }
         });
     }
     if (ui.nextPageBtn) {
         ui.nextPageBtn.addEventListener('click', () => {
-            if (currentPage < totalPages) {
+            if (nextCursor) {
                 currentPage++;
-                fetchAndDisplayAllCatalogs();
+                fetchAndDisplayAllCatalogs(nextCursor);
             }
         });
     }
@@ -0,0 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import get_config
+
+# Configure logging before utils.logger is first imported: records go to stderr (captured by pytest),
+# written synchronously, instead of to logs/catalog_manager.log through the background thread
+_config = get_config()
+_config.set('logging', 'file', '')
+_config.set('logging', 'async', 'false')
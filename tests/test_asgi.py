@@ -0,0 +1,172 @@
+import asyncio
+import json
+from datetime import date, timedelta
+import jwt as pyjwt
+import pytest
+import asgi
+from exception.catalog_exception import DatabaseConnectionError
+from utils.query_cache import GenerationalQueryCache, InProcessCacheBackend
+
+CATALOG = {
+    "catalog_id": 7, "catalog_name": "Summer Sale", "catalog_description": "Seasonal offers",
+    "start_date": "2031-06-01", "end_date": "2031-08-31", "status": "active", "user_id": 1, "version": 3,
+}
+CSRF = "csrf-double-submit"
+
+
+class AsyncCatalogTable:
+    """Stands in for the AsyncQueryExecutor behind the async catalog service, keeping catalog rows in a dict."""
+
+    def __init__(self, *rows):
+        self.rows = {row['catalog_id']: dict(row) for row in rows}
+        self.fail_with = None
+
+    async def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        return self.rows.get(params[0])
+
+    async def fetch_rows(self, query: str, params: tuple = None) -> tuple:
+        if self.fail_with is not None:
+            raise self.fail_with
+        columns = ('total_count',) + tuple(CATALOG)
+        return columns, [(len(self.rows),) + tuple(row.values()) for row in self.rows.values()]
+
+    def _matching_row(self, query: str, params: tuple) -> dict | None:
+        catalog_id, expected_version = params[-2:] if "AND version = %s" in query else (params[-1], None)
+        row = self.rows.get(catalog_id)
+        return row if row is not None and expected_version in (None, row['version']) else None
+
+    async def insert(self, query: str, params: tuple = ()) -> int:
+        if query.lstrip().startswith("INSERT"):
+            catalog_id = max(self.rows) + 1
+            self.rows[catalog_id] = {**CATALOG, "catalog_id": catalog_id, "catalog_name": params[0], "version": 1}
+            return catalog_id
+        # Full updates: the bumped version is reported back like LAST_INSERT_ID(version + 1)
+        row = self._matching_row(query, params)
+        if row is None:
+            return 0
+        row['version'] += 1
+        return row['version']
+
+    async def execute(self, query: str, params: tuple = ()) -> int:
+        row = self._matching_row(query, params)
+        if row is None:
+            return 0
+        del self.rows[row['catalog_id']]
+        return 1
+
+
+@pytest.fixture
+def catalogs(monkeypatch):
+    table = AsyncCatalogTable(CATALOG)
+    service = asgi.catalog_service.catalog_service
+    monkeypatch.setattr(asgi.catalog_service, 'db', table)
+    monkeypatch.setattr(service, 'catalog_cache', None)
+    monkeypatch.setattr(service, 'query_cache', GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list'))
+    return table
+
+
+def access_cookie() -> str:
+    token = pyjwt.encode({"sub": "1", "type": "access", "csrf": CSRF, "username": "alice", "email": "alice@example.com"},
+                         asgi.JWT_SECRET_KEY, algorithm='HS256')
+    return f"{asgi.ACCESS_COOKIE_NAME}={token}"
+
+
+SIGNED_IN = {'Cookie': access_cookie(), 'X-CSRF-Token': CSRF}
+
+
+def call(method: str, path: str, body=None, headers: dict = None, query_string: bytes = b'') -> tuple:
+    """Runs one request through the ASGI app; returns (status, headers, parsed JSON body or None)."""
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query_string,
+             'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in (headers or {}).items()]}
+    messages = [{'type': 'http.request', 'body': json.dumps(body).encode('utf-8') if body is not None else b''}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    start, end = sent
+    response_headers = {name.decode('latin-1'): value.decode('latin-1') for name, value in start['headers']}
+    return start['status'], response_headers, json.loads(end['body']) if end['body'] else None
+
+
+def catalog_item(**changes) -> dict:
+    start = date.today() + timedelta(days=30)
+    item = {"name": "Summer Sale", "description": "Seasonal offers", "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=60)).isoformat(), "status": "active"}
+    item.update(changes)
+    return item
+
+
+def test_catalog_carries_its_version_as_an_etag(catalogs):
+    status, headers, body = call('GET', '/api/catalogs/7')
+
+    assert status == 200
+    assert headers['etag'] == '"v3"'
+    assert body['data']['catalog_name'] == "Summer Sale"
+
+    status, headers, body = call('GET', '/api/catalogs/7', headers={'If-None-Match': '"v3"'})
+    assert status == 304 and body is None
+
+
+def test_catalog_list_is_one_page_with_its_total(catalogs):
+    status, _, body = call('GET', '/api/catalogs', query_string=b'per_page=5')
+
+    assert status == 200
+    assert body['total_catalogs'] == 1 and body['per_page'] == 5
+    assert [catalog['catalog_id'] for catalog in body['data']] == [7]
+
+
+def test_create_needs_a_login_and_a_csrf_token(catalogs):
+    assert call('POST', '/api/catalogs', catalog_item())[0] == 401
+    status, _, body = call('POST', '/api/catalogs', catalog_item(), headers={'Cookie': access_cookie()})
+    assert status == 401 and body['msg'] == "Missing CSRF token"
+
+    status, _, body = call('POST', '/api/catalogs', catalog_item(name="Winter Sale"), headers=SIGNED_IN)
+    assert status == 201
+    assert catalogs.rows[body['data']['catalog_id']]['catalog_name'] == "Winter Sale"
+
+
+def test_versioned_update_and_delete(catalogs):
+    status, _, _ = call('PUT', '/api/catalogs/7', catalog_item(), headers={**SIGNED_IN, 'If-Match': '"v2"'})
+    assert status == 412
+
+    status, headers, body = call('PUT', '/api/catalogs/7', catalog_item(), headers={**SIGNED_IN, 'If-Match': '"v3"'})
+    assert status == 200
+    assert headers['etag'] == '"v4"' and body['data']['version'] == 4
+
+    assert call('DELETE', '/api/catalogs/7', headers={**SIGNED_IN, 'If-Match': '"v3"'})[0] == 412
+    assert call('DELETE', '/api/catalogs/7', headers={**SIGNED_IN, 'If-Match': '"v4"'})[0] == 200
+    assert call('GET', '/api/catalogs/7')[0] == 404
+
+
+def test_invalid_payload_lists_every_field_error(catalogs):
+    status, _, body = call('PUT', '/api/catalogs/7', catalog_item(name="bad_name", status="archived"), headers=SIGNED_IN)
+
+    assert status == 400
+    assert [error['field'] for error in body['errors']] == ['name', 'status']
+
+
+def test_database_errors_are_reported_like_the_flask_app(catalogs):
+    catalogs.fail_with = DatabaseConnectionError("Lost connection to MySQL server")
+
+    status, _, body = call('GET', '/api/catalogs')
+
+    assert status == 500
+    assert body['message'] == "Database Error"
+
+
+@pytest.mark.parametrize('method, path, expected', [
+    ('GET', '/api/unknown', 404),
+    ('POST', '/api/catalogs/7', 405),
+])
+def test_unrouted_requests(catalogs, method, path, expected):
+    assert call(method, path)[0] == expected
+
+
+def test_oversized_body_is_rejected(catalogs, monkeypatch):
+    monkeypatch.setattr(asgi, 'MAX_BODY_BYTES', 16)
+    assert call('POST', '/api/catalogs', catalog_item(), headers=SIGNED_IN)[0] == 413
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from exception.catalog_exception import DatabaseConnectionError
+from utils import async_db_pool
+from utils.async_db_pool import AsyncConnectionPool
+
+
+class FakeAsyncConnection:
+    """Stands in for a mysql.connector.aio connection: records closes."""
+
+    def __init__(self):
+        self.in_transaction = False
+        self.closed = False
+
+    async def ping(self, reconnect=False):
+        pass
+
+    async def rollback(self):
+        self.in_transaction = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Patches the asyncio MySQL driver; returns the list of fake connections the pool opens."""
+    connections = []
+
+    async def connect(**connect_args):
+        connection = FakeAsyncConnection()
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(async_db_pool.mysql.connector.aio, 'connect', connect)
+    return connections
+
+
+def test_returned_connection_is_reused(opened):
+    async def scenario():
+        pool = AsyncConnectionPool({}, min_size=0, max_size=2)
+        async with await pool.get_connection():
+            pass
+        async with await pool.get_connection():
+            pass
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert len(opened) == 1
+    assert stats['checkouts'] == 2 and stats['idle'] == 1
+
+
+def test_exhausted_pool_times_out(opened):
+    async def scenario():
+        pool = AsyncConnectionPool({}, min_size=0, max_size=1, timeout=0.05)
+        held = await pool.get_connection()
+        with pytest.raises(DatabaseConnectionError, match="exhausted"):
+            await pool.get_connection()
+        await held.close()
+        return pool.stats()
+
+    assert asyncio.run(scenario())['timeouts'] == 1
+
+
+def test_close_all_closes_idle_and_returned_connections(opened):
+    async def scenario():
+        pool = AsyncConnectionPool({}, min_size=0, max_size=2)
+        idle = await pool.get_connection()
+        in_use = await pool.get_connection()
+        await idle.close()
+
+        await pool.close_all()
+        assert opened[0].closed
+        assert not opened[1].closed
+
+        await in_use.close()
+        assert opened[1].closed
+        assert pool.stats()['size'] == 0
+        with pytest.raises(DatabaseConnectionError, match="closed"):
+            await pool.get_connection()
+
+    asyncio.run(scenario())
@@ -0,0 +1,79 @@
+import asyncio
+import mysql.connector
+import pytest
+from exception.catalog_exception import DatabaseConnectionError, DataIntegrityError
+from utils import async_query_executor
+from utils.async_query_executor import AsyncQueryExecutor
+
+
+class FakeAsyncCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.column_names = ('catalog_id', 'catalog_name')
+        self.lastrowid = 41
+        self.rowcount = 1
+
+    async def execute(self, query, params=()):
+        if self.connection.fail_with is not None:
+            raise self.connection.fail_with
+
+    async def fetchall(self):
+        return [(1, 'Summer')]
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncConnection:
+    """Stands in for a pooled mysql.connector.aio connection: records how it was handed back."""
+
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.events = []
+
+    async def cursor(self):
+        return FakeAsyncCursor(self)
+
+    async def close(self):
+        self.events.append('close')
+
+    async def discard(self):
+        self.events.append('discard')
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    connection = FakeAsyncConnection()
+
+    class Pool:
+        async def get_connection(self):
+            return connection
+
+    monkeypatch.setattr(async_query_executor, 'get_async_pool', Pool)
+    return connection
+
+
+def test_fetch_shapes_rows(connection):
+    db = AsyncQueryExecutor()
+    assert asyncio.run(db.fetch_all("SELECT 1")) == [{"catalog_id": 1, "catalog_name": 'Summer'}]
+    assert asyncio.run(db.fetch_rows("SELECT 1")) == (('catalog_id', 'catalog_name'), [(1, 'Summer')])
+    assert asyncio.run(db.insert("INSERT INTO catalog VALUES (%s)", ('x',))) == 41
+    assert connection.events == ['close', 'close', 'close']
+
+
+@pytest.mark.parametrize('error_class', [mysql.connector.errors.IntegrityError, mysql.connector.errors.DataError])
+def test_rejected_data_raises_data_integrity_error(connection, error_class):
+    connection.fail_with = error_class(msg="Duplicate entry 'x'", errno=1062)
+
+    with pytest.raises(DataIntegrityError, match="Duplicate entry"):
+        asyncio.run(AsyncQueryExecutor().insert("INSERT INTO catalog VALUES (%s)", ('x',)))
+    assert connection.events == ['close']
+
+
+def test_lost_connection_is_discarded_and_not_a_row_error(connection):
+    connection.fail_with = mysql.connector.errors.OperationalError(msg="Lost connection to MySQL server", errno=2013)
+
+    with pytest.raises(DatabaseConnectionError) as excinfo:
+        asyncio.run(AsyncQueryExecutor().fetch_all("SELECT 1"))
+    assert not isinstance(excinfo.value, DataIntegrityError)
+    assert connection.events == ['discard']
@@ -0,0 +1,151 @@
+import bcrypt
+import pytest
+from exception.catalog_exception import AuthenticationError, ServiceUnavailableError
+from service.authentication_service import INVALID_CREDENTIALS_MESSAGE, AuthenticationService
+from service.user_service import USER_BY_USERNAME_OR_EMAIL_QUERY, UserService
+from utils.config import get_config
+from utils.hash_pool import HashWorkerPool
+
+PASSWORD = "correct horse"
+
+
+class UserTable:
+    """Stands in for the QueryExecutor behind UserService, keeping users as USER_SELECT tuples."""
+
+    def __init__(self, *rows):
+        self.rows = {row[0]: row for row in rows}
+        self.statements = []
+
+    def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        self.statements.append(' '.join(query.split()))
+        identifier = params[0]
+        for row in self.rows.values():
+            if identifier in row[:3]:
+                return row
+        return None
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        self.statements.append(' '.join(query.split()))
+        password_hash, user_id, expected_hash = params
+        row = self.rows.get(user_id)
+        if row is None or row[3] != expected_hash:
+            return 0
+        self.rows[user_id] = row[:3] + (password_hash,) + row[4:]
+        return 1
+
+
+def user_row(user_id: int, username: str, rounds: int = 4) -> tuple:
+    password_hash = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+    return user_id, username, f"{username}@example.com", password_hash, None
+
+
+@pytest.fixture
+def auth_config():
+    """Cheap bcrypt hashes for the services built in a test; [auth] is restored afterwards."""
+    config = get_config()
+    saved = dict(config['auth'])
+    config['auth']['bcrypt_rounds'] = '4'
+    yield config['auth']
+    config.remove_section('auth')
+    config.read_dict({'auth': saved})
+
+
+@pytest.fixture
+def users():
+    return UserTable(user_row(1, "alice"))
+
+
+@pytest.fixture
+def auth(auth_config, users):
+    user_service = UserService()
+    user_service.db = users
+    return AuthenticationService(hash_pool=HashWorkerPool(max_workers=1, max_queue=1), user_service=user_service)
+
+
+def test_login_reads_the_user_with_one_query(auth, users):
+    user = auth.authenticate_user("alice@example.com", PASSWORD)
+
+    assert user.user_id == 1 and user.username == "alice"
+    assert users.statements == [' '.join(USER_BY_USERNAME_OR_EMAIL_QUERY.split())]
+    assert auth.hash_pool_stats()['completed'] == 1
+
+
+@pytest.mark.parametrize('username_or_email, password', [("alice", "wrong password"), ("mallory", PASSWORD)])
+def test_failed_logins_look_the_same_and_cost_a_hash_check(auth, username_or_email, password):
+    with pytest.raises(AuthenticationError) as excinfo:
+        auth.authenticate_user(username_or_email, password)
+
+    assert str(excinfo.value) == INVALID_CREDENTIALS_MESSAGE
+    # An unknown account is checked against a dummy hash, like a wrong password
+    assert auth.hash_pool_stats()['completed'] == 1
+
+
+def test_saturated_hash_pool_is_not_reported_as_a_failed_login(auth, monkeypatch):
+    def saturated(func, *args):
+        raise ServiceUnavailableError("Too many concurrent logins. Please retry shortly.")
+    monkeypatch.setattr(auth.hash_pool, 'run', saturated)
+
+    with pytest.raises(ServiceUnavailableError):
+        auth.authenticate_user("alice", PASSWORD)
+
+
+def test_weaker_hash_is_upgraded_on_login(auth, users):
+    auth.bcrypt_rounds = 5
+
+    user = auth.authenticate_user("alice", PASSWORD)
+
+    stored = users.rows[1][3]
+    assert auth._hash_cost(stored) == 5
+    assert user.password_hash == stored
+    assert bcrypt.checkpw(PASSWORD.encode('utf-8'), stored.encode('utf-8'))
+
+
+def test_upgrade_never_overwrites_a_concurrent_password_change(auth, users, monkeypatch):
+    auth.bcrypt_rounds = 5
+    changed = bcrypt.hashpw(b"changed meanwhile", bcrypt.gensalt(4)).decode('utf-8')
+    hash_password = auth.hash_password
+
+    def change_password_first(password):
+        users.rows[1] = users.rows[1][:3] + (changed,) + users.rows[1][4:]
+        return hash_password(password)
+    monkeypatch.setattr(auth, 'hash_password', change_password_first)
+
+    auth.authenticate_user("alice", PASSWORD)
+    assert users.rows[1][3] == changed
+
+
+def test_current_hash_is_not_rewritten(auth, users):
+    auth.authenticate_user("alice", PASSWORD)
+    assert not any(statement.startswith("UPDATE") for statement in users.statements)
+
+
+@pytest.fixture
+def cached_auth(auth_config, users):
+    auth_config['verify_cache'] = 'true'
+    user_service = UserService()
+    user_service.db = users
+    return AuthenticationService(hash_pool=HashWorkerPool(max_workers=1, max_queue=1), user_service=user_service)
+
+
+def test_verified_login_is_served_from_the_cache(cached_auth):
+    cached_auth.authenticate_user("alice", PASSWORD)
+    cached_auth.authenticate_user("alice", PASSWORD)
+
+    assert cached_auth.hash_pool_stats()['completed'] == 1
+    assert cached_auth.verification_cache_stats()['hits'] == 1
+    with pytest.raises(AuthenticationError):
+        cached_auth.authenticate_user("alice", "wrong password")
+
+
+def test_cached_verification_stops_matching_after_a_password_change(cached_auth, users):
+    cached_auth.authenticate_user("alice", PASSWORD)
+    users.rows[1] = users.rows[1][:3] + (bcrypt.hashpw(b"new password", bcrypt.gensalt(4)).decode('utf-8'),) + users.rows[1][4:]
+
+    with pytest.raises(AuthenticationError):
+        cached_auth.authenticate_user("alice", PASSWORD)
+    assert cached_auth.authenticate_user("alice", "new password").user_id == 1
+
+
+def test_verification_cache_is_off_unless_configured(auth):
+    assert auth.verification_cache is None
+    assert auth.verification_cache_stats() is None
@@ -0,0 +1,38 @@
+import pytest
+from utils.cache import LRUCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_entries=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('utils.cache.time.monotonic', lambda: now[0])
+    cache = LRUCache(ttl=5)
+    cache.set('a', 1)
+    now[0] += 5
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+@pytest.mark.parametrize('invalidate', [lambda cache: cache.delete(7), lambda cache: cache.clear()])
+def test_fill_started_before_an_invalidation_is_dropped(invalidate):
+    cache = LRUCache()
+    generation = cache.generation()
+    # An update commits and invalidates while the old row is still being read
+    invalidate(cache)
+    cache.set(7, {'version': 1}, generation=generation)
+
+    assert cache.get(7) is None
+    assert cache.stats()['stale_fills'] == 1
+
+    cache.set(7, {'version': 2}, generation=cache.generation())
+    assert cache.get(7) == {'version': 2}
@@ -0,0 +1,136 @@
+import json
+from contextlib import contextmanager
+from datetime import date, timedelta
+import pytest
+from exception.catalog_exception import DatabaseConnectionError, DataIntegrityError, ValidationError
+from service.catalog_import_service import CatalogImportService
+from service.catalog_service import CatalogService
+
+START = (date.today() + timedelta(days=30)).isoformat()
+END = (date.today() + timedelta(days=90)).isoformat()
+
+
+class FakeDatabase:
+    """
+    Stands in for the QueryExecutor: rows written inside a transaction are kept only if it commits.
+    Names containing 'duplicate' are rejected like a constraint violation, names containing 'outage'
+    fail like a lost connection.
+    """
+
+    def __init__(self):
+        self.committed = []
+        self._pending = None
+        self._next_id = 1
+
+    @contextmanager
+    def transaction(self):
+        if self._pending is not None:
+            # Nested transactions join the outer one, as with the executor
+            yield self
+            return
+        self._pending = []
+        try:
+            yield self
+            self.committed.extend(self._pending)
+        finally:
+            self._pending = None
+
+    def _write(self, names: list) -> int:
+        for name in names:
+            if 'duplicate' in name:
+                raise DataIntegrityError(f"Duplicate entry '{name}'")
+            if 'outage' in name:
+                raise DatabaseConnectionError("Lost connection to MySQL server during query")
+        first_id = self._next_id
+        self._next_id += len(names)
+        (self._pending if self._pending is not None else self.committed).extend(names)
+        return first_id
+
+    def insert_many(self, query: str, rows: list) -> int:
+        return self._write([row[0] for row in rows])
+
+    def insert(self, query: str, params: tuple) -> int:
+        return self._write([params[0]])
+
+
+@pytest.fixture
+def database():
+    return FakeDatabase()
+
+
+@pytest.fixture
+def importer(database):
+    catalog_service = CatalogService()
+    catalog_service.db = database
+    return CatalogImportService(catalog_service, batch_size=2)
+
+
+def ndjson(*names) -> list:
+    return [json.dumps({"name": name, "description": "Imported", "start_date": START, "end_date": END,
+                        "status": "active"}) for name in names]
+
+
+def run(importer, lines, **kwargs) -> tuple:
+    errors = []
+    checkpoints = []
+    progress = importer.import_stream(lines, 'ndjson', user_id=1,
+                                      on_error=lambda line, message: errors.append((line, message)),
+                                      on_progress=lambda p: checkpoints.append(p['last_committed_line']),
+                                      **kwargs)
+    return progress, errors, checkpoints
+
+
+def test_rejected_rows_are_reported_and_the_checkpoint_advances(importer, database):
+    lines = ndjson('Alpha', 'duplicate Beta', 'Gamma', 'Delta') + ['{not json', '[1]'] + ndjson('Bad_name')
+
+    progress, errors, checkpoints = run(importer, lines)
+
+    assert database.committed == ['Alpha', 'Gamma', 'Delta']
+    assert [line for line, _ in errors] == [2, 5, 6, 7]
+    assert "Duplicate entry" in errors[0][1]
+    assert progress['rows_imported'] == 3
+    assert progress['rows_failed'] == 4
+    assert progress['last_committed_line'] == 7
+    assert checkpoints == [2, 4, 6, 7]
+
+
+def test_database_error_rolls_back_the_batch_and_keeps_the_checkpoint(importer, database):
+    lines = ndjson('Alpha', 'Beta', 'Gamma', 'outage Delta', 'Epsilon')
+
+    checkpoints = []
+    with pytest.raises(DatabaseConnectionError):
+        importer.import_stream(lines, 'ndjson', user_id=1,
+                               on_progress=lambda p: checkpoints.append(p['last_committed_line']))
+
+    assert database.committed == ['Alpha', 'Beta']
+    assert checkpoints == [2]
+
+
+def test_resume_skips_committed_lines(importer, database):
+    lines = ndjson('Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon')
+
+    progress, errors, checkpoints = run(importer, lines, start_after_line=2)
+
+    assert database.committed == ['Gamma', 'Delta', 'Epsilon']
+    assert errors == []
+    assert checkpoints == [4, 5]
+    assert progress['last_committed_line'] == 5
+
+
+def test_csv_lines_are_numbered_by_physical_line(importer, database):
+    lines = ['name,description,start_date,end_date,status\n',
+             f'Alpha,Imported,{START},{END},active\n',
+             '\n',
+             f'Beta,Imported,{START},{END},archived\n',
+             f'Gamma,Imported,{START},{END},active,extra\n']
+
+    progress = importer.import_stream(lines, 'csv', user_id=1)
+
+    assert database.committed == ['Alpha']
+    assert progress['rows_failed'] == 2
+    assert progress['last_committed_line'] == 5
+
+
+def test_unknown_format_is_rejected(importer):
+    with pytest.raises(ValidationError):
+        importer.import_stream([], 'xml', user_id=1)
@@ -0,0 +1,113 @@
+from datetime import date, datetime, timedelta
+import pytest
+from dto.catalog import Catalog
+from exception.catalog_exception import ValidationError
+from utils.catalog_schema import catalog_schema
+from utils.validation import validate_alphanumeric_string, validate_future_date, validate_status
+
+FUTURE = date.today() + timedelta(days=30)
+LATER = FUTURE + timedelta(days=60)
+PAST = date.today() - timedelta(days=1)
+
+
+def legacy_validate(data) -> Catalog:
+    """The field-by-field validation the schema replaced: one validator per field, first failure wins."""
+    if not isinstance(data, dict):
+        raise ValidationError("Catalog payload must be a JSON object.")
+    name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
+    description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
+    start_date = validate_future_date(data.get('start_date'), "Start Date")
+    end_date = validate_future_date(data.get('end_date'), "End Date")
+    status = validate_status(data.get('status'))
+    if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
+        raise ValidationError("End Date cannot be before Start Date.")
+    return Catalog(name=name, description=description, start_date=start_date, end_date=end_date, status=status)
+
+
+def payload(**changes) -> dict:
+    data = {
+        "name": "Summer Sale",
+        "description": "Seasonal offers, don't miss them!",
+        "start_date": FUTURE.isoformat(),
+        "end_date": LATER.isoformat(),
+        "status": "active",
+    }
+    data.update(changes)
+    return data
+
+
+CORPUS = [
+    payload(),
+    payload(name="  Padded  ", status=" INACTIVE "),
+    payload(name="Été 2030 - Café", description="Ünïcödé letters are alphanumeric"),
+    payload(name="x" * 30),
+    payload(name="x" * 31),
+    payload(description="d" * 50),
+    payload(description="d" * 51),
+    payload(name=""),
+    payload(name="   "),
+    payload(name=None),
+    payload(name=42),
+    payload(name="snake_case"),
+    payload(name="Bad <name>"),
+    payload(name="tab\tand\nnewline"),
+    payload(description="semi;colon"),
+    payload(start_date=PAST.isoformat()),
+    payload(start_date=date.today().isoformat()),
+    payload(start_date=f"{FUTURE.year}-{FUTURE.month}-{FUTURE.day}"),
+    payload(start_date=f"{FUTURE.year + 1}-02-30"),
+    payload(start_date="tomorrow"),
+    payload(start_date=f"{FUTURE.isoformat()}T00:00"),
+    payload(start_date=f" {FUTURE.isoformat()}"),
+    payload(start_date=FUTURE.strftime('%Y%m%d')),
+    payload(start_date=20300101),
+    payload(end_date=None),
+    payload(start_date=LATER.isoformat(), end_date=FUTURE.isoformat()),
+    payload(start_date=LATER.isoformat(), end_date=LATER.isoformat()),
+    payload(status="archived"),
+    payload(status=True),
+    payload(name="bad_name", status="archived"),
+    {},
+    [],
+    "catalog",
+    None,
+]
+
+
+def outcome(validate, data):
+    """(valid, Catalog fields or the first error message) of one validation."""
+    try:
+        catalog = validate(data)
+    except ValidationError as e:
+        return False, (e.errors[0]['message'] if e.errors else str(e))
+    return True, (catalog.name, catalog.description, datetime.strptime(catalog.start_date, '%Y-%m-%d').date(),
+                  datetime.strptime(catalog.end_date, '%Y-%m-%d').date(), catalog.status)
+
+
+@pytest.mark.parametrize('data', CORPUS)
+def test_schema_matches_legacy_validators(data):
+    assert outcome(catalog_schema.validate, data) == outcome(legacy_validate, data)
+
+
+def test_validate_many_matches_validate():
+    valid, invalid = catalog_schema.validate_many(CORPUS)
+    assert sorted([index for index, _ in valid] + [index for index, _ in invalid]) == list(range(len(CORPUS)))
+    for index, catalog in valid:
+        assert catalog.to_dict() == catalog_schema.validate(CORPUS[index]).to_dict()
+    for index, errors in invalid:
+        assert outcome(catalog_schema.validate, CORPUS[index]) == (False, errors[0]['message'])
+
+
+def test_every_invalid_field_is_reported():
+    with pytest.raises(ValidationError) as excinfo:
+        catalog_schema.validate(payload(name="bad_name", end_date="never", status="archived"))
+    assert [error['field'] for error in excinfo.value.errors] == ['name', 'end_date', 'status']
+
+
+def test_patch_returns_columns_and_rejects_unknown_fields():
+    assert catalog_schema.validate_patch({"name": " New ", "status": "Inactive"}) == {
+        "catalog_name": "New", "status": "inactive"}
+    with pytest.raises(ValidationError, match="Unknown catalog field"):
+        catalog_schema.validate_patch({"owner": 1})
+    with pytest.raises(ValidationError):
+        catalog_schema.validate_patch({})
@@ -0,0 +1,348 @@
+from contextlib import contextmanager
+import pytest
+from dto.catalog import Catalog
+from exception.catalog_exception import (DatabaseConnectionError, DataIntegrityError, DataNotFoundError,
+                                        PreconditionFailedError, ValidationError)
+from service.catalog_service import COUNT_CAPPED, COUNT_EXACT, COUNT_NONE, SEARCH_FULLTEXT, CatalogService
+from utils.cache import LRUCache
+from utils.pagination import CURSOR_NEXT, CURSOR_PREV, decode_cursor, encode_cursor
+
+COLUMNS = ('total_count', 'catalog_id', 'catalog_name')
+
+
+class RecordingDatabase:
+    """Stands in for the QueryExecutor: records every statement and answers fetch_rows with preset rows."""
+
+    def __init__(self):
+        self.statements = []
+        self.columns = COLUMNS
+        self.rows = []
+
+    def fetch_rows(self, query: str, params: tuple = None) -> tuple:
+        self.statements.append((' '.join(query.split()), params))
+        return self.columns, list(self.rows)
+
+
+@pytest.fixture
+def database():
+    return RecordingDatabase()
+
+
+@pytest.fixture
+def service(database):
+    service = CatalogService()
+    service.db = database
+    service.search_backend = SEARCH_FULLTEXT
+    service.min_token_size = 3
+    service.count_cap = 100
+    return service
+
+
+def page_rows(total: int, ids: list) -> list:
+    return [(total, catalog_id, f"Catalog {catalog_id}") for catalog_id in ids]
+
+
+def test_page_and_exact_count_share_one_statement(service, database):
+    database.rows = page_rows(25, [30, 29, 28, 27])
+
+    page = service.get_catalogs_page(status_filter='active', per_page=3)
+
+    [(query, params)] = database.statements
+    assert query.startswith("SELECT t.total_count, c.* FROM (SELECT COUNT(*) AS total_count FROM catalog WHERE 1=1 AND status = %s)")
+    assert "LEFT JOIN (SELECT * FROM catalog WHERE 1=1 AND status = %s ORDER BY catalog_id DESC LIMIT %s OFFSET %s)" in query
+    # Count filters first, then the page's filters, limit (one extra row) and offset
+    assert params == ('active', 'active', 4, 0)
+    assert page['total_catalogs'] == 25
+    assert page['columns'] == ('catalog_id', 'catalog_name')
+    assert page['catalogs'] == [(30, 'Catalog 30'), (29, 'Catalog 29'), (28, 'Catalog 28')]
+    assert decode_cursor(page['next_cursor'])['last_id'] == 28
+    assert page['prev_cursor'] is None
+
+
+def test_empty_page_still_reports_the_total(service, database):
+    # Past the last page the LEFT JOIN yields the count with NULL catalog columns
+    database.rows = [(7, None, None)]
+
+    page = service.get_catalogs_page(page=5, per_page=10)
+
+    assert page['total_catalogs'] == 7
+    assert page['catalogs'] == []
+    assert page['next_cursor'] is None and page['prev_cursor'] is None
+
+
+def test_capped_count_stops_at_the_cap(service, database):
+    database.rows = page_rows(101, [5])
+
+    page = service.get_catalogs_page(count_mode=COUNT_CAPPED)
+
+    [(query, params)] = database.statements
+    assert "FROM (SELECT 1 FROM catalog WHERE 1=1 LIMIT %s) AS capped" in query
+    assert params[0] == 101
+    assert page['total_catalogs'] == 100
+    assert page['total_capped'] is True
+
+
+def test_no_count_runs_the_page_query_alone(service, database):
+    database.columns = ('catalog_id', 'catalog_name')
+    database.rows = [(5, 'Catalog 5')]
+
+    page = service.get_catalogs_page(count_mode=COUNT_NONE)
+
+    [(query, params)] = database.statements
+    assert "COUNT" not in query
+    assert page['total_catalogs'] is None
+    assert page['catalogs'] == [(5, 'Catalog 5')]
+
+
+def test_cursor_pages_are_located_by_catalog_id(service, database):
+    database.rows = page_rows(25, [20, 19, 18])
+    cursor = encode_cursor(21, CURSOR_NEXT, 'summer', 'active')
+
+    page = service.get_catalogs_page(cursor=cursor, per_page=2)
+
+    [(query, params)] = database.statements
+    assert "AND catalog_id < %s ORDER BY catalog_id DESC LIMIT %s" in query
+    assert params[-2:] == (21, 3)
+    assert page['search_term'] == 'summer' and page['status_filter'] == 'active'
+    assert decode_cursor(page['next_cursor'])['last_id'] == 19
+    assert decode_cursor(page['prev_cursor'])['last_id'] == 20
+
+
+def test_previous_page_is_read_backwards_and_returned_newest_first(service, database):
+    database.rows = page_rows(25, [22, 23, 24])
+    cursor = encode_cursor(21, CURSOR_PREV)
+
+    page = service.get_catalogs_page(cursor=cursor, per_page=2)
+
+    [(query, _)] = database.statements
+    assert "AND catalog_id > %s ORDER BY catalog_id ASC LIMIT %s" in query
+    assert [row[0] for row in page['catalogs']] == [23, 22]
+    assert decode_cursor(page['prev_cursor'])['last_id'] == 23
+
+
+def test_pages_are_served_from_the_query_cache_until_a_write(service, database):
+    database.rows = page_rows(1, [1])
+    service.get_catalogs_page(count_mode=COUNT_EXACT)
+    service.get_catalogs_page(count_mode=COUNT_EXACT)
+    assert len(database.statements) == 1
+
+    service.query_cache.invalidate()
+    service.get_catalogs_page(count_mode=COUNT_EXACT)
+    assert len(database.statements) == 2
+
+
+def test_fulltext_search_matches_word_prefixes(service):
+    condition, params = service._search_condition("sum sal")
+    assert condition == "(MATCH(catalog_name, catalog_description) AGAINST (%s IN BOOLEAN MODE))"
+    assert params == ["+sum* +sal*"]
+
+
+def test_numeric_search_also_matches_the_catalog_id(service):
+    condition, params = service._search_condition("1234")
+    assert condition == "(catalog_id = %s OR MATCH(catalog_name, catalog_description) AGAINST (%s IN BOOLEAN MODE))"
+    assert params == [1234, "+1234*"]
+
+
+def test_terms_too_short_for_the_index_use_an_escaped_name_prefix(service):
+    assert service._search_condition("5%") == ("(catalog_name LIKE %s)", ["5\\%%"])
+    assert service._search_condition("ab") == ("(catalog_name LIKE %s)", ["ab%"])
+
+
+def test_like_backend_keeps_the_substring_match(service):
+    service.search_backend = 'like'
+    assert service._search_condition("sale") == (
+        "(catalog_id = %s OR catalog_name LIKE %s OR catalog_description LIKE %s)", ["sale", "%sale%", "%sale%"])
+
+
+def test_relevance_order_scores_the_same_boolean_query(service, database):
+    database.columns = COLUMNS + ('relevance',)
+    database.rows = [(2, 8, 'Summer Sale', 1.5), (2, 3, 'Summer Kids', 0.7)]
+
+    page = service.get_catalogs_page(search_term="summer", order_by_relevance=True)
+
+    [(query, params)] = database.statements
+    assert "MATCH(catalog_name, catalog_description) AGAINST (%s IN BOOLEAN MODE) AS relevance" in query
+    assert "ORDER BY c.relevance DESC, c.catalog_id DESC" in query
+    assert params == ("+summer*", "+summer*", "+summer*", 11, 0)
+    assert page['columns'] == ('catalog_id', 'catalog_name')
+    assert page['catalogs'] == [(8, 'Summer Sale'), (3, 'Summer Kids')]
+    assert page['next_cursor'] is None and page['prev_cursor'] is None
+
+
+def test_catalog_read_across_an_update_is_not_cached(service):
+    rows = {7: {"catalog_id": 7, "version": 1}}
+
+    class Table:
+        def fetch_one(self, query, params=None, row_factory=dict):
+            row = dict(rows[params[0]])
+            # An update commits (and invalidates) after this read, before the row is cached
+            rows[7] = {"catalog_id": 7, "version": 2}
+            service._invalidate_catalog(7)
+            return row
+
+    service.db = Table()
+    service.catalog_cache = LRUCache(ttl=5)
+
+    assert service.get_catalog_by_id(7)['version'] == 1
+    assert service.catalog_cache.get(7) is None
+    assert service.catalog_cache.stats()['stale_fills'] == 1
+
+
+def test_entity_cache_is_off_unless_configured(service):
+    assert service.catalog_cache is None
+    assert service.cache_stats() == {"enabled": False}
+
+
+class BulkTable:
+    """Stands in for the QueryExecutor in bulk writes: knows which IDs exist and fails statements touching fail_on IDs."""
+
+    def __init__(self, *catalog_ids):
+        self.catalog_ids = set(catalog_ids)
+        self.fail_on = {}
+        self.statements = []
+        self.transactions = []
+
+    def fetch_all(self, query: str, params: tuple = None, row_factory=dict) -> list:
+        return [(catalog_id,) for catalog_id in params if catalog_id in self.catalog_ids]
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        for catalog_id, error in self.fail_on.items():
+            if catalog_id in params:
+                raise error
+        self.statements.append(' '.join(query.split()).split(' ')[0])
+        return 1
+
+    @contextmanager
+    def transaction(self):
+        try:
+            yield self
+        except BaseException:
+            self.transactions.append('rollback')
+            raise
+        self.transactions.append('commit')
+
+
+@pytest.fixture
+def bulk_table(service):
+    service.db = BulkTable(1, 2, 3, 4)
+    service.bulk_chunk_size = 2
+    return service.db
+
+
+def renamed(name: str) -> Catalog:
+    return Catalog(name=name, description="Seasonal offers", start_date="2031-06-01", end_date="2031-08-31", status="active")
+
+
+def test_best_effort_update_reports_a_rejected_chunk_and_goes_on(service, bulk_table):
+    bulk_table.fail_on = {3: DataIntegrityError("Data too long for column 'catalog_name'")}
+
+    results = service.bulk_update_catalogs([(1, renamed("A")), (9, renamed("B")), (3, renamed("C")), (4, renamed("D"))],
+                                           atomic=False)
+
+    assert [result['status'] for result in results] == ['updated', 'not_found', 'error', 'error']
+    assert "Data too long" in results[2]['error']
+    assert bulk_table.transactions == ['commit', 'rollback']
+    assert service.query_cache.stats()['invalidations'] == 1
+
+
+def test_best_effort_delete_reports_a_rejected_chunk_and_goes_on(service, bulk_table):
+    bulk_table.fail_on = {1: DataIntegrityError("Cannot delete or update a parent row")}
+
+    results = service.bulk_delete_catalogs([1, 2, 3, 9], atomic=False)
+
+    assert [result['status'] for result in results] == ['error', 'error', 'deleted', 'not_found']
+    assert bulk_table.transactions == ['rollback', 'commit']
+
+
+@pytest.mark.parametrize('bulk_write', [
+    lambda service: service.bulk_update_catalogs([(catalog_id, renamed("A")) for catalog_id in (1, 2, 3, 4)], atomic=False),
+    lambda service: service.bulk_delete_catalogs([1, 2, 3, 4], atomic=False),
+])
+def test_best_effort_bulk_write_stops_on_a_connection_error(service, bulk_table, bulk_write):
+    bulk_table.fail_on = {3: DatabaseConnectionError("Lost connection to MySQL server")}
+
+    with pytest.raises(DatabaseConnectionError, match="Lost connection"):
+        bulk_write(service)
+    # The first chunk stays committed; caches are still invalidated
+    assert bulk_table.transactions == ['commit', 'rollback']
+    assert service.query_cache.stats()['invalidations'] == 1
+
+
+def test_atomic_bulk_write_with_a_missing_id_writes_nothing(service, bulk_table):
+    with pytest.raises(DataNotFoundError, match="9"):
+        service.bulk_update_catalogs([(1, renamed("A")), (2, renamed("B")), (9, renamed("C"))])
+    with pytest.raises(DataNotFoundError, match="9"):
+        service.bulk_delete_catalogs([1, 2, 9])
+
+    # The first chunk is written, then the one transaction holding it rolls back
+    assert bulk_table.statements == ['UPDATE', 'UPDATE', 'DELETE']
+    assert bulk_table.transactions == ['rollback', 'rollback']
+
+
+class VersionedTable:
+    """Stands in for the QueryExecutor in single-row writes: answers with preset results and records statements."""
+
+    def __init__(self, version_row=None, written=0):
+        self.version_row = version_row
+        self.written = written
+        self.statements = []
+
+    def insert(self, query: str, params: tuple = ()) -> int:
+        self.statements.append((' '.join(query.split()), params))
+        return self.written
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        return self.insert(query, params)
+
+    def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        self.statements.append((' '.join(query.split()), params))
+        return self.version_row
+
+
+def test_versioned_update_is_one_statement_returning_the_new_version(service):
+    service.db = VersionedTable(written=4)
+
+    assert service.update_catalog_by_id(7, renamed("Summer"), expected_version=3) == 4
+
+    [(query, params)] = service.db.statements
+    assert query.startswith("UPDATE catalog SET catalog_name = %s")
+    assert query.endswith("version = LAST_INSERT_ID(version + 1) WHERE catalog_id = %s AND version = %s")
+    assert params[0] == "Summer" and params[-2:] == (7, 3)
+
+
+def test_stale_version_fails_the_precondition(service):
+    service.db = VersionedTable(version_row={"version": 4})
+
+    with pytest.raises(PreconditionFailedError, match="version 4, expected 3"):
+        service.update_catalog_by_id(7, renamed("Summer"), expected_version=3)
+    # The version is only read back to explain the failure
+    assert [query.split(' ')[0] for query, _ in service.db.statements] == ['UPDATE', 'SELECT']
+
+
+def test_write_to_a_missing_catalog_is_not_found(service):
+    service.db = VersionedTable(version_row=None)
+
+    with pytest.raises(DataNotFoundError):
+        service.patch_catalog_by_id(7, {"status": "inactive"}, expected_version=3)
+    with pytest.raises(DataNotFoundError):
+        service.delete_catalog_by_id(7)
+
+
+def test_patched_date_must_stay_ordered_against_the_stored_one(service):
+    service.db = VersionedTable(version_row={"version": 3})
+
+    with pytest.raises(ValidationError, match="End Date cannot be before Start Date"):
+        service.patch_catalog_by_id(7, {"start_date": "2031-09-01"}, expected_version=3)
+    query, params = service.db.statements[0]
+    assert query.endswith("WHERE catalog_id = %s AND version = %s AND end_date >= %s")
+    assert params == ("2031-09-01", 7, 3, "2031-09-01")
+
+
+def test_versioned_delete_of_a_changed_catalog_fails_the_precondition(service):
+    service.db = VersionedTable(version_row={"version": 5})
+
+    with pytest.raises(PreconditionFailedError):
+        service.delete_catalog_by_id(7, expected_version=3)
+    query, params = service.db.statements[0]
+    assert query == "DELETE FROM catalog WHERE catalog_id = %s AND version = %s"
+    assert params == (7, 3)
@@ -0,0 +1,91 @@
+import gzip
+import zlib
+import pytest
+from flask import Flask, Response
+from utils.compression import ResponseCompressor, init_app, negotiate
+
+BODY = '{"data": "' + 'catalog ' * 500 + '"}'
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    init_app(app, ResponseCompressor(codecs=('gzip', 'deflate'), min_size=1024))
+
+    @app.route('/list')
+    def listing():
+        return Response(BODY, mimetype='application/json')
+
+    @app.route('/small')
+    def small():
+        return Response('{"data": []}', mimetype='application/json')
+
+    @app.route('/catalog')
+    def catalog():
+        response = Response(BODY, mimetype='application/json')
+        response.set_etag('v3')
+        return response
+
+    @app.route('/export')
+    def export():
+        return Response((f'{{"catalog_id": {i}}}\n' for i in range(2000)), mimetype='application/x-ndjson')
+
+    @app.route('/image')
+    def image():
+        return Response(b'\x89PNG' + b'\0' * 4096, mimetype='image/png')
+
+    @app.route('/passthrough')
+    def passthrough():
+        return Response(BODY, mimetype='application/json', direct_passthrough=True)
+
+    return app.test_client()
+
+
+def test_large_json_is_compressed(client):
+    response = client.get('/list', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data).decode('utf-8') == BODY
+
+
+def test_server_preference_wins_among_accepted_codings(client):
+    response = client.get('/list', headers={'Accept-Encoding': 'deflate, gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    response = client.get('/list', headers={'Accept-Encoding': 'gzip;q=0, deflate'})
+    assert zlib.decompress(response.data).decode('utf-8') == BODY
+
+
+def test_response_with_etag_is_not_compressed(client):
+    response = client.get('/catalog', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.headers['ETag'] == '"v3"'
+    assert response.get_data(as_text=True) == BODY
+
+
+def test_streamed_response_is_compressed_chunk_by_chunk(client):
+    response = client.get('/export', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    assert gzip.decompress(response.data).decode('utf-8') == ''.join(f'{{"catalog_id": {i}}}\n' for i in range(2000))
+
+
+@pytest.mark.parametrize('path, headers', [
+    ('/list', {}),
+    ('/list', {'Accept-Encoding': 'br'}),
+    ('/small', {'Accept-Encoding': 'gzip'}),
+    ('/image', {'Accept-Encoding': 'gzip'}),
+    ('/passthrough', {'Accept-Encoding': 'gzip'}),
+])
+def test_response_sent_as_is(client, path, headers):
+    response = client.get(path, headers=headers)
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_head_is_not_compressed(client):
+    assert 'Content-Encoding' not in client.head('/list', headers={'Accept-Encoding': 'gzip'}).headers
+
+
+def test_negotiate_ignores_refused_codings():
+    assert negotiate('gzip;q=0', ('gzip', 'deflate')) is None
+    assert negotiate('*', ('gzip', 'deflate')) == 'gzip'
+    assert negotiate(None, ('gzip',)) is None
@@ -0,0 +1,173 @@
+import pytest
+from exception.catalog_exception import DatabaseConnectionError
+from utils import db_pool
+from utils.db_pool import ConnectionPool
+
+
+class FakeConnection:
+    """Stands in for a mysql.connector connection: records pings, rollbacks and closes."""
+
+    def __init__(self, **connect_args):
+        self.connect_args = connect_args
+        self.in_transaction = False
+        self.ping_fails = False
+        self.rollbacks = 0
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        if self.ping_fails:
+            raise OSError("server has gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Patches the MySQL driver; returns the list of fake connections the pool opens."""
+    connections = []
+
+    def connect(**connect_args):
+        connection = FakeConnection(**connect_args)
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(db_pool.mysql.connector, 'connect', connect)
+    return connections
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the pool's monotonic clock with one the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(db_pool.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_returned_connection_is_reused(opened):
+    pool = ConnectionPool({'host': 'db'}, min_size=0, max_size=2)
+    with pool.get_connection() as first:
+        raw = first.entry.raw
+    with pool.get_connection() as second:
+        assert second.entry.raw is raw
+    assert len(opened) == 1
+    assert pool.stats()['checkouts'] == 2
+
+
+def test_exhausted_pool_times_out(opened):
+    pool = ConnectionPool({}, min_size=0, max_size=1, timeout=0.05)
+    held = pool.get_connection()
+
+    with pytest.raises(DatabaseConnectionError, match="exhausted"):
+        pool.get_connection()
+
+    stats = pool.stats()
+    assert stats['timeouts'] == 1
+    assert stats['in_use'] == 1
+    held.close()
+    assert pool.get_connection().entry.raw is opened[0]
+
+
+def test_discarded_connection_is_closed_and_replaced(opened):
+    pool = ConnectionPool({}, min_size=0, max_size=1)
+    connection = pool.get_connection()
+    connection.discard()
+
+    assert opened[0].closed
+    assert pool.stats()['size'] == 0
+    assert pool.stats()['discarded'] == 1
+    assert pool.get_connection().entry.raw is opened[1]
+
+
+def test_close_twice_is_a_noop(opened):
+    pool = ConnectionPool({}, min_size=0, max_size=1)
+    connection = pool.get_connection()
+    connection.close()
+    connection.close()
+    assert pool.stats()['in_use'] == 0
+    assert pool.stats()['idle'] == 1
+    with pytest.raises(DatabaseConnectionError):
+        connection.entry
+
+
+def test_open_transaction_is_rolled_back_on_release(opened):
+    pool = ConnectionPool({}, min_size=0, max_size=1)
+    connection = pool.get_connection()
+    opened[0].in_transaction = True
+    connection.close()
+    assert opened[0].rollbacks == 1
+    assert not opened[0].closed
+
+
+def test_connection_older_than_recycle_is_replaced(opened, clock):
+    pool = ConnectionPool({}, min_size=0, max_size=1, recycle=60, ping_after=None)
+    pool.get_connection().close()
+
+    clock[0] += 30
+    pool.get_connection().close()
+    assert len(opened) == 1
+
+    clock[0] += 31
+    assert pool.get_connection().entry.raw is opened[1]
+    assert opened[0].closed
+    assert pool.stats()['recycled'] == 1
+
+
+def test_idle_connection_failing_ping_is_replaced(opened, clock):
+    pool = ConnectionPool({}, min_size=0, max_size=1, recycle=0, ping_after=30)
+    pool.get_connection().close()
+    opened[0].ping_fails = True
+
+    clock[0] += 10
+    connection = pool.get_connection()
+    assert connection.entry.raw is opened[0]
+    connection.close()
+
+    clock[0] += 31
+    assert pool.get_connection().entry.raw is opened[1]
+    assert opened[0].closed
+    assert pool.stats()['discarded'] == 1
+
+
+def test_prefill_opens_min_size_connections(opened):
+    pool = ConnectionPool({}, min_size=3, max_size=5)
+    pool.prefill()
+    assert len(opened) == 3
+    assert pool.stats()['idle'] == 3
+
+
+def test_get_pool_builds_a_new_pool_after_fork(opened, monkeypatch):
+    monkeypatch.setattr(db_pool, '_pool', None)
+    monkeypatch.setattr(db_pool, '_pool_pid', None)
+    pid = [100]
+    monkeypatch.setattr(db_pool.os, 'getpid', lambda: pid[0])
+
+    parent = db_pool.get_pool()
+    assert db_pool.get_pool() is parent
+
+    pid[0] = 101
+    child = db_pool.get_pool()
+    assert child is not parent
+    assert db_pool.get_pool() is child
+    assert opened == []
+
+
+def test_close_all_closes_idle_and_returned_connections(opened):
+    pool = ConnectionPool({}, min_size=0, max_size=2)
+    idle = pool.get_connection()
+    in_use = pool.get_connection()
+    idle.close()
+
+    pool.close_all()
+    assert opened[0].closed
+    assert not opened[1].closed
+
+    in_use.close()
+    assert opened[1].closed
+    assert pool.stats()['size'] == 0
+    with pytest.raises(DatabaseConnectionError, match="closed"):
+        pool.get_connection()
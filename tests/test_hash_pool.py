@@ -0,0 +1,68 @@
+import configparser
+import threading
+import time
+import pytest
+from exception.catalog_exception import ServiceUnavailableError
+from utils.hash_pool import HashWorkerPool, build_hash_pool
+
+
+@pytest.fixture
+def gate():
+    """An event blocked hash jobs wait on; set at teardown so no worker thread is left hanging."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def occupy(pool: HashWorkerPool, gate: threading.Event, count: int) -> list:
+    """Starts count logins that hold their slot in the pool until gate is set."""
+    callers = [threading.Thread(target=pool.run, args=(gate.wait,)) for _ in range(count)]
+    for caller in callers:
+        caller.start()
+    while pool.stats()['running'] + pool.stats()['queued'] < count:
+        time.sleep(0.001)
+    return callers
+
+
+def test_run_returns_the_result_and_counts_it():
+    pool = HashWorkerPool(max_workers=1, max_queue=0)
+    assert pool.run(pow, 2, 10) == 1024
+    stats = pool.stats()
+    assert stats['completed'] == 1
+    assert stats['running'] == stats['queued'] == 0
+
+
+def test_saturated_pool_rejects_at_once(gate):
+    pool = HashWorkerPool(max_workers=1, max_queue=1, timeout=5)
+    callers = occupy(pool, gate, 2)
+
+    with pytest.raises(ServiceUnavailableError, match="Too many concurrent logins"):
+        pool.run(pow, 2, 10)
+    assert pool.stats()['rejected'] == 1
+
+    gate.set()
+    for caller in callers:
+        caller.join()
+    assert pool.run(pow, 2, 10) == 1024
+
+
+def test_caller_stops_waiting_after_the_timeout(gate):
+    pool = HashWorkerPool(max_workers=1, max_queue=1, timeout=0.05)
+
+    with pytest.raises(ServiceUnavailableError, match="temporarily overloaded"):
+        pool.run(gate.wait)
+    assert pool.stats()['timeouts'] == 1
+
+
+@pytest.mark.parametrize('hash_workers, hash_queue_size, threads, expected', [
+    (2, 1, 4, (2, 1)),
+    (4, 32, 4, (3, 0)),
+    (1, 8, 4, (1, 2)),
+    (4, 32, 1, (1, 0)),
+])
+def test_admitted_logins_stay_below_the_request_threads(hash_workers, hash_queue_size, threads, expected):
+    config = configparser.ConfigParser()
+    config.read_dict({'auth': {'hash_workers': hash_workers, 'hash_queue_size': hash_queue_size},
+                      'server': {'threads': threads}})
+    pool = build_hash_pool(config)
+    assert (pool.max_workers, pool.max_queue) == expected
@@ -0,0 +1,46 @@
+import logging
+import logging.handlers
+from configparser import ConfigParser
+import pytest
+import utils.logger as logging_setup
+
+
+def logging_config(**options) -> ConfigParser:
+    config = ConfigParser()
+    config.read_dict({'logging': options})
+    return config
+
+
+@pytest.mark.parametrize('rotation, handler_class', [
+    ('size', logging.handlers.RotatingFileHandler),
+    ('time', logging.handlers.TimedRotatingFileHandler),
+    ('external', logging.handlers.WatchedFileHandler),
+])
+def test_rotation_picks_the_file_handler(tmp_path, rotation, handler_class):
+    handler = logging_setup._build_destination_handler(logging_config(file=str(tmp_path / 'app.log'), rotation=rotation))
+    assert type(handler) is handler_class
+    handler.close()
+
+
+def test_worker_processes_switch_to_external_rotation(tmp_path, monkeypatch):
+    config = logging_config(file=str(tmp_path / 'app.log'), rotation='size')
+    rotating = logging_setup._build_destination_handler(config)
+    test_logger = logging.getLogger('catalog_manager.rotation_test')
+    test_logger.propagate = False
+    test_logger.addHandler(rotating)
+    monkeypatch.setattr(logging_setup, 'logger', test_logger)
+    monkeypatch.setattr(logging_setup, 'async_logging', None)
+    monkeypatch.setattr(logging_setup, '_destination_handler', rotating)
+
+    assert logging_setup.use_external_rotation(config)
+    [handler] = test_logger.handlers
+    assert type(handler) is logging.handlers.WatchedFileHandler
+    test_logger.warning("after the switch")
+    handler.close()
+    test_logger.removeHandler(handler)
+    assert "after the switch" in (tmp_path / 'app.log').read_text()
+
+
+@pytest.mark.parametrize('options', [{'file': '', 'rotation': 'size'}, {'rotation': 'external'}, {'rotation': 'none'}])
+def test_stderr_and_shared_safe_files_are_left_alone(options):
+    assert not logging_setup.use_external_rotation(logging_config(**options))
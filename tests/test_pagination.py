@@ -0,0 +1,55 @@
+import base64
+import json
+import pytest
+from exception.catalog_exception import ValidationError
+from utils.pagination import CURSOR_NEXT, CURSOR_PREV, decode_cursor, encode_cursor
+
+
+def raw_cursor(payload) -> str:
+    """A cursor built by hand, bypassing encode_cursor's checks."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+@pytest.mark.parametrize('last_id, direction, search_term, status_filter', [
+    (1, CURSOR_NEXT, '', None),
+    (987654321, CURSOR_PREV, 'summer sale', 'active'),
+    (42, CURSOR_NEXT, 'Été / 50% ?&=', 'inactive'),
+])
+def test_cursor_round_trip(last_id, direction, search_term, status_filter):
+    cursor = encode_cursor(last_id, direction, search_term, status_filter)
+    assert '=' not in cursor and '+' not in cursor and '/' not in cursor
+    assert decode_cursor(cursor) == {
+        "last_id": last_id,
+        "direction": direction,
+        "search_term": search_term,
+        "status_filter": status_filter,
+    }
+
+
+@pytest.mark.parametrize('cursor', [
+    '',
+    'not a cursor!',
+    'e30',                                    # {}
+    raw_cursor([1, 'next']),
+    raw_cursor({"id": "abc", "d": "next"}),
+    raw_cursor({"id": 5, "d": "sideways"}),
+    raw_cursor({"d": "next"}),
+    raw_cursor({"id": None, "d": "next"}),
+    base64.urlsafe_b64encode(b'\xff\xfe').decode('ascii'),
+])
+def test_malformed_cursor_is_a_validation_error(cursor):
+    with pytest.raises(ValidationError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+def test_truncated_cursor_is_a_validation_error():
+    cursor = encode_cursor(12345, CURSOR_NEXT, 'garden', 'active')
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor[:-6])
+
+
+def test_edited_cursor_decodes_to_the_edited_position():
+    # Cursors are opaque, not signed: a well-formed edited cursor is a valid position
+    payload = json.loads(base64.urlsafe_b64decode(encode_cursor(10, CURSOR_NEXT) + '=='))
+    payload['id'] = 99
+    assert decode_cursor(raw_cursor(payload))['last_id'] == 99
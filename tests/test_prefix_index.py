@@ -0,0 +1,73 @@
+import pytest
+from utils.prefix_index import PrefixIndex
+
+
+@pytest.fixture
+def index():
+    index = PrefixIndex()
+    index.build(iter([[(3, 'Summer Sale'), (1, 'summer kids')], [(2, 'Winter'), (4, None)]]))
+    return index
+
+
+def test_build_skips_empty_names_and_orders_by_name(index):
+    assert index.ready
+    assert len(index) == 3
+    assert index.search('SUM') == [(1, 'summer kids'), (3, 'Summer Sale')]
+    assert index.search('sum', limit=1) == [(1, 'summer kids')]
+    assert index.search('') == []
+    assert index.search('x') == []
+
+
+def test_add_remove_and_rename(index):
+    index.add(5, 'Summer Outlet')
+    assert [catalog_id for catalog_id, _ in index.search('summer')] == [1, 5, 3]
+
+    index.add(5, 'Autumn Outlet')
+    assert index.search('summer o') == []
+    assert index.search('autumn') == [(5, 'Autumn Outlet')]
+
+    index.remove(5)
+    index.remove(404)
+    assert index.search('autumn') == []
+    assert len(index) == 3
+
+
+def test_catalogs_sharing_a_name_are_removed_individually(index):
+    index.add(10, 'Winter')
+    index.add(11, 'Winter')
+    index.remove(10)
+    assert index.search('winter') == [(2, 'Winter'), (11, 'Winter')]
+
+
+def test_writes_during_a_rebuild_survive_it(index):
+    def rows_read_while_writes_happen():
+        yield [(1, 'summer kids'), (2, 'Winter')]
+        # Written after the build read these rows: a new catalog, a rename and a delete
+        index.add(6, 'Spring Sale')
+        index.add(2, 'Winter Clearance')
+        index.remove(3)
+        yield [(3, 'Summer Sale')]
+
+    assert index.build(rows_read_while_writes_happen()) == 3
+    assert index.search('s') == [(6, 'Spring Sale'), (1, 'summer kids')]
+    assert index.search('winter') == [(2, 'Winter Clearance')]
+
+
+def test_failed_rebuild_keeps_entries_and_stops_journaling(index):
+    def broken_rows():
+        yield [(7, 'Garden')]
+        raise ConnectionError("lost connection while reading")
+
+    with pytest.raises(ConnectionError):
+        index.build(broken_rows())
+
+    assert index.search('summer') == [(1, 'summer kids'), (3, 'Summer Sale')]
+    assert index.search('garden') == []
+    assert index._journal is None
+
+
+def test_stats_counts_entries(index):
+    stats = index.stats()
+    assert stats['entries'] == 3
+    assert stats['memory_bytes'] > 0
+    assert stats['built_at'] == index.built_at
@@ -0,0 +1,114 @@
+import asyncio
+import configparser
+import pytest
+from utils.query_cache import (CacheBackend, GenerationalQueryCache, InProcessCacheBackend, LocalSharedStore,
+                               SharedStoreCacheBackend, check_query_cache_backend)
+
+
+def shared_caches(count: int) -> list:
+    """Query caches of count simulated worker processes sharing one store."""
+    store = LocalSharedStore()
+    return [GenerationalQueryCache(SharedStoreCacheBackend(store), namespace='catalog_list', ttl=30)
+            for _ in range(count)]
+
+
+def test_backend_missing_methods_fails_at_construction():
+    class PartialBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialBackend()
+
+
+def test_shared_store_serves_results_cached_by_another_worker():
+    first, second = shared_caches(2)
+    assert first.get_or_load(('page', 1), lambda: ['a']) == ['a']
+    assert second.get_or_load(('page', 1), lambda: pytest.fail("should be served from the shared store")) == ['a']
+
+
+def test_invalidation_in_one_worker_invalidates_the_others():
+    first, second = shared_caches(2)
+    first.get_or_load(('page', 1), lambda: ['before'])
+    second.get_or_load(('page', 1), lambda: ['before'])
+
+    first.invalidate()
+
+    assert second.get_or_load(('page', 1), lambda: ['after']) == ['after']
+    assert first.get_or_load(('page', 1), lambda: ['stale']) == ['after']
+    assert first.stats()['generation'] == second.stats()['generation'] == 1
+
+
+def test_in_process_backends_do_not_share_invalidation():
+    first = GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list')
+    second = GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list')
+    first.get_or_load(('page', 1), lambda: ['before'])
+    second.get_or_load(('page', 1), lambda: ['before'])
+
+    first.invalidate()
+
+    assert second.get_or_load(('page', 1), lambda: ['after']) == ['before']
+
+
+@pytest.mark.parametrize('make_backend', [InProcessCacheBackend, lambda: SharedStoreCacheBackend(LocalSharedStore())])
+def test_result_loaded_across_an_invalidation_is_not_served(make_backend):
+    cache = GenerationalQueryCache(make_backend(), namespace='catalog_list')
+
+    def load_racing_a_write():
+        # A write commits and invalidates while this (now stale) result is being read
+        cache.invalidate()
+        return ['stale']
+
+    assert cache.get_or_load(('page', 1), load_racing_a_write) == ['stale']
+    assert cache.get_or_load(('page', 1), lambda: ['fresh']) == ['fresh']
+    assert cache.get_or_load(('page', 1), lambda: pytest.fail("should be cached")) == ['fresh']
+
+
+def test_async_result_loaded_across_an_invalidation_is_not_served():
+    cache = GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list')
+
+    async def load_racing_a_write():
+        cache.invalidate()
+        return ['stale']
+
+    async def load_fresh():
+        return ['fresh']
+
+    assert asyncio.run(cache.get_or_load_async(('page', 1), load_racing_a_write)) == ['stale']
+    assert asyncio.run(cache.get_or_load_async(('page', 1), load_fresh)) == ['fresh']
+
+def test_local_shared_store_expires_values(monkeypatch):
+    store = LocalSharedStore()
+    now = [100.0]
+    monkeypatch.setattr('utils.query_cache.time.monotonic', lambda: now[0])
+    store.set('key', b'value', ex=5)
+    assert store.get('key') == b'value'
+    now[0] += 5
+    assert store.get('key') is None
+    assert store.incr('counter') == 1
+    assert store.incr('counter') == 2
+    assert store.get('counter') == b'2'
+
+
+@pytest.mark.parametrize('backend, workers, warns', [
+    ('memory', 4, True),
+    ('memory', 1, False),
+    ('redis', 4, False),
+])
+def test_memory_backend_is_flagged_for_multiple_workers(backend, workers, warns):
+    config = configparser.ConfigParser()
+    config.read_dict({'query_cache': {'backend': backend}})
+    assert (check_query_cache_backend(config, workers) is not None) == warns
+
+
+def test_disabled_cache_always_loads_and_stores_nothing():
+    cache = GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list')
+    cache.disable()
+    loads = []
+
+    assert cache.get_or_load(('page',), lambda: loads.append(1) or 'fresh') == 'fresh'
+    assert cache.get_or_load(('page',), lambda: loads.append(2) or 'fresh') == 'fresh'
+    cache.invalidate()
+    assert loads == [1, 2]
+    assert cache.stats() == {"enabled": False}
+    assert cache.backend.stats()['size'] == 0
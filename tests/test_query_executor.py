@@ -0,0 +1,160 @@
+import mysql.connector
+import pytest
+from exception.catalog_exception import DatabaseConnectionError, DataIntegrityError
+from utils import query_executor
+from utils.query_executor import QueryExecutor
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.column_names = ()
+        self.lastrowid = None
+        self.rowcount = -1
+        self.closed = False
+        self._rows = []
+
+    def execute(self, query, params=()):
+        self.connection.statements.append((query, params))
+        error = self.connection.fail_with
+        if error is not None:
+            raise error
+        self.column_names, self._rows = self.connection.result
+        self.lastrowid = self.connection.lastrowid
+        self.rowcount = len(self._rows) or 1
+
+    def executemany(self, query, rows):
+        self.connection.statements.append((query, rows))
+        self.lastrowid = self.connection.lastrowid
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Stands in for a pooled connection: records statements, cursors and how it was handed back."""
+
+    def __init__(self):
+        self.statements = []
+        self.cursors = []
+        self.result = ((), [])
+        self.lastrowid = 41
+        self.fail_with = None
+        self.events = []
+
+    def cursor(self):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def start_transaction(self):
+        self.events.append('begin')
+
+    def commit(self):
+        self.events.append('commit')
+
+    def rollback(self):
+        self.events.append('rollback')
+
+    def close(self):
+        self.events.append('close')
+
+    def discard(self):
+        self.events.append('discard')
+
+
+class HandedOut(list):
+    """The fake connections checked out so far; result and fail_with apply to the next ones."""
+    result = (('catalog_id', 'catalog_name'), [(1, 'Summer'), (2, 'Winter')])
+    fail_with = None
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Makes the executor check out fake connections; returns the HandedOut list."""
+    handed_out = HandedOut()
+
+    def get_connection():
+        connection = FakeConnection()
+        connection.result = handed_out.result
+        connection.fail_with = handed_out.fail_with
+        handed_out.append(connection)
+        return connection
+
+    monkeypatch.setattr(query_executor, 'get_connection', get_connection)
+    return handed_out
+
+
+@pytest.fixture
+def db():
+    return QueryExecutor()
+
+
+def test_fetch_shapes_rows(db, connections):
+    assert db.fetch_all("SELECT 1") == [{"catalog_id": 1, "catalog_name": 'Summer'},
+                                        {"catalog_id": 2, "catalog_name": 'Winter'}]
+    assert db.fetch_all("SELECT 1", row_factory=tuple) == [(1, 'Summer'), (2, 'Winter')]
+    assert db.fetch_one("SELECT 1", (1,), row_factory=lambda row: row['catalog_name']) == 'Summer'
+    assert db.fetch_rows("SELECT 1") == (('catalog_id', 'catalog_name'), [(1, 'Summer'), (2, 'Winter')])
+
+
+def test_fetch_one_without_rows_is_none(db, connections):
+    connections.result = (('catalog_id',), [])
+    assert db.fetch_one("SELECT 1") is None
+
+
+def test_write_modes_return_their_result(db, connections):
+    assert db.insert("INSERT INTO catalog VALUES (%s)", ('x',)) == 41
+    assert db.execute("DELETE FROM catalog") == 2
+    assert db.insert_many("INSERT INTO catalog VALUES (%s)", [('a',), ('b',)]) == 41
+    assert connections[2].statements == [("INSERT INTO catalog VALUES (%s)", [('a',), ('b',)])]
+
+
+def test_every_statement_closes_its_cursor_and_returns_its_connection(db, connections):
+    db.fetch_all("SELECT 1")
+    db.execute("UPDATE catalog SET status = %s", ('active',))
+    for connection in connections:
+        assert [cursor.closed for cursor in connection.cursors] == [True]
+        assert connection.events == ['close']
+
+
+@pytest.mark.parametrize('error_class', [mysql.connector.errors.IntegrityError, mysql.connector.errors.DataError])
+def test_rejected_data_raises_data_integrity_error(db, connections, error_class):
+    connections.fail_with = error_class(msg="Duplicate entry 'x'", errno=1062)
+
+    with pytest.raises(DataIntegrityError, match="Duplicate entry"):
+        db.insert("INSERT INTO catalog VALUES (%s)", ('x',))
+    # The connection itself is fine, so it goes back to the pool
+    assert connections[0].events == ['close']
+
+
+def test_lost_connection_is_discarded_and_not_a_row_error(db, connections):
+    connections.fail_with = mysql.connector.errors.OperationalError(msg="Lost connection to MySQL server", errno=2013)
+
+    with pytest.raises(DatabaseConnectionError) as excinfo:
+        db.fetch_all("SELECT 1")
+    assert not isinstance(excinfo.value, DataIntegrityError)
+    assert connections[0].events == ['discard']
+
+
+def test_transaction_runs_statements_on_one_connection(db, connections):
+    with db.transaction():
+        db.insert("INSERT INTO catalog VALUES (%s)", ('a',))
+        with db.transaction():
+            db.execute("UPDATE catalog SET status = %s", ('active',))
+
+    assert len(connections) == 1
+    assert len(connections[0].statements) == 2
+    assert connections[0].events == ['begin', 'commit', 'close']
+
+
+def test_transaction_rolls_back_when_an_error_escapes(db, connections):
+    with pytest.raises(ValueError):
+        with db.transaction():
+            db.insert("INSERT INTO catalog VALUES (%s)", ('a',))
+            raise ValueError("validation failed half way")
+
+    assert connections[0].events == ['begin', 'rollback', 'close']
@@ -0,0 +1,254 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+import pytest
+from flask_jwt_extended import create_access_token, get_csrf_token
+import app as flask_app
+from dto.user import User
+from exception.catalog_exception import DatabaseConnectionError, ServiceUnavailableError
+from utils.query_cache import GenerationalQueryCache, InProcessCacheBackend
+
+CATALOG = {
+    "catalog_id": 7, "catalog_name": "Summer Sale", "catalog_description": "Seasonal offers",
+    "start_date": "2031-06-01", "end_date": "2031-08-31", "status": "active", "user_id": 1, "version": 3,
+}
+
+
+class CatalogTable:
+    """Stands in for the QueryExecutor behind the catalog service, keeping catalog rows in a dict."""
+
+    def __init__(self, *rows):
+        self.rows = {row['catalog_id']: dict(row) for row in rows}
+        self.reads = 0
+        self.fail_with = None
+
+    def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        self.reads += 1
+        return self.rows.get(params[0])
+
+    def fetch_all(self, query: str, params: tuple = None, row_factory=dict) -> list:
+        # Only the bulk writes' existing-ID lookup reads several rows
+        return [(catalog_id,) for catalog_id in params if catalog_id in self.rows]
+
+    def _matching_row(self, query: str, params: tuple) -> dict | None:
+        """The row a single-row write targets (WHERE catalog_id = %s [AND version = %s]), if it matches."""
+        if "AND version = %s" in query:
+            catalog_id, expected_version = params[-2:]
+        else:
+            catalog_id, expected_version = params[-1], None
+        row = self.rows.get(catalog_id)
+        if row is None or expected_version not in (None, row['version']):
+            return None
+        return row
+
+    def insert(self, query: str, params: tuple = ()) -> int:
+        # Full updates only: the version is bumped and reported back like LAST_INSERT_ID(version + 1)
+        row = self._matching_row(query, params)
+        if row is None:
+            return 0
+        row['catalog_name'] = params[0]
+        row['version'] += 1
+        return row['version']
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        if self.fail_with is not None:
+            raise self.fail_with
+        if query.startswith("DELETE FROM catalog WHERE catalog_id IN"):
+            return sum(1 for catalog_id in params if self.rows.pop(catalog_id, None))
+        row = self._matching_row(query, params)
+        if row is None:
+            return 0
+        del self.rows[row['catalog_id']]
+        return 1
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+
+@pytest.fixture
+def catalogs(monkeypatch):
+    table = CatalogTable(CATALOG)
+    service = flask_app.catalog_service
+    monkeypatch.setattr(service, 'db', table)
+    monkeypatch.setattr(service, 'catalog_cache', None)
+    monkeypatch.setattr(service, 'query_cache', GenerationalQueryCache(InProcessCacheBackend(), namespace='catalog_list'))
+    return table
+
+
+@pytest.fixture
+def client():
+    return flask_app.app.test_client()
+
+
+@pytest.fixture
+def csrf_headers(client):
+    """Signs the client in with a JWT cookie; returns the CSRF header that writes must send with it."""
+    with flask_app.app.app_context():
+        token = create_access_token(identity='1', additional_claims={"username": "alice", "email": "alice@example.com"})
+        csrf_token = get_csrf_token(token)
+    client.set_cookie('access_token_cookie', token)
+    return {'X-CSRF-TOKEN': csrf_token}
+
+
+def catalog_item(**changes) -> dict:
+    start = date.today() + timedelta(days=30)
+    item = {"name": "Summer Sale", "description": "Seasonal offers", "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=60)).isoformat(), "status": "active"}
+    item.update(changes)
+    return item
+
+
+def test_catalog_carries_its_version_as_a_strong_etag(client, catalogs):
+    response = client.get('/api/catalogs/7')
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"v3"'
+    assert 'no-cache' in response.headers['Cache-Control']
+    assert response.get_json()['data']['catalog_name'] == "Summer Sale"
+
+
+def test_matching_if_none_match_is_not_modified(client, catalogs):
+    response = client.get('/api/catalogs/7', headers={'If-None-Match': '"v3"'})
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == '"v3"'
+
+
+def test_stale_if_none_match_gets_the_current_catalog(client, catalogs):
+    catalogs.rows[7]['version'] = 4
+
+    response = client.get('/api/catalogs/7', headers={'If-None-Match': '"v3"'})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"v4"'
+
+
+def test_missing_catalog_is_not_found(client, catalogs):
+    assert client.get('/api/catalogs/404').status_code == 404
+
+
+def test_bulk_writes_require_a_login(client, catalogs):
+    assert client.delete('/api/catalogs/bulk', json={"ids": [7]}).status_code == 401
+    assert 7 in catalogs.rows
+
+
+def test_atomic_bulk_create_with_an_invalid_item_writes_nothing(client, catalogs, csrf_headers):
+    response = client.post('/api/catalogs/bulk', headers=csrf_headers,
+                           json={"items": [catalog_item(), catalog_item(name="bad_name")]})
+
+    assert response.status_code == 400
+    data = response.get_json()['data']
+    assert [result['status'] for result in data['results']] == ['skipped', 'error']
+    assert data['results'][1]['errors'][0]['field'] == 'name'
+    assert data['succeeded'] == 0 and data['failed'] == 1
+
+
+def test_best_effort_bulk_delete_reports_each_id(client, catalogs, csrf_headers):
+    response = client.delete('/api/catalogs/bulk', headers=csrf_headers, json={"ids": [7, 8], "mode": "best_effort"})
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['results'] == [{"index": 0, "status": "deleted", "catalog_id": 7},
+                               {"index": 1, "status": "not_found", "catalog_id": 8}]
+    assert data['succeeded'] == 1 and data['failed'] == 1
+    assert catalogs.rows == {}
+
+
+def test_atomic_bulk_delete_with_an_unknown_id_is_not_found(client, catalogs, csrf_headers):
+    response = client.delete('/api/catalogs/bulk', headers=csrf_headers, json={"ids": [7, 8]})
+
+    assert response.status_code == 404
+    assert "8" in response.get_json()['details']
+    assert 7 in catalogs.rows
+
+
+def test_best_effort_bulk_delete_fails_when_the_database_is_lost(client, catalogs, csrf_headers):
+    catalogs.fail_with = DatabaseConnectionError("Lost connection to MySQL server")
+
+    response = client.delete('/api/catalogs/bulk', headers=csrf_headers, json={"ids": [7], "mode": "best_effort"})
+
+    assert response.status_code == 500
+    assert response.get_json()['message'] == "Database Error"
+
+
+def test_login_sets_the_jwt_cookies(client, monkeypatch):
+    user = User(username="alice", password_hash=None, email="alice@example.com", user_id=1)
+    monkeypatch.setattr(flask_app.authentication_service, 'authenticate_user', lambda username_or_email, password: user)
+
+    response = client.post('/api/login', json={"username_or_email": "alice", "password": "secret"})
+
+    assert response.status_code == 200
+    cookies = response.headers.getlist('Set-Cookie')
+    assert any(cookie.startswith('access_token_cookie=') for cookie in cookies)
+    assert any(cookie.startswith('csrf_access_token=') for cookie in cookies)
+
+
+def test_login_beyond_hashing_capacity_is_retried_later(client, monkeypatch):
+    def saturated(username_or_email, password):
+        raise ServiceUnavailableError("Too many concurrent logins. Please retry shortly.")
+    monkeypatch.setattr(flask_app.authentication_service, 'authenticate_user', saturated)
+
+    response = client.post('/api/login', json={"username_or_email": "alice", "password": "secret"})
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+
+def test_current_user_comes_from_the_token_claims(client, csrf_headers, monkeypatch):
+    def no_query(user_id):
+        raise AssertionError("tokens with claims need no user query")
+    monkeypatch.setattr(flask_app.user_service, 'get_user_by_id_cached', no_query)
+
+    response = client.get('/api/me')
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['username'] == "alice"
+    assert response.get_json()['data']['user_id'] == 1
+
+
+def test_token_without_claims_resolves_the_user_through_the_cache(client, monkeypatch):
+    user = User(username="bob", password_hash="$2b$12$stored", email="bob@example.com", user_id=2)
+    lookups = []
+    monkeypatch.setattr(flask_app.user_service, 'get_user_by_id_cached', lambda user_id: lookups.append(user_id) or user)
+    with flask_app.app.app_context():
+        client.set_cookie('access_token_cookie', create_access_token(identity='2'))
+
+    response = client.get('/api/me')
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['username'] == "bob"
+    assert lookups == [2]
+
+
+def test_update_with_the_current_etag_returns_the_next_one(client, catalogs, csrf_headers):
+    response = client.put('/api/catalogs/7', headers={**csrf_headers, 'If-Match': '"v3"'}, json=catalog_item(name="Winter Sale"))
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"v4"'
+    assert response.get_json()['data'] == {"catalog_id": 7, "version": 4}
+    assert catalogs.rows[7]['catalog_name'] == "Winter Sale"
+
+
+@pytest.mark.parametrize('if_match', ['"v2"', 'W/"v3"', '"abc"'])
+def test_update_with_a_stale_etag_is_a_failed_precondition(client, catalogs, csrf_headers, if_match):
+    response = client.put('/api/catalogs/7', headers={**csrf_headers, 'If-Match': if_match}, json=catalog_item(name="Winter Sale"))
+
+    assert response.status_code == 412
+    assert response.get_json()['message'] == "Precondition Failed"
+    assert catalogs.rows[7]['version'] == 3 and catalogs.rows[7]['catalog_name'] == "Summer Sale"
+
+
+def test_delete_only_removes_the_version_the_client_saw(client, catalogs, csrf_headers):
+    stale = client.delete('/api/catalogs/7', headers={**csrf_headers, 'If-Match': '"v2"'})
+    assert stale.status_code == 412
+    assert 7 in catalogs.rows
+
+    current = client.delete('/api/catalogs/7', headers={**csrf_headers, 'If-Match': '"v3"'})
+    assert current.status_code == 200
+    assert 7 not in catalogs.rows
+
+
+def test_update_without_if_match_only_needs_the_catalog_to_exist(client, catalogs, csrf_headers):
+    assert client.put('/api/catalogs/7', headers=csrf_headers, json=catalog_item()).status_code == 200
+    assert client.put('/api/catalogs/8', headers=csrf_headers, json=catalog_item()).status_code == 404
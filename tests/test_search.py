@@ -0,0 +1,22 @@
+import pytest
+from utils.search import build_boolean_query, escape_like
+
+
+@pytest.mark.parametrize('search_term, expected', [
+    ("sum sal", "+sum* +sal*"),
+    ("Summer", "+Summer*"),
+    ('+summer -"sale" (kids)* @2', "+summer* +sale* +kids*"),
+    ("to be", None),
+    ("", None),
+    (None, None),
+])
+def test_boolean_query_requires_every_indexable_word_as_a_prefix(search_term, expected):
+    assert build_boolean_query(search_term, min_token_size=3) == expected
+
+
+def test_min_token_size_follows_the_server_setting():
+    assert build_boolean_query("a to be", min_token_size=2) == "+to* +be*"
+
+
+def test_escape_like_matches_wildcards_literally():
+    assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
@@ -0,0 +1,58 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+import pytest
+from flask import Flask
+from exception.catalog_exception import PreconditionFailedError, ValidationError
+from utils.serialization import catalog_etag, json_with_data, parse_if_match, rows_to_json, serialize_catalog_for_json
+
+COLUMNS = ('catalog_id', 'catalog_name', 'start_date', 'updated_at', 'price', 'active', 'score', 'owner')
+
+
+def test_rows_to_json_matches_the_flask_encoding():
+    rows = [
+        (1, 'Summer "Sale"\n', date(2031, 1, 5), datetime(2031, 1, 5, 12, 30), Decimal('9.90'), True, 1.5, None),
+        (2, 'Été ☀ \U0001f31e', date(2031, 12, 31), datetime(2031, 12, 31), Decimal('0'), False, 0.0, 'ops'),
+    ]
+    app = Flask(__name__)
+    with app.app_context():
+        expected = json.loads(app.json.dumps([serialize_catalog_for_json(dict(zip(COLUMNS, row))) for row in rows]))
+
+    encoded = rows_to_json(COLUMNS, rows)
+    assert encoded.isascii()
+    assert json.loads(encoded) == expected
+
+
+def test_rows_to_json_of_no_rows():
+    assert rows_to_json(COLUMNS, []) == '[]'
+
+
+def test_rows_to_json_falls_back_for_other_types():
+    assert json.loads(rows_to_json(('tags',), [(['a', 'b'],)])) == [{"tags": ['a', 'b']}]
+
+
+def test_json_with_data_embeds_encoded_data():
+    data = rows_to_json(('catalog_id',), [(1,), (2,)])
+    assert json.loads(json_with_data({"count": 2, "next": None}, data)) == {
+        "count": 2, "next": None, "data": [{"catalog_id": 1}, {"catalog_id": 2}]}
+    assert json.loads(json_with_data({}, data)) == {"data": [{"catalog_id": 1}, {"catalog_id": 2}]}
+
+
+def test_etag_round_trips_through_if_match():
+    assert parse_if_match(f'"{catalog_etag(7)}"') == 7
+
+
+@pytest.mark.parametrize('header', [None, '', '*'])
+def test_absent_or_star_if_match_names_no_version(header):
+    assert parse_if_match(header) is None
+
+
+@pytest.mark.parametrize('header', ['W/"v7"', '"7"', '"vx"', '"v-1"', '"etag-from-elsewhere"'])
+def test_weak_or_foreign_etag_fails_the_precondition(header):
+    with pytest.raises(PreconditionFailedError):
+        parse_if_match(header)
+
+
+def test_several_etags_are_rejected():
+    with pytest.raises(ValidationError):
+        parse_if_match('"v1", "v2"')
@@ -0,0 +1,50 @@
+import pytest
+from service.user_service import UserService
+
+ALICE = (1, "alice", "alice@example.com", "$2b$12$stored", None)
+
+
+class UserRows:
+    """Stands in for the QueryExecutor behind UserService: one user row, counting reads."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        self.reads += 1
+        return ALICE if params[0] == 1 else None
+
+    def execute(self, query: str, params: tuple = ()) -> int:
+        return 1
+
+
+@pytest.fixture
+def users():
+    service = UserService()
+    service.db = UserRows()
+    return service
+
+
+def test_identity_is_resolved_once_per_process(users):
+    assert users.get_user_by_id_cached(1).username == "alice"
+    assert users.get_user_by_id_cached(1).username == "alice"
+    assert users.db.reads == 1
+    assert users.user_cache_stats()['hits'] == 1
+
+
+def test_cached_user_is_handed_out_as_a_copy(users):
+    users.get_user_by_id_cached(1).username = "changed by a request"
+    assert users.get_user_by_id_cached(1).username == "alice"
+
+
+def test_unknown_identity_is_not_cached(users):
+    assert users.get_user_by_id_cached(2) is None
+    assert users.get_user_by_id_cached(2) is None
+    assert users.db.reads == 2
+
+
+def test_password_change_drops_the_cached_user(users):
+    users.get_user_by_id_cached(1)
+    users.update_password_hash(1, "$2b$12$new", expected_hash="$2b$12$stored")
+    users.get_user_by_id_cached(1)
+    assert users.db.reads == 2
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import mimetypes
+import os
+from flask import Flask, request, send_from_directory, url_for
+from utils.compression import CODECS, compress, negotiate
+from utils.logger import logger
+
+# Fingerprinted copies and the manifest live in static/dist (a build output, not committed)
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+# Precompressed variants written next to each fingerprinted file, in serving preference order
+PRECOMPRESSED_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.html', '.json', '.txt', '.map')
+
+
+def _fingerprinted_name(path: str, data: bytes) -> str:
+    name, extension = os.path.splitext(path)
+    return f"{name}.{hashlib.sha256(data).hexdigest()[:12]}{extension}"
+
+
+def _write_file(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.tmp", 'wb') as output:
+        output.write(data)
+    os.replace(f"{path}.tmp", path)
+
+
+def build_assets(static_folder: str) -> dict:
+    """
+    Copies every static file to static/dist under a content-hashed name (css/style.css ->
+    css/style.<hash>.css), writes zstd/gzip variants of text assets when they are smaller, and
+    saves the logical -> hashed name mapping as dist/manifest.json. Returns the manifest.
+    Files from earlier builds are kept, so pages rendered before a deploy can still load them.
+    """
+    dist_folder = os.path.join(static_folder, DIST_DIR)
+    codecs = [encoding for encoding in PRECOMPRESSED_SUFFIXES if encoding in CODECS]
+    manifest = {}
+    for root, directories, files in os.walk(static_folder):
+        if os.path.abspath(root) == os.path.abspath(static_folder):
+            directories[:] = [directory for directory in directories if directory != DIST_DIR]
+        for file_name in sorted(files):
+            source = os.path.join(root, file_name)
+            logical = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            with open(source, 'rb') as asset:
+                data = asset.read()
+            hashed = _fingerprinted_name(logical, data)
+            manifest[logical] = hashed
+
+            target = os.path.join(dist_folder, hashed)
+            if os.path.exists(target):
+                continue
+            _write_file(target, data)
+            if logical.endswith(COMPRESSIBLE_EXTENSIONS):
+                for encoding in codecs:
+                    compressed = compress(data, encoding, level=9)
+                    if len(compressed) < len(data):
+                        _write_file(target + PRECOMPRESSED_SUFFIXES[encoding], compressed)
+
+    _write_file(os.path.join(dist_folder, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    logger.info("Built %s static assets into %s.", len(manifest), dist_folder)
+    return manifest
+
+
+class StaticAssets:
+    """
+    Serves fingerprinted static files built by build_assets().
+    asset_url('css/style.css') (a template global) points to the hashed copy when the manifest
+    lists it, and those URLs are served with a long max-age and Cache-Control: immutable,
+    using a precompressed variant when the client accepts it. Without a build, templates fall back
+    to the plain files, which are served with no-cache so browsers revalidate them.
+    """
+
+    def __init__(self, static_folder: str, max_age: int = 31536000):
+        self.static_folder = static_folder
+        self.max_age = max_age
+        self.manifest = {}
+
+    def load_manifest(self) -> None:
+        path = os.path.join(self.static_folder, DIST_DIR, MANIFEST_NAME)
+        try:
+            with open(path, encoding='utf-8') as manifest_file:
+                self.manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            self.manifest = {}
+        except (OSError, ValueError) as e:
+            logger.error("Could not read static asset manifest %s: %s", path, e)
+            self.manifest = {}
+
+    def asset_url(self, filename: str) -> str:
+        """Returns the URL of a static file, fingerprinted when the asset build includes it."""
+        hashed = self.manifest.get(filename)
+        if hashed is None:
+            return url_for('static', filename=filename)
+        return url_for('static', filename=f"{DIST_DIR}/{hashed}")
+
+    def send_static_file(self, filename: str):
+        """View for the 'static' endpoint."""
+        if not filename.startswith(f"{DIST_DIR}/"):
+            response = send_from_directory(self.static_folder, filename)
+            response.cache_control.no_cache = True
+            return response
+
+        encodings = [encoding for encoding, suffix in PRECOMPRESSED_SUFFIXES.items()
+                     if os.path.isfile(os.path.join(self.static_folder, filename + suffix))]
+        encoding = negotiate(request.headers.get('Accept-Encoding'), tuple(encodings))
+        path = filename + PRECOMPRESSED_SUFFIXES[encoding] if encoding else filename
+        response = send_from_directory(self.static_folder, path, max_age=self.max_age,
+                                       mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if encodings:
+            response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+
+def init_app(app: Flask, max_age: int = 31536000) -> StaticAssets:
+    """Loads the asset manifest, registers asset_url() for templates and serves the 'static' endpoint."""
+    assets = StaticAssets(app.static_folder, max_age=max_age)
+    assets.load_manifest()
+    app.add_template_global(assets.asset_url, 'asset_url')
+    app.view_functions['static'] = assets.send_static_file
+    return assets
@@ -0,0 +1,290 @@
+import asyncio
+import time
+from collections import deque
+import mysql.connector
+import mysql.connector.aio
+from exception.catalog_exception import DatabaseConnectionError
+from utils.config import get_config
+from utils.db_pool import connect_args_from_config
+from utils.logger import logger
+
+
+class _AsyncPoolEntry:
+    """Book-keeping for one physical asyncio MySQL connection owned by the pool."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class AsyncPooledConnection:
+    """
+    Thin proxy around a pooled asyncio MySQL connection.
+    Behaves like the underlying connection, except that close() hands it back to the pool.
+    """
+
+    def __init__(self, pool: 'AsyncConnectionPool', entry: _AsyncPoolEntry):
+        self._pool = pool
+        self._entry = entry
+
+    @property
+    def entry(self) -> _AsyncPoolEntry:
+        if self._entry is None:
+            raise DatabaseConnectionError("Connection has already been returned to the pool.")
+        return self._entry
+
+    def __getattr__(self, name):
+        return getattr(self.entry.raw, name)
+
+    async def close(self) -> None:
+        """Returns the connection to the pool. Calling close() twice is a no-op."""
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            await self._pool._release(entry)
+
+    async def discard(self) -> None:
+        """Closes the physical connection instead of returning it, e.g. after a broken socket."""
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            await self._pool._release(entry, broken=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class AsyncConnectionPool:
+    """
+    Bounded pool of mysql.connector.aio connections for one event loop.
+    Same policy as ConnectionPool (min/max size, validation of idle connections, recycling by age,
+    checkout timeout), but waiting for a connection suspends the coroutine instead of blocking a thread,
+    so any number of in-flight requests can share one OS thread.
+    """
+
+    def __init__(self, connect_args: dict, min_size: int = 1, max_size: int = 10, timeout: float = 5.0,
+                 recycle: float = 1800, ping_after: float = 30):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self.connect_args = connect_args
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+
+        self._idle = deque()
+        self._size = 0
+        self._in_use = 0
+        self._cond = asyncio.Condition()
+        self._closed = False
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._discarded = 0
+
+    async def _connect(self) -> _AsyncPoolEntry:
+        raw = await mysql.connector.aio.connect(**self.connect_args)
+        self._created += 1
+        logger.info("Opened new async pooled connection to the MySQL database.")
+        return _AsyncPoolEntry(raw)
+
+    @staticmethod
+    async def _close_raw(entry: _AsyncPoolEntry) -> None:
+        try:
+            await entry.raw.close()
+        except Exception:
+            pass
+
+    async def prefill(self) -> None:
+        """Opens connections until the pool holds at least min_size of them."""
+        while self._size < self.min_size:
+            self._size += 1
+            try:
+                entry = await self._connect()
+            except Exception:
+                self._size -= 1
+                raise
+            async with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    async def _is_usable(self, entry: _AsyncPoolEntry) -> bool:
+        now = time.monotonic()
+        if self.recycle and now - entry.created_at > self.recycle:
+            self._recycled += 1
+            return False
+        if self.ping_after is not None and now - entry.last_used > self.ping_after:
+            try:
+                await entry.raw.ping(reconnect=False)
+            except Exception:
+                logger.warning("Discarding stale async pooled connection that failed validation.")
+                self._discarded += 1
+                return False
+        return True
+
+    async def get_connection(self) -> AsyncPooledConnection:
+        """
+        Checks a connection out of the pool, opening a new one if below max_size.
+        Raises DatabaseConnectionError if none becomes available within the timeout.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        entry = None
+
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseConnectionError("Connection pool is closed.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    logger.error("Async connection pool exhausted: no connection available within %ss.", self.timeout)
+                    raise DatabaseConnectionError(
+                        f"Connection pool exhausted: no connection available within {self.timeout} seconds."
+                    )
+                waited = True
+                try:
+                    await asyncio.wait_for(self._cond.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+            self._checkouts += 1
+            if waited:
+                elapsed = time.monotonic() - start
+                self._waits += 1
+                self._wait_time += elapsed
+                self._max_wait_time = max(self._max_wait_time, elapsed)
+
+        try:
+            if entry is not None and not await self._is_usable(entry):
+                await self._close_raw(entry)
+                entry = None
+            if entry is None:
+                entry = await self._connect()
+        except mysql.connector.Error as e:
+            await self._forget_slot()
+            logger.critical("MySQL connection failed: %s", e, exc_info=True)
+            raise DatabaseConnectionError(f"Database connection failed: {e}")
+        except Exception as e:
+            await self._forget_slot()
+            logger.error("Unexpected error while connecting to the database: %s", e, exc_info=True)
+            raise DatabaseConnectionError(f"Unexpected connection error: {e}")
+
+        self._in_use += 1
+        return AsyncPooledConnection(self, entry)
+
+    async def _forget_slot(self) -> None:
+        async with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    async def _release(self, entry: _AsyncPoolEntry, broken: bool = False) -> None:
+        if not broken and not self._closed:
+            try:
+                # Never hand an open transaction to the next borrower.
+                if entry.raw.in_transaction:
+                    await entry.raw.rollback()
+            except Exception:
+                broken = True
+
+        async with self._cond:
+            self._in_use -= 1
+            close = broken or self._closed
+            if close:
+                self._size -= 1
+                if broken:
+                    self._discarded += 1
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+        if close:
+            await self._close_raw(entry)
+
+    async def close_all(self) -> None:
+        """
+        Closes every idle connection and shuts the pool: connections in use are closed when they
+        are returned, and further checkouts raise DatabaseConnectionError.
+        """
+        async with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            await self._close_raw(entry)
+
+    def stats(self) -> dict:
+        """Returns a snapshot of pool usage counters for sizing and monitoring."""
+        return {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "size": self._size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "checkouts": self._checkouts,
+            "waits": self._waits,
+            "wait_time_total_ms": round(self._wait_time * 1000, 3),
+            "wait_time_max_ms": round(self._max_wait_time * 1000, 3),
+            "timeouts": self._timeouts,
+            "created": self._created,
+            "recycled": self._recycled,
+            "discarded": self._discarded,
+        }
+
+
+_async_pool = None
+_async_pool_loop = None
+
+
+def _build_async_pool_from_config() -> AsyncConnectionPool:
+    """Sizes the pool from [mysql_async_pool], falling back to the [mysql_pool] settings."""
+    config = get_config()
+
+    def setting(getter, option, fallback):
+        return getter('mysql_async_pool', option, fallback=getter('mysql_pool', option, fallback=fallback))
+
+    return AsyncConnectionPool(
+        connect_args_from_config(config),
+        min_size=setting(config.getint, 'min_size', 1),
+        max_size=setting(config.getint, 'max_size', 10),
+        timeout=setting(config.getfloat, 'timeout', 5.0),
+        recycle=setting(config.getfloat, 'recycle', 1800),
+        ping_after=setting(config.getfloat, 'ping_after', 30),
+    )
+
+
+def get_async_pool() -> AsyncConnectionPool:
+    """
+    Returns the async connection pool of the running event loop, creating it from config.ini on first use.
+    asyncio connections are tied to the loop that opened them, so a new loop (or a forked worker) gets its own pool.
+    """
+    global _async_pool, _async_pool_loop
+    loop = asyncio.get_running_loop()
+    if _async_pool is None or _async_pool_loop is not loop:
+        _async_pool = _build_async_pool_from_config()
+        _async_pool_loop = loop
+        logger.info("Initialized async MySQL connection pool (min=%s, max=%s).", _async_pool.min_size, _async_pool.max_size)
+    return _async_pool
+
+
+def get_async_pool_stats() -> dict:
+    """Returns usage statistics for the async connection pool of the running event loop."""
+    return get_async_pool().stats()
@@ -0,0 +1,110 @@
+import logging
+import time
+import mysql.connector
+from exception.catalog_exception import DatabaseConnectionError, DataIntegrityError
+from utils.async_db_pool import get_async_pool
+from utils.config import get_config
+from utils.logger import logger
+from utils import metrics
+from utils.query_executor import _BROKEN_CONNECTION_ERRORS, _ROW_ERRORS, _compact
+from utils.slow_query import SlowQueryRecorder, build_slow_query_recorder
+
+
+class AsyncQueryExecutor:
+    """
+    asyncio counterpart of QueryExecutor for the ASGI entry point.
+    Runs single statements over the text protocol on pooled mysql.connector.aio connections;
+    the coroutine is suspended (not a thread blocked) while waiting for a connection or a result.
+    Multi-statement transactions stay on the synchronous executor.
+    """
+
+    def __init__(self, slow_queries: SlowQueryRecorder = None):
+        self.slow_queries = slow_queries
+
+    # --- Public API ---
+    async def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        """Executes a SELECT and returns the first row shaped by row_factory, or None."""
+        rows = await self._execute_query(query, params, mode='fetch', row_factory=row_factory)
+        return rows[0] if rows else None
+
+    async def fetch_all(self, query: str, params: tuple = None, row_factory=dict) -> list:
+        """Executes a SELECT and returns all rows shaped by row_factory."""
+        return await self._execute_query(query, params, mode='fetch', row_factory=row_factory)
+
+    async def fetch_rows(self, query: str, params: tuple = None) -> tuple[tuple, list]:
+        """Executes a SELECT and returns (column names, rows as tuples) without building a dict per row."""
+        return await self._execute_query(query, params, mode='rows')
+
+    async def execute(self, query: str, params: tuple = None) -> int:
+        """Executes an UPDATE/DELETE (or any write) and returns the number of affected rows."""
+        return await self._execute_query(query, params, mode='rowcount')
+
+    async def insert(self, query: str, params: tuple = None) -> int:
+        """
+        Executes an INSERT and returns the generated AUTO_INCREMENT id.
+        Also usable for writes that set LAST_INSERT_ID(expr): the value of expr is returned (0 if no row matched).
+        """
+        return await self._execute_query(query, params, mode='lastrowid')
+
+    # --- Internals ---
+    @staticmethod
+    def _shape_rows(cursor, rows: list, row_factory) -> list:
+        if row_factory is tuple:
+            return [tuple(row) for row in rows]
+        columns = cursor.column_names
+        dict_rows = [dict(zip(columns, row)) for row in rows]
+        if row_factory is dict:
+            return dict_rows
+        return [row_factory(row) for row in dict_rows]
+
+    async def _execute_query(self, query: str, params: tuple, mode: str, row_factory=dict):
+        """
+        Executes a single statement on a pooled connection of the running loop and translates MySQL
+        errors into DataIntegrityError (the row's data was rejected) or DatabaseConnectionError.
+        """
+        with metrics.timed('pool'):
+            conn = await get_async_pool().get_connection()
+
+        broken = False
+        started = time.perf_counter()
+        try:
+            cursor = await conn.cursor()
+            try:
+                await cursor.execute(query, params or ())
+                if mode == 'fetch':
+                    result = self._shape_rows(cursor, await cursor.fetchall(), row_factory)
+                elif mode == 'rows':
+                    result = (tuple(cursor.column_names), [tuple(row) for row in await cursor.fetchall()])
+                elif mode == 'lastrowid':
+                    result = cursor.lastrowid
+                else:
+                    result = cursor.rowcount
+            finally:
+                await cursor.close()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executed async %s: %s | Params: %s | Result: %s", mode, _compact(query), params,
+                             f"{len(result)} rows" if mode == 'fetch' else f"{len(result[1])} rows" if mode == 'rows' else result)
+            return result
+        except mysql.connector.Error as e:
+            logger.critical("MySQL Error: %s | Query: %s | Params: %s", e, _compact(query), params, exc_info=True)
+            broken = isinstance(e, _BROKEN_CONNECTION_ERRORS)
+            if isinstance(e, _ROW_ERRORS):
+                raise DataIntegrityError(f"Database rejected the data: {e}")
+            raise DatabaseConnectionError(f"Database error during operation: {e}")
+        except Exception as e:
+            logger.error("Unexpected error in async _execute_query: %s", e, exc_info=True)
+            raise Exception(f"An unexpected error occurred in service layer: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.record('db', elapsed)
+            if self.slow_queries is not None:
+                # EXPLAIN capture needs a synchronous connection, so async statements are only timed
+                self.slow_queries.observe(query, params, elapsed)
+            if broken:
+                await conn.discard()
+            else:
+                await conn.close()
+
+
+# Process-wide async executor shared by the async services
+async_executor = AsyncQueryExecutor(slow_queries=build_slow_query_recorder(get_config()))
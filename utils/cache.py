@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries also expire after a fixed TTL.
+    Keeps hit/miss/eviction/expiration counters so the size and TTL can be tuned.
+    Read-through callers take generation() before loading a value and pass it to set(), so a value
+    loaded while a delete()/clear() ran (possibly from an older database state) is not stored.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_fills = 0
+        # Bumped by every delete()/clear(); fills started before the bump are dropped
+        self._generation = 0
+
+    def get(self, key, default=None):
+        """Returns the cached value for key, or default if it is missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def generation(self) -> int:
+        """Returns the invalidation generation to pass to set() for a value about to be loaded."""
+        with self._lock:
+            return self._generation
+
+    def set(self, key, value, ttl: float = None, generation: int = None) -> None:
+        """
+        Stores value under key, evicting the least recently used entry when full.
+        With generation (from generation()), the value is dropped if an invalidation happened since.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._stale_fills += 1
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key) -> None:
+        """Removes key from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Removes every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "stale_fills": self._stale_fills,
+            }
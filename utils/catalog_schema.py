@@ -0,0 +1,156 @@
+import re
+from datetime import date
+from dto.catalog import Catalog
+from exception.catalog_exception import ValidationError
+
+# Letters and digits (any script, as str.isalnum), whitespace and basic punctuation;
+# \w also matches '_', which is rejected separately so the pattern stays a single character class
+_TEXT_PATTERN = re.compile(r"[\w\s.,!?'\"-]+")
+# Same inputs strptime('%Y-%m-%d') accepts: the month and day may have one digit
+_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+ALLOWED_STATUSES = ('active', 'inactive')
+
+
+def _text_check(label: str, max_length: int, min_length: int = 1):
+    fullmatch = _TEXT_PATTERN.fullmatch
+
+    def check(value, today):
+        if not isinstance(value, str):
+            return None, f"{label} must be a string."
+        value = value.strip()
+        if not value:
+            return None, f"{label} cannot be empty."
+        if not min_length <= len(value) <= max_length:
+            return None, f"{label} must be between {min_length} and {max_length} characters."
+        if fullmatch(value) is None or '_' in value:
+            return None, (f"{label} contains invalid characters. "
+                          "Only alphanumeric, spaces, and basic punctuation (.,!?'\"-) are allowed.")
+        return value, None
+    return check
+
+
+def _future_date_check(label: str):
+    fullmatch = _DATE_PATTERN.fullmatch
+
+    def check(value, today):
+        if not isinstance(value, str):
+            return None, f"{label} must be a string."
+        try:
+            if len(value) == 10 and value[4] == '-' and value[7] == '-':
+                # Only YYYY-MM-DD has this shape among the forms fromisoformat accepts
+                parsed = date.fromisoformat(value)
+            else:
+                match = fullmatch(value)
+                parsed = date(int(match[1]), int(match[2]), int(match[3])) if match else None
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            return None, f"{label} must be in `YYYY-MM-DD` format."
+        if parsed < today:
+            return None, f"{label} cannot be in the past."
+        # ISO strings order like the dates they hold, so start/end are compared without parsing again
+        return parsed.isoformat(), None
+    return check
+
+
+def _status_check(value, today):
+    if not isinstance(value, str):
+        return None, "Status must be a string."
+    normalized = value.strip().lower()
+    if normalized not in ALLOWED_STATUSES:
+        return None, f"Invalid status: '{value}'. Allowed values are {', '.join(ALLOWED_STATUSES)}."
+    return normalized, None
+
+
+class CatalogSchema:
+    """
+    Compiled validator for catalog payloads (name, description, start_date, end_date, status).
+    Same rules as the field validators in utils/validation.py, but with precompiled regexes, one date
+    parse per field and one date.today() per call, and every failing field is reported instead of
+    only the first. validate_many() checks a whole batch in one call for the bulk and import paths.
+    """
+
+    # payload field -> (catalog column, check); a check returns (cleaned value, None) or (None, message)
+    FIELDS = {
+        'name': ('catalog_name', _text_check("Name", max_length=30)),
+        'description': ('catalog_description', _text_check("Description", max_length=50)),
+        'start_date': ('start_date', _future_date_check("Start Date")),
+        'end_date': ('end_date', _future_date_check("End Date")),
+        'status': ('status', _status_check),
+    }
+
+    def __init__(self):
+        self._checks = [(field, check) for field, (_, check) in self.FIELDS.items()]
+
+    def _check(self, data, fields: list, today: date) -> tuple[dict, list]:
+        """Runs the checks of the given fields; returns (cleaned values by field, errors)."""
+        values = {}
+        errors = []
+        for field, check in fields:
+            value, error = check(data.get(field), today)
+            if error is None:
+                values[field] = value
+            else:
+                errors.append({"field": field, "message": error})
+
+        start_date, end_date = values.get('start_date'), values.get('end_date')
+        if start_date and end_date and start_date > end_date:
+            errors.append({"field": "end_date", "message": "End Date cannot be before Start Date."})
+        return values, errors
+
+    def _check_record(self, data, today: date) -> tuple[Catalog | None, list]:
+        if not isinstance(data, dict):
+            return None, [{"field": None, "message": "Catalog payload must be a JSON object."}]
+        values, errors = self._check(data, self._checks, today)
+        return (None if errors else Catalog(**values)), errors
+
+    @staticmethod
+    def _error(errors: list) -> ValidationError:
+        return ValidationError(' '.join(error['message'] for error in errors), errors=errors)
+
+    def validate(self, data: dict) -> Catalog:
+        """Validates one payload and returns it as a Catalog DTO. Raises ValidationError listing every invalid field."""
+        catalog, errors = self._check_record(data, date.today())
+        if errors:
+            raise self._error(errors)
+        return catalog
+
+    def validate_many(self, items: list) -> tuple[list, list]:
+        """
+        Validates a batch of payloads in one call.
+        Returns (valid, invalid): valid holds (index, Catalog) pairs and invalid holds
+        (index, errors) pairs, each error being {"field": ..., "message": ...}.
+        """
+        today = date.today()
+        check_record = self._check_record
+        valid = []
+        invalid = []
+        for index, item in enumerate(items):
+            catalog, errors = check_record(item, today)
+            if errors:
+                invalid.append((index, errors))
+            else:
+                valid.append((index, catalog))
+        return valid, invalid
+
+    def validate_patch(self, data: dict) -> dict:
+        """
+        Validates a partial payload containing any subset of the catalog fields.
+        Returns the cleaned values keyed by catalog column. Unknown fields and empty payloads are rejected.
+        """
+        if not isinstance(data, dict) or not data:
+            raise ValidationError("Catalog patch must be a non-empty JSON object.")
+
+        unknown = [field for field in data if field not in self.FIELDS]
+        if unknown:
+            raise ValidationError(
+                f"Unknown catalog field(s): {', '.join(unknown)}. Allowed fields are {', '.join(self.FIELDS)}.")
+
+        values, errors = self._check(data, [(field, self.FIELDS[field][1]) for field in data], date.today())
+        if errors:
+            raise self._error(errors)
+        return {self.FIELDS[field][0]: value for field, value in values.items()}
+
+
+# Shared schema instance used by the routes, the bulk endpoints and the import service
+catalog_schema = CatalogSchema()
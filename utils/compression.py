@@ -0,0 +1,113 @@
+import zlib
+from flask import Flask, Response, request
+from werkzeug.http import parse_accept_header
+
+try:
+    # Standard library from Python 3.14; older interpreters offer gzip and deflate only
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+# Content-coding -> factory of an incremental compressor (compress()/flush()) for a zlib level
+CODECS = {
+    'gzip': lambda level: zlib.compressobj(level, zlib.DEFLATED, 31),
+    'deflate': lambda level: zlib.compressobj(level, zlib.DEFLATED, 15),
+}
+if zstd is not None:
+    # zstd has its own level scale; its default (3) beats gzip -6 on both speed and size
+    CODECS['zstd'] = lambda level: zstd.ZstdCompressor()
+
+# Media types worth compressing besides text/*; images, fonts and archives are compressed already
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json', 'application/javascript', 'application/x-ndjson', 'application/xml', 'image/svg+xml',
+})
+
+
+def available_codecs(names) -> tuple:
+    """Returns the given content-codings that this interpreter can produce, in the same order."""
+    return tuple(name for name in names if name in CODECS)
+
+
+def negotiate(accept_encoding: str | None, codecs: tuple) -> str | None:
+    """Returns the first of codecs (in server preference order) that the Accept-Encoding header allows, or None."""
+    if not accept_encoding:
+        return None
+    accepted = parse_accept_header(accept_encoding)
+    for name in codecs:
+        if accepted.quality(name) > 0:
+            return name
+    return None
+
+
+def compress(data: bytes, encoding: str, level: int = 6) -> bytes:
+    """Compresses a whole body with the given content-coding."""
+    compressor = CODECS[encoding](level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(chunks, encoding: str, level: int = 6):
+    """Compresses a stream of byte chunks without buffering the whole body."""
+    compressor = CODECS[encoding](level)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class ResponseCompressor:
+    """
+    after_request hook that compresses text and JSON responses for clients that accept it.
+    Bodies below min_size are sent as is; streamed responses (exports) are compressed chunk by chunk.
+    Responses carrying an ETag are left alone: the ETag names a catalog version for If-Match,
+    and a compressed representation would need a strong validator of its own.
+    """
+
+    def __init__(self, codecs: tuple = ('gzip', 'deflate'), min_size: int = 1024, level: int = 6):
+        self.codecs = available_codecs(codecs)
+        self.min_size = min_size
+        self.level = level
+
+    @staticmethod
+    def _compressible(response: Response) -> bool:
+        mimetype = response.mimetype or ''
+        return mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES
+
+    def __call__(self, response: Response) -> Response:
+        if (request.method == 'HEAD' or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough or 'Content-Encoding' in response.headers
+                or 'ETag' in response.headers or not self._compressible(response)):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate(request.headers.get('Accept-Encoding'), self.codecs)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.iter_encoded(), encoding, self.level)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(compress(data, encoding, self.level))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+def build_compressor(config) -> ResponseCompressor | None:
+    """Creates the compressor described by the [compression] section, or None if it is disabled."""
+    if not config.getboolean('compression', 'enabled', fallback=True):
+        return None
+    codecs = [name.strip() for name in config.get('compression', 'codecs', fallback='gzip, deflate').split(',')]
+    return ResponseCompressor(
+        codecs=tuple(name for name in codecs if name),
+        min_size=config.getint('compression', 'min_size', fallback=1024),
+        level=config.getint('compression', 'level', fallback=6),
+    )
+
+
+def init_app(app: Flask, compressor: ResponseCompressor) -> None:
+    """Registers the compressor as an after_request hook."""
+    app.after_request(compressor)
@@ -0,0 +1,26 @@
+import logging
+import os
+from configparser import ConfigParser
+from functools import lru_cache
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config', 'config.ini')
+# Used when config.ini has no [jwt] secret_key; set a real secret in production
+DEFAULT_JWT_SECRET_KEY = 'super_secret_jwt_key_change_this'
+
+# utils.logger reads its settings from here, so use the named logger directly to avoid a circular import
+logger = logging.getLogger("catalog_manager")
+
+@lru_cache(maxsize=1)
+def get_config() -> ConfigParser:
+    """
+    Reads and parses config/config.ini once per process and returns the parsed ConfigParser.
+    Raises FileNotFoundError if the configuration file is missing.
+    """
+    if not os.path.exists(CONFIG_PATH):
+        logger.critical("Configuration file not found: %s", CONFIG_PATH)
+        raise FileNotFoundError(f"Configuration file not found at: {CONFIG_PATH}")
+
+    config = ConfigParser()
+    config.read(CONFIG_PATH)
+    return config
@@ -0,0 +1,305 @@
+import os
+import threading
+import time
+from collections import deque
+import mysql.connector
+from exception.catalog_exception import DatabaseConnectionError
+from utils.config import get_config
+from utils.logger import logger
+
+
+class _PoolEntry:
+    """Book-keeping for one physical MySQL connection owned by the pool."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class PooledConnection:
+    """
+    Thin proxy around a pooled MySQL connection.
+    Behaves like the underlying connection, except that close() hands it back to the pool.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', entry: _PoolEntry):
+        self._pool = pool
+        self._entry = entry
+
+    @property
+    def entry(self) -> _PoolEntry:
+        if self._entry is None:
+            raise DatabaseConnectionError("Connection has already been returned to the pool.")
+        return self._entry
+
+    def __getattr__(self, name):
+        return getattr(self.entry.raw, name)
+
+    def close(self) -> None:
+        """Returns the connection to the pool. Calling close() twice is a no-op."""
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool._release(entry)
+
+    def discard(self) -> None:
+        """Closes the physical connection instead of returning it, e.g. after a broken socket."""
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool._release(entry, broken=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe, bounded pool of MySQL connections.
+    Holds at most max_size connections; prefill() opens min_size of them up front, and connections
+    discarded or recycled later are replaced on demand. Idle connections are validated on checkout,
+    recycled by age, and a checkout times out when the pool is exhausted.
+    """
+
+    def __init__(self, connect_args: dict, min_size: int = 1, max_size: int = 10, timeout: float = 5.0,
+                 recycle: float = 1800, ping_after: float = 30):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self.connect_args = connect_args
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+
+        self._idle = deque()
+        self._size = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._discarded = 0
+
+    def _connect(self) -> _PoolEntry:
+        raw = mysql.connector.connect(**self.connect_args)
+        with self._cond:
+            self._created += 1
+        logger.info("Opened new pooled connection to the MySQL database.")
+        return _PoolEntry(raw)
+
+    def _close_raw(self, entry: _PoolEntry) -> None:
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+
+    def prefill(self) -> None:
+        """Opens connections until the pool holds at least min_size of them."""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                entry = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    def _is_usable(self, entry: _PoolEntry) -> bool:
+        now = time.monotonic()
+        if self.recycle and now - entry.created_at > self.recycle:
+            with self._cond:
+                self._recycled += 1
+            return False
+        if self.ping_after is not None and now - entry.last_used > self.ping_after:
+            try:
+                entry.raw.ping(reconnect=False)
+            except Exception:
+                logger.warning("Discarding stale pooled connection that failed validation.")
+                with self._cond:
+                    self._discarded += 1
+                return False
+        return True
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Checks a connection out of the pool, opening a new one if below max_size.
+        Raises DatabaseConnectionError if none becomes available within the timeout.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        entry = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseConnectionError("Connection pool is closed.")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    logger.error("Connection pool exhausted: no connection available within %ss.", self.timeout)
+                    raise DatabaseConnectionError(
+                        f"Connection pool exhausted: no connection available within {self.timeout} seconds."
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            self._checkouts += 1
+            if waited:
+                elapsed = time.monotonic() - start
+                self._waits += 1
+                self._wait_time += elapsed
+                self._max_wait_time = max(self._max_wait_time, elapsed)
+
+        try:
+            if entry is not None and not self._is_usable(entry):
+                self._close_raw(entry)
+                entry = None
+            if entry is None:
+                entry = self._connect()
+        except mysql.connector.Error as e:
+            self._forget_slot()
+            logger.critical("MySQL connection failed: %s", e, exc_info=True)
+            raise DatabaseConnectionError(f"Database connection failed: {e}")
+        except Exception as e:
+            self._forget_slot()
+            logger.error("Unexpected error while connecting to the database: %s", e, exc_info=True)
+            raise DatabaseConnectionError(f"Unexpected connection error: {e}")
+
+        with self._cond:
+            self._in_use += 1
+        return PooledConnection(self, entry)
+
+    def _forget_slot(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _release(self, entry: _PoolEntry, broken: bool = False) -> None:
+        if not broken and not self._closed:
+            try:
+                # Never hand an open transaction to the next borrower.
+                if entry.raw.in_transaction:
+                    entry.raw.rollback()
+            except Exception:
+                broken = True
+
+        with self._cond:
+            self._in_use -= 1
+            close = broken or self._closed
+            if close:
+                self._size -= 1
+                if broken:
+                    self._discarded += 1
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+        if close:
+            self._close_raw(entry)
+
+    def close_all(self) -> None:
+        """
+        Closes every idle connection and shuts the pool: connections in use are closed when they
+        are returned, and further checkouts raise DatabaseConnectionError.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_raw(entry)
+
+    def stats(self) -> dict:
+        """Returns a snapshot of pool usage counters for sizing and monitoring."""
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_time_total_ms": round(self._wait_time * 1000, 3),
+                "wait_time_max_ms": round(self._max_wait_time * 1000, 3),
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "recycled": self._recycled,
+                "discarded": self._discarded,
+            }
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def connect_args_from_config(config) -> dict:
+    """Returns the MySQL connection arguments from the [mysql] section, shared by the sync and async pools."""
+    return {
+        'host': config.get('mysql', 'host'),
+        'user': config.get('mysql', 'user'),
+        'password': config.get('mysql', 'password'),
+        'database': config.get('mysql', 'database'),
+        # Single statements commit on their own; multi-statement work uses explicit transactions
+        'autocommit': True,
+    }
+
+
+def _build_pool_from_config() -> ConnectionPool:
+    config = get_config()
+    return ConnectionPool(
+        connect_args_from_config(config),
+        min_size=config.getint('mysql_pool', 'min_size', fallback=1),
+        max_size=config.getint('mysql_pool', 'max_size', fallback=10),
+        timeout=config.getfloat('mysql_pool', 'timeout', fallback=5.0),
+        recycle=config.getfloat('mysql_pool', 'recycle', fallback=1800),
+        ping_after=config.getfloat('mysql_pool', 'ping_after', fallback=30),
+    )
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Returns the process-wide connection pool, creating it from config.ini on first use.
+    A forked child process gets its own pool instead of sharing the parent's sockets.
+    """
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is not None and _pool_pid == pid:
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            _pool = _build_pool_from_config()
+            _pool_pid = pid
+            logger.info("Initialized MySQL connection pool (min=%s, max=%s).", _pool.min_size, _pool.max_size)
+        return _pool
+
+
+def get_pool_stats() -> dict:
+    """Returns usage statistics for the process-wide connection pool."""
+    return get_pool().stats()
@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+
+
+def _format_value(value):
+    """Formats a database value for export; dates become YYYY-MM-DD."""
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def csv_chunks(columns: tuple, batches):
+    """Encodes batches of row tuples as CSV text, yielding one string per batch after a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_format_value(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+
+
+def ndjson_chunks(columns: tuple, batches):
+    """Encodes batches of row tuples as newline-delimited JSON objects, yielding one string per batch."""
+    for rows in batches:
+        yield ''.join(
+            json.dumps(dict(zip(columns, (_format_value(value) for value in row))), separators=(',', ':')) + '\n'
+            for row in rows
+        )
+
+
+def gzip_chunks(chunks, level: int = 6):
+    """Compresses a stream of text chunks into a gzip byte stream without buffering the whole body."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode('utf-8'))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from exception.catalog_exception import ServiceUnavailableError
+from utils.logger import logger
+
+
+class HashWorkerPool:
+    """
+    Bounded pool of threads for CPU-heavy password hashing (bcrypt releases the GIL while hashing).
+    At most max_workers hashes run at once and at most max_queue more wait; further submissions are
+    rejected immediately, and callers stop waiting after timeout seconds. Either case raises
+    ServiceUnavailableError, so a burst of logins cannot tie up the request threads serving the rest of the API.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 1, timeout: float = 5.0):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hash-worker')
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._queue_wait_total = 0.0
+        self._run_time_total = 0.0
+
+    def _run(self, submitted_at: float, func, args):
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self._queue_wait_total += started - submitted_at
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self._completed += 1
+                self._run_time_total += time.perf_counter() - started
+
+    def run(self, func, *args):
+        """Runs func(*args) on a worker thread and returns its result, waiting at most timeout seconds."""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                logger.warning("Hash worker pool saturated (%s pending); rejecting request.", self._pending)
+                raise ServiceUnavailableError("Too many concurrent logins. Please retry shortly.")
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(self._run, time.perf_counter(), func, args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # A queued task is dropped; one already running finishes in the background
+            if future.cancel():
+                with self._lock:
+                    self._pending -= 1
+            with self._lock:
+                self._timeouts += 1
+            logger.warning("Password hash check did not finish within %ss.", self.timeout)
+            raise ServiceUnavailableError("Login is temporarily overloaded. Please retry shortly.")
+
+    def stats(self) -> dict:
+        """Returns queue depth and throughput counters for monitoring."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "avg_queue_wait_ms": round(self._queue_wait_total / self._completed * 1000, 3) if self._completed else 0.0,
+                "avg_run_time_ms": round(self._run_time_total / self._completed * 1000, 3) if self._completed else 0.0,
+            }
+
+
+def build_hash_pool(config) -> HashWorkerPool:
+    """
+    Creates the pool configured in the [auth] section of config.ini. Every admitted login holds its
+    request thread until its hash is checked, so hash_workers + hash_queue_size is capped below
+    [server] threads: at least one request thread per worker process stays free for the rest of the API.
+    """
+    max_workers = config.getint('auth', 'hash_workers', fallback=2)
+    max_queue = config.getint('auth', 'hash_queue_size', fallback=1)
+    request_threads = config.getint('server', 'threads', fallback=4)
+    admitted = max(request_threads - 1, 1)
+    if max_workers + max_queue > admitted:
+        logger.warning("[auth] hash_workers (%s) + hash_queue_size (%s) must stay below [server] threads (%s); "
+                       "admitting at most %s concurrent logins.", max_workers, max_queue, request_threads, admitted)
+        max_workers = min(max_workers, admitted)
+        max_queue = admitted - max_workers
+    return HashWorkerPool(
+        max_workers=max_workers,
+        max_queue=max_queue,
+        timeout=config.getfloat('auth', 'hash_timeout', fallback=5.0),
+    )
@@ -1,21 +1,163 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+from configparser import ConfigParser
+from utils.config import CONFIG_PATH, PROJECT_ROOT, get_config
 
-# Create logs folder if it doesn't exist
-if not os.path.exists("logs"):
-    os.makedirs("logs")
 
-# Create logger
-logger = logging.getLogger("catalog_manager")
-logger.setLevel(logging.DEBUG)  # Log everything
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line, for log shippers that parse structured logs."""
 
-# Prevent adding duplicate handlers
-if not logger.handlers:
-    # File handler only (no console)
-    file_handler = logging.FileHandler("logs/catalog_manager.log")
-    file_handler.setLevel(logging.DEBUG)
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def resolve_log_path(config: ConfigParser):
+    """Returns the absolute path of the configured log file, or None when logging to stderr."""
+    path = config.get('logging', 'file', fallback='logs/catalog_manager.log').strip()
+    if not path:
+        return None
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def _build_destination_handler(config: ConfigParser, rotation: str = None) -> logging.Handler:
+    """
+    Creates the handler that actually writes records, as configured in the [logging] section:
+    a file rotated by size or time, or reopened after an external tool (logrotate) moved it
+    (relative paths are resolved against the project root), or stderr when no file is set.
+    rotation overrides [logging] rotation.
+    """
+    path = resolve_log_path(config)
+    if not path:
+        handler = logging.StreamHandler(sys.stderr)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        rotation = rotation or config.get('logging', 'rotation', fallback='size').strip().lower()
+        backup_count = config.getint('logging', 'backup_count', fallback=5)
+        if rotation == 'external':
+            handler = logging.handlers.WatchedFileHandler(path, encoding='utf-8', delay=True)
+        elif rotation == 'size':
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=config.getint('logging', 'max_bytes', fallback=10 * 1024 * 1024),
+                backupCount=backup_count, encoding='utf-8', delay=True)
+        elif rotation == 'time':
+            handler = logging.handlers.TimedRotatingFileHandler(
+                path, when=config.get('logging', 'when', fallback='midnight'),
+                backupCount=backup_count, encoding='utf-8', delay=True)
+        else:
+            handler = logging.FileHandler(path, encoding='utf-8', delay=True)
+
+    if config.get('logging', 'format', fallback='text').strip().lower() == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    return handler
+
+
+# Argument types that cannot change between enqueueing a record and formatting it
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None), bytes)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+    The stock handler fully formats (and copies) every record on the calling thread; here the
+    record is enqueued as is, and only records with mutable arguments are rendered up front.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args.values() if isinstance(record.args, dict) else record.args
+        if args and not all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args):
+            record.msg, record.args = record.getMessage(), None
+        return record
 
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+class _AsyncLogging:
+    """
+    Owns the QueueHandler/QueueListener pair used in async mode.
+    Request threads only put records on an in-memory queue; a single background thread
+    formats them and performs the disk I/O.
+    """
+
+    def __init__(self, handler: logging.Handler):
+        self.queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+        self.listener = logging.handlers.QueueListener(self.queue_handler.queue, handler, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.stop)
+        # The listener thread does not survive fork(); give each child process its own queue and thread
+        os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def _restart_in_child(self) -> None:
+        self.queue_handler.queue = self.listener.queue = queue.SimpleQueue()
+        self.listener._thread = None
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Flushes queued records and stops the listener thread."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+def _configure_logger(config: ConfigParser) -> logging.Logger:
+    configured = logging.getLogger("catalog_manager")
+    configured.setLevel(config.get('logging', 'level', fallback='INFO').strip().upper())
+    configured.propagate = False
+
+    global _destination_handler
+    handler = _destination_handler = _build_destination_handler(config)
+    if config.getboolean('logging', 'async', fallback=True):
+        global async_logging
+        async_logging = _AsyncLogging(handler)
+        configured.addHandler(async_logging.queue_handler)
+    else:
+        configured.addHandler(handler)
+    return configured
+
+
+def use_external_rotation(config: ConfigParser) -> bool:
+    """
+    Switches a size- or time-rotated log file to rotation = external. Several processes cannot
+    rotate one file safely (each would rename it under the others), so gunicorn's master calls this
+    before forking more than one worker: every worker then appends to the same file, and reopens it
+    once logrotate has moved it. Returns True when the handler was replaced.
+    """
+    global _destination_handler
+    rotation = config.get('logging', 'rotation', fallback='size').strip().lower()
+    if not resolve_log_path(config) or rotation not in ('size', 'time'):
+        return False
+    previous, handler = _destination_handler, _build_destination_handler(config, rotation='external')
+    if async_logging is not None:
+        async_logging.listener.handlers = (handler,)
+    else:
+        logger.removeHandler(previous)
+        logger.addHandler(handler)
+    _destination_handler = handler
+    previous.close()
+    return True
+
+
+# Set when async mode is active, so callers (tests, shutdown hooks) can flush with async_logging.stop()
+async_logging = None
+# The handler writing records, behind the queue in async mode
+_destination_handler = None
+
+# Create logger (configured once per process from the [logging] section of config.ini)
+logger = logging.getLogger("catalog_manager")
+if not logger.handlers:
+    logger = _configure_logger(get_config() if os.path.exists(CONFIG_PATH) else ConfigParser())
@@ -0,0 +1,192 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Server-Timing metric names and descriptions, in header order
+PHASES = (
+    ('pool', 'connection wait'),
+    ('db', 'query execution'),
+    ('validate', 'payload validation'),
+    ('json', 'JSON serialization'),
+)
+
+# Timings of the request being handled in this thread/context, if any
+_request_timings: ContextVar = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Accumulates the time spent per phase (and the number of DB queries) for one request."""
+
+    __slots__ = ('started', 'durations', 'queries')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations = dict.fromkeys((name for name, _ in PHASES), 0.0)
+        self.queries = 0
+
+
+def record(phase: str, seconds: float) -> None:
+    """Adds seconds to a phase of the current request; a no-op outside of a request."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.durations[phase] += seconds
+        if phase == 'db':
+            timings.queries += 1
+
+
+@contextmanager
+def timed(phase: str):
+    """Times the enclosed block as part of the given phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+class _Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Per-process request metrics rendered in the Prometheus text exposition format.
+    Each worker process keeps its own registry, so scrape every process (or aggregate by instance).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._latency = {}
+        self._db_time = {}
+        self._db_queries = {}
+
+    def observe_request(self, endpoint: str, method: str, status: int, timings: RequestTimings, elapsed: float) -> None:
+        with self._lock:
+            key = (endpoint, method, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._latency.setdefault(endpoint, _Histogram()).observe(elapsed)
+            self._db_time.setdefault(endpoint, _Histogram()).observe(timings.durations['db'])
+            self._db_queries[endpoint] = self._db_queries.get(endpoint, 0) + timings.queries
+
+    @staticmethod
+    def _histogram_lines(name: str, histograms: dict) -> list:
+        lines = []
+        for endpoint, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram.total:.6f}')
+            lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram.count}')
+        return lines
+
+    def render(self, extra_metrics: dict = None) -> str:
+        """
+        Returns every metric in Prometheus text format.
+        extra_metrics adds process-level values: metric name -> (type, help text, value).
+        """
+        with self._lock:
+            lines = [
+                '# HELP catalog_http_requests_total HTTP requests handled, by endpoint, method and status.',
+                '# TYPE catalog_http_requests_total counter',
+            ]
+            lines += [f'catalog_http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}'
+                      for (endpoint, method, status), count in sorted(self._requests.items())]
+            lines += [
+                '# HELP catalog_http_request_duration_seconds Time to produce the response, by endpoint.',
+                '# TYPE catalog_http_request_duration_seconds histogram',
+            ]
+            lines += self._histogram_lines('catalog_http_request_duration_seconds', self._latency)
+            lines += [
+                '# HELP catalog_db_query_duration_seconds Total query execution time per request, by endpoint.',
+                '# TYPE catalog_db_query_duration_seconds histogram',
+            ]
+            lines += self._histogram_lines('catalog_db_query_duration_seconds', self._db_time)
+            lines += [
+                '# HELP catalog_db_queries_total Database queries executed, by endpoint.',
+                '# TYPE catalog_db_queries_total counter',
+            ]
+            lines += [f'catalog_db_queries_total{{endpoint="{endpoint}"}} {count}'
+                      for endpoint, count in sorted(self._db_queries.items())]
+
+        for name, (metric_type, help_text, value) in (extra_metrics or {}).items():
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}', f'{name} {value}']
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that attributes serialization time to the 'json' phase."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        with timed('json'):
+            return super().dumps(obj, **kwargs)
+
+
+def server_timing(timings: RequestTimings, elapsed: float) -> str:
+    """Renders the Server-Timing header value for a finished request."""
+    parts = [f'{name};dur={timings.durations[name] * 1000:.2f};desc="{description}"'
+             for name, description in PHASES if timings.durations[name]]
+    parts.append(f'app;dur={elapsed * 1000:.2f};desc="total, {timings.queries} queries"')
+    return ', '.join(parts)
+
+
+def begin_request() -> RequestTimings:
+    """Starts timing a request in the current context (for entry points other than the Flask app)."""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def end_request(timings: RequestTimings, endpoint: str, method: str, status: int) -> str:
+    """Records a request started with begin_request and returns its Server-Timing header value."""
+    elapsed = time.perf_counter() - timings.started
+    registry.observe_request(endpoint, method, status, timings, elapsed)
+    _request_timings.set(None)
+    return server_timing(timings, elapsed)
+
+
+def _start_request() -> None:
+    _request_timings.set(RequestTimings())
+
+
+def _finish_request(response: Response) -> Response:
+    timings = _request_timings.get()
+    if timings is None:
+        return response
+    elapsed = time.perf_counter() - timings.started
+    registry.observe_request(request.endpoint or 'unmatched', request.method, response.status_code, timings, elapsed)
+    response.headers['Server-Timing'] = server_timing(timings, elapsed)
+    return response
+
+
+def _reset_request(exc) -> None:
+    _request_timings.set(None)
+
+
+def init_app(app: Flask) -> None:
+    """Registers the request hooks that time every request and emit the Server-Timing header."""
+    app.json = TimedJSONProvider(app)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_reset_request)
@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+from exception.catalog_exception import ValidationError
+
+CURSOR_NEXT = 'next'
+CURSOR_PREV = 'prev'
+
+
+def encode_cursor(last_id: int, direction: str, search_term: str = '', status_filter: str = None) -> str:
+    """
+    Encodes a keyset pagination position into an opaque, URL-safe cursor string.
+    The cursor carries the boundary catalog_id, the paging direction and the filters it was issued for.
+    """
+    payload = {"id": last_id, "d": direction, "q": search_term or '', "s": status_filter or ''}
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decodes a cursor produced by encode_cursor.
+    Returns a dict with 'last_id', 'direction', 'search_term' and 'status_filter'.
+    Raises ValidationError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        last_id = int(payload['id'])
+        direction = payload['d']
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError(direction)
+        return {
+            "last_id": last_id,
+            "direction": direction,
+            "search_term": str(payload.get('q', '')),
+            "status_filter": payload.get('s') or None,
+        }
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+        raise ValidationError("Invalid pagination cursor.")
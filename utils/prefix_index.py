@@ -0,0 +1,143 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def normalize(name: str) -> str:
+    """Search key of a name: case-folded, surrounding whitespace removed."""
+    return name.strip().casefold()
+
+
+class PrefixIndex:
+    """
+    In-memory prefix index over catalog names, for typeahead suggestions without database queries.
+    Kept current by add()/remove(); writes made while a build reads the table are replayed onto the result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Parallel sequences sorted by search key: a prefix lookup is two bisections plus a slice.
+        # IDs sit in a typed array (8 bytes each) instead of a list of int objects
+        self._keys = []
+        self._ids = array('q')
+        # Display name by ID; shares the key's str object when the name is already lower case
+        self._names = {}
+        # Writes made since begin_build(), replayed by load() so a build cannot lose them
+        self._journal = None
+        self.built_at = None
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def begin_build(self) -> None:
+        """Starts journaling writes; call it before reading the rows that are then passed to load()."""
+        with self._lock:
+            self._journal = []
+
+    def cancel_build(self) -> None:
+        """Stops journaling after a build whose rows could not be read; the current entries stay."""
+        with self._lock:
+            self._journal = None
+
+    def load(self, batches) -> int:
+        """
+        Replaces the index contents with the (catalog_id, catalog_name) rows of batches, an iterable
+        of row lists, then replays the writes journaled since begin_build(). Returns the number of entries.
+        """
+        try:
+            entries = []
+            for rows in batches:
+                entries.extend((normalize(row[1]), row[0], row[1]) for row in rows if row[1])
+            entries.sort()
+            keys = [key for key, _, _ in entries]
+            ids = array('q', [catalog_id for _, catalog_id, _ in entries])
+            names = {catalog_id: key if key == name else name for key, catalog_id, name in entries}
+            del entries
+        except BaseException:
+            self.cancel_build()
+            raise
+
+        with self._lock:
+            journal, self._journal = self._journal or [], None
+            self._keys, self._ids, self._names = keys, ids, names
+            for operation, catalog_id, name in journal:
+                self._remove(catalog_id)
+                if operation == 'add':
+                    self._add(catalog_id, name)
+            self.built_at = time.time()
+            return len(self._ids)
+
+    def build(self, batches) -> int:
+        """Rebuilds the index from a lazy iterable of row batches read in one streaming pass."""
+        self.begin_build()
+        return self.load(batches)
+
+    def _add(self, catalog_id: int, name: str) -> None:
+        # One bisection, then one memmove per sequence
+        key = normalize(name)
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ids.insert(position, catalog_id)
+        self._names[catalog_id] = key if key == name else name
+
+    def _remove(self, catalog_id: int) -> None:
+        name = self._names.pop(catalog_id, None)
+        if name is None:
+            return
+        key = normalize(name)
+        position = bisect_left(self._keys, key)
+        # Catalogs sharing a name sit next to each other; find this one among them
+        while position < len(self._ids) and self._ids[position] != catalog_id:
+            position += 1
+        if position < len(self._ids):
+            del self._keys[position]
+            del self._ids[position]
+
+    def add(self, catalog_id: int, name: str) -> None:
+        """Adds a catalog, or renames it if it is indexed already."""
+        if not name:
+            return
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(('add', catalog_id, name))
+            self._remove(catalog_id)
+            self._add(catalog_id, name)
+
+    def remove(self, catalog_id: int) -> None:
+        """Drops a catalog from the index; unknown IDs are ignored."""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append(('remove', catalog_id, None))
+            self._remove(catalog_id)
+
+    def search(self, prefix: str, limit: int = 10) -> list:
+        """Returns up to limit (catalog_id, catalog_name) pairs whose name starts with prefix, in name order."""
+        key = normalize(prefix)
+        if not key or limit <= 0:
+            return []
+        with self._lock:
+            start = bisect_left(self._keys, key)
+            # Every key starting with the prefix sorts below prefix + the highest code point
+            end = min(bisect_left(self._keys, key + '\U0010ffff', start), start + limit)
+            names = self._names
+            return [(catalog_id, names[catalog_id]) for catalog_id in self._ids[start:end]]
+
+    def stats(self) -> dict:
+        """Returns the entry count, an estimate of the memory held and when the index was built."""
+        with self._lock:
+            strings = {id(value): value for value in self._keys}
+            strings.update((id(value), value) for value in self._names.values())
+            string_bytes = sum(value.__sizeof__() for value in strings.values())
+            # Every catalog ID but the smallest ones is an int object of its own as a dict key
+            id_bytes = sum(catalog_id.__sizeof__() for catalog_id in self._names)
+            return {
+                "entries": len(self._ids),
+                "memory_bytes": (self._keys.__sizeof__() + self._names.__sizeof__() + id_bytes
+                                 + self._ids.buffer_info()[1] * self._ids.itemsize + string_bytes),
+                "built_at": self.built_at,
+            }
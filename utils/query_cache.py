@@ -0,0 +1,259 @@
+import hashlib
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from utils.cache import LRUCache
+from utils.logger import logger
+
+
+class CacheBackend(ABC):
+    """
+    Minimal key-value interface the query cache needs.
+    Implementations must make incr() atomic, since it is how writers invalidate readers.
+    """
+
+    @abstractmethod
+    def get(self, key: str):
+        """Returns the value stored under key, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value, ttl: float) -> None:
+        """Stores value under key for ttl seconds."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increments the counter under key (missing counts as 0) and returns the new value."""
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """Returns the counter under key, 0 if it was never incremented."""
+
+    def stats(self) -> dict:
+        return {}
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Backend for single-node use: values live in a bounded LRU+TTL cache inside this process."""
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 30):
+        self._values = LRUCache(max_entries=max_entries, ttl=ttl)
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        return self._values.get(key)
+
+    def set(self, key: str, value, ttl: float) -> None:
+        self._values.set(key, value, ttl=ttl)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def stats(self) -> dict:
+        return self._values.stats()
+
+
+class SharedStoreCacheBackend(CacheBackend):
+    """
+    Backend for multi-process/multi-node use on top of a shared store client.
+    The client needs get(key) -> bytes | None, set(key, value, ex=seconds) and an atomic incr(key) -> int,
+    which redis.Redis provides; LocalSharedStore implements the same three methods for tests.
+    """
+
+    def __init__(self, client, prefix: str = 'catalog_manager:'):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str):
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value, ttl: float) -> None:
+        self.client.set(self.prefix + key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=max(int(ttl), 1))
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def get_counter(self, key: str) -> int:
+        raw = self.client.get(self.prefix + key)
+        return int(raw) if raw is not None else 0
+
+
+class LocalSharedStore:
+    """
+    In-process stand-in for the redis.Redis client used by SharedStoreCacheBackend (get, set with ex=, incr),
+    storing bytes like Redis does. Several backends built on one instance behave like worker processes
+    sharing one Redis server, which is how tests exercise cross-process invalidation without a server.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value, ex: int = None) -> bool:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value, expires_at = self._data.get(key, (b'0', None))
+            value = int(value) + 1
+            self._data[key] = (str(value).encode('ascii'), expires_at)
+            return value
+
+
+class GenerationalQueryCache:
+    """
+    Caches query results under keys that embed a generation number.
+    Invalidation bumps the generation once, which orphans every older entry at the same time;
+    orphans are never read again and age out through the backend's TTL/LRU.
+    A disabled cache calls the loader every time and stores nothing.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, ttl: float = 30):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.enabled = True
+        self._generation_key = f"{namespace}:generation"
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def disable(self) -> None:
+        """Turns the cache off for this process, e.g. when other processes could not invalidate it."""
+        self.enabled = False
+
+    def _key(self, generation: int, key_parts: tuple) -> str:
+        digest = hashlib.sha1(repr(key_parts).encode('utf-8')).hexdigest()
+        return f"{self.namespace}:{generation}:{digest}"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _lookup(self, key_parts: tuple):
+        """Returns (storage key, cached value or None); the key is None when the backend is unavailable."""
+        try:
+            generation = self.backend.get_counter(self._generation_key)
+            key = self._key(generation, key_parts)
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.error("Query cache lookup failed: %s", e, exc_info=True)
+            key, value = None, None
+        self._count(value is not None)
+        return key, value
+
+    def _store(self, key: str, value) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            logger.error("Query cache store failed: %s", e, exc_info=True)
+
+    def get_or_load(self, key_parts: tuple, loader):
+        """
+        Returns the cached result for key_parts in the current generation, calling loader() on a miss.
+        The generation is read once up front, so a result loaded while a write bumps the generation
+        is stored under the old generation and never served as current.
+        """
+        if not self.enabled:
+            return loader()
+        key, value = self._lookup(key_parts)
+        if value is not None:
+            return value
+        value = loader()
+        self._store(key, value)
+        return value
+
+    async def get_or_load_async(self, key_parts: tuple, loader):
+        """Same as get_or_load for coroutine loaders: awaits loader() on a miss."""
+        if not self.enabled:
+            return await loader()
+        key, value = self._lookup(key_parts)
+        if value is not None:
+            return value
+        value = await loader()
+        self._store(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Invalidates every cached result at once by moving to a new generation."""
+        if not self.enabled:
+            return
+        try:
+            self.backend.incr(self._generation_key)
+        except Exception as e:
+            logger.error("Query cache invalidation failed: %s", e, exc_info=True)
+        with self._lock:
+            self._invalidations += 1
+
+    def stats(self) -> dict:
+        """Returns hit/miss/invalidation counters plus backend statistics."""
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            stats = {"enabled": True, "hits": self._hits, "misses": self._misses, "invalidations": self._invalidations}
+        try:
+            stats["generation"] = self.backend.get_counter(self._generation_key)
+        except Exception:
+            stats["generation"] = None
+        stats["backend"] = self.backend.stats()
+        return stats
+
+
+def build_query_cache_backend(config) -> CacheBackend:
+    """
+    Creates the backend named by [query_cache] backend in config.ini: 'memory' (default) or 'redis'.
+    The redis backend needs the optional redis package. 'memory' is per process: with several worker
+    processes, a write only invalidates the process that made it (see check_query_cache_backend).
+    """
+    backend = config.get('query_cache', 'backend', fallback='memory')
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            logger.critical("query_cache backend 'redis' requires the redis package (pip install redis).")
+            raise
+        client = redis.Redis.from_url(config.get('query_cache', 'redis_url', fallback='redis://localhost:6379/0'))
+        return SharedStoreCacheBackend(client)
+    return InProcessCacheBackend(
+        max_entries=config.getint('query_cache', 'max_entries', fallback=4096),
+        ttl=config.getfloat('query_cache', 'ttl', fallback=30)
+    )
+
+
+def check_query_cache_backend(config, workers: int) -> str | None:
+    """
+    Returns a warning when the [query_cache] backend cannot keep workers worker processes consistent:
+    with 'memory', other workers would keep serving list/search results cached before a write for up to
+    ttl seconds, so gunicorn.conf.py turns the query cache off in its workers whenever this returns a warning.
+    """
+    if workers > 1 and config.get('query_cache', 'backend', fallback='memory') == 'memory':
+        return (f"[query_cache] backend = memory is per process and cannot be invalidated across {workers} workers; "
+                "the query cache is turned off. Set backend = redis to cache list and search results.")
+    return None
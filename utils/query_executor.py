@@ -0,0 +1,184 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import time
+import mysql.connector
+from exception.catalog_exception import DatabaseConnectionError, DataIntegrityError
+from utils.config import get_config
+from utils.db_get_connection import get_connection
+from utils.logger import logger
+from utils import metrics
+from utils.slow_query import SlowQueryRecorder, build_slow_query_recorder
+
+# Connection bound to the transaction currently open in this thread/context, if any
+_transaction_connection: ContextVar = ContextVar('transaction_connection', default=None)
+
+# Errors after which the connection itself can no longer be trusted
+_BROKEN_CONNECTION_ERRORS = (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError)
+# Errors caused by the statement's data; retrying the same row cannot succeed, but other rows can
+_ROW_ERRORS = (mysql.connector.errors.IntegrityError, mysql.connector.errors.DataError)
+
+
+def _compact(query: str) -> str:
+    """Collapses the whitespace of a multi-line SQL string for single-line log records."""
+    return ' '.join(query.split())
+
+
+class QueryExecutor:
+    """
+    Shared data-access layer used by every service.
+    Runs statements on pooled connections over the text protocol (one round trip each; the connector
+    escapes parameters client-side), shapes result rows (dict, tuple or DTO) and supports transactions
+    spanning several statements.
+    Execution times are fed to the optional slow-query recorder.
+    """
+
+    def __init__(self, slow_queries: SlowQueryRecorder = None):
+        self.slow_queries = slow_queries
+
+    # --- Public API ---
+    def fetch_one(self, query: str, params: tuple = None, row_factory=dict):
+        """
+        Executes a SELECT and returns the first row shaped by row_factory, or None.
+        row_factory is dict (default), tuple, or any callable that accepts a row dict (e.g. a DTO factory).
+        """
+        rows = self._execute_query(query, params, mode='fetch', row_factory=row_factory)
+        return rows[0] if rows else None
+
+    def fetch_all(self, query: str, params: tuple = None, row_factory=dict) -> list:
+        """Executes a SELECT and returns all rows shaped by row_factory."""
+        return self._execute_query(query, params, mode='fetch', row_factory=row_factory)
+
+    def fetch_rows(self, query: str, params: tuple = None) -> tuple[tuple, list]:
+        """Executes a SELECT and returns (column names, rows as tuples) without building a dict per row."""
+        return self._execute_query(query, params, mode='rows')
+
+    def execute(self, query: str, params: tuple = None) -> int:
+        """Executes an UPDATE/DELETE (or any write) and returns the number of affected rows."""
+        return self._execute_query(query, params, mode='rowcount')
+
+    def insert(self, query: str, params: tuple = None) -> int:
+        """
+        Executes an INSERT and returns the generated AUTO_INCREMENT id.
+        Also usable for writes that set LAST_INSERT_ID(expr): the value of expr is returned (0 if no row matched).
+        """
+        return self._execute_query(query, params, mode='lastrowid')
+
+    def insert_many(self, query: str, rows: list) -> int:
+        """
+        Inserts many rows with a single multi-row INSERT and returns the first generated id.
+        query is the single-row form ("INSERT ... VALUES (%s, ...)"); the connector batches rows into one statement.
+        InnoDB assigns a multi-row INSERT consecutive ids, so row i received first_id + i.
+        """
+        return self._execute_query(query, rows, mode='many')
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager that runs every executor call inside it on one connection and one transaction.
+        Commits on normal exit and rolls back if an exception escapes. Nested use joins the outer transaction.
+        """
+        if _transaction_connection.get() is not None:
+            yield self
+            return
+
+        with metrics.timed('pool'):
+            conn = get_connection()
+        token = _transaction_connection.set(conn)
+        try:
+            conn.start_transaction()
+            yield self
+            conn.commit()
+        except mysql.connector.Error as e:
+            self._rollback(conn)
+            logger.critical("MySQL Error during transaction: %s", e, exc_info=True)
+            raise DatabaseConnectionError(f"Database error during transaction: {e}")
+        except BaseException:
+            self._rollback(conn)
+            raise
+        finally:
+            _transaction_connection.reset(token)
+            conn.close()
+
+    # --- Internals ---
+    def _rollback(self, conn) -> None:
+        try:
+            conn.rollback()
+        except Exception:
+            logger.error("Rollback failed; discarding connection.", exc_info=True)
+            conn.discard()
+
+    def _shape_rows(self, cursor, rows: list, row_factory) -> list:
+        if row_factory is tuple:
+            return [tuple(row) for row in rows]
+        columns = cursor.column_names
+        dict_rows = [dict(zip(columns, row)) for row in rows]
+        if row_factory is dict:
+            return dict_rows
+        return [row_factory(row) for row in dict_rows]
+
+    def _execute_query(self, query: str, params: tuple, mode: str, row_factory=dict):
+        """
+        Internal helper that executes a single statement on the transaction connection (if any)
+        or on a pooled connection, and translates MySQL errors into DatabaseConnectionError.
+        """
+        conn = _transaction_connection.get()
+        owns_connection = conn is None
+        if owns_connection:
+            with metrics.timed('pool'):
+                conn = get_connection()
+
+        broken = False
+        started = time.perf_counter()
+        try:
+            cursor = conn.cursor()
+            try:
+                if mode == 'many':
+                    # The connector rewrites a batched INSERT into one multi-row statement
+                    cursor.executemany(query, params)
+                    result = cursor.lastrowid
+                else:
+                    cursor.execute(query, params or ())
+                    if mode == 'fetch':
+                        result = self._shape_rows(cursor, cursor.fetchall(), row_factory)
+                    elif mode == 'rows':
+                        result = (tuple(cursor.column_names), [tuple(row) for row in cursor.fetchall()])
+                    elif mode == 'lastrowid':
+                        result = cursor.lastrowid
+                    else:
+                        result = cursor.rowcount
+            finally:
+                cursor.close()
+
+            # SQL and params are only rendered when DEBUG is enabled; result rows are never logged
+            if logger.isEnabledFor(logging.DEBUG):
+                if mode == 'many':
+                    logger.debug("Executed batch insert: %s | Rows: %s | First row id: %s", _compact(query), len(params), result)
+                else:
+                    logger.debug("Executed %s: %s | Params: %s | Result: %s", mode, _compact(query), params,
+                                 f"{len(result)} rows" if mode == 'fetch' else f"{len(result[1])} rows" if mode == 'rows' else result)
+            return result
+        except mysql.connector.Error as e:
+            logger.critical("MySQL Error: %s | Query: %s | Params: %s", e, _compact(query), params, exc_info=True)
+            broken = isinstance(e, _BROKEN_CONNECTION_ERRORS)
+            if isinstance(e, _ROW_ERRORS):
+                raise DataIntegrityError(f"Database rejected the data: {e}")
+            raise DatabaseConnectionError(f"Database error during operation: {e}")
+        except Exception as e:
+            logger.error("Unexpected error in _execute_query: %s", e, exc_info=True)
+            raise Exception(f"An unexpected error occurred in service layer: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.record('db', elapsed)
+            if self.slow_queries is not None:
+                # EXPLAIN runs on the same connection, so skip it for broken connections and batch inserts
+                self.slow_queries.observe(query, params, elapsed, None if broken or mode == 'many' else conn)
+            if owns_connection:
+                if broken:
+                    conn.discard()
+                else:
+                    conn.close()
+
+
+# Process-wide executor shared by all services
+executor = QueryExecutor(slow_queries=build_slow_query_recorder(get_config()))
@@ -0,0 +1,22 @@
+import re
+
+# Word characters only; strips FULLTEXT boolean operators (+ - < > ( ) ~ * " @) from user input
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def build_boolean_query(search_term: str, min_token_size: int = 3) -> str | None:
+    """
+    Turns free-text user input into a MySQL BOOLEAN MODE FULLTEXT query.
+    Every word becomes a required prefix match ("+word*"), so "sum sal" finds "Summer Sale".
+    Words shorter than min_token_size are not in the index and are dropped.
+    Returns None when no indexable word remains.
+    """
+    tokens = [token for token in _TOKEN_PATTERN.findall(search_term or '') if len(token) >= min_token_size]
+    if not tokens:
+        return None
+    return ' '.join(f'+{token}*' for token in tokens)
+
+
+def escape_like(value: str) -> str:
+    """Escapes LIKE wildcards so user input is matched literally."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
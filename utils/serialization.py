@@ -0,0 +1,77 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from json.encoder import encode_basestring_ascii
+from werkzeug.http import http_date, parse_etags
+from exception.catalog_exception import PreconditionFailedError, ValidationError
+
+
+def serialize_catalog_for_json(catalog_data: dict) -> dict:
+    """Serializes catalog data, converting date objects to string format."""
+    if not catalog_data:
+        return None
+    serialized_data = catalog_data.copy()
+    for key in ['start_date', 'end_date']:
+        if key in serialized_data and isinstance(serialized_data[key], (date, datetime)):
+            serialized_data[key] = serialized_data[key].strftime('%Y-%m-%d')
+    return serialized_data
+
+
+# Encoders for the value types MySQL rows hold, producing the same JSON as the Flask provider would
+# (dates as YYYY-MM-DD like serialize_catalog_for_json, datetimes as HTTP dates, Decimals as strings)
+_JSON_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+    date: lambda value: f'"{value.isoformat()}"',
+    datetime: lambda value: f'"{http_date(value)}"',
+    Decimal: lambda value: f'"{value}"',
+}
+
+
+def _encode_other(value) -> str:
+    return json.dumps(value, default=str)
+
+
+def rows_to_json(columns: tuple, rows: list) -> str:
+    """
+    Encodes tuple rows as a JSON array of objects keyed by columns, without building a dict per row.
+    Keys are encoded once per call and each value straight from its row.
+    """
+    keys = [encode_basestring_ascii(column) + ':' for column in columns]
+    encoders = _JSON_ENCODERS
+    return '[' + ','.join(
+        '{' + ','.join([key + (encoders.get(type(value)) or _encode_other)(value) for key, value in zip(keys, row)]) + '}'
+        for row in rows
+    ) + ']'
+
+
+def json_with_data(envelope: dict, data_json: str) -> str:
+    """Returns envelope encoded as a JSON object whose "data" member is the already encoded data_json."""
+    head = json.dumps(envelope, separators=(',', ':'), default=str)
+    return f'{head[:-1]}{"," if envelope else ""}"data":{data_json}}}'
+
+
+def catalog_etag(version: int) -> str:
+    """Returns the strong ETag of a catalog at the given row version (every write bumps the version)."""
+    return f"v{version}"
+
+
+def parse_if_match(header: str | None) -> int | None:
+    """
+    Returns the catalog version named by an If-Match header value, or None when the header
+    is absent or '*' (the write then only requires the catalog to exist).
+    Weak or foreign ETags can never match a version, so they fail like a stale one.
+    """
+    if_match = parse_etags(header)
+    if not if_match or if_match.star_tag:
+        return None
+    tags = list(if_match.as_set(include_weak=True))
+    if len(tags) != 1:
+        raise ValidationError("If-Match must contain exactly one ETag.")
+    tag = tags[0]
+    if if_match.is_weak(tag) or not (tag.startswith('v') and tag[1:].isdigit()):
+        raise PreconditionFailedError(f"If-Match ETag \"{tag}\" does not identify a catalog version.")
+    return int(tag[1:])
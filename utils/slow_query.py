@@ -0,0 +1,196 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from utils.logger import logger
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_SLOW_LOG_MESSAGE = re.compile(r"Slow query \(([\d.]+) ms\): (.*)$")
+
+# Statements EXPLAIN can describe without side effects
+_EXPLAINABLE = ('select', 'update', 'delete')
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(query: str) -> str:
+    """
+    Normalizes a SQL statement so that variants differing only in values share one fingerprint:
+    literals and placeholders become ?, IN (...) lists and multi-row VALUES collapse, whitespace is folded.
+    """
+    normalized = _STRING_LITERAL.sub('?', query)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _PLACEHOLDER.sub('?', normalized)
+    normalized = _IN_LIST.sub('IN (...)', normalized)
+    normalized = _VALUES_LIST.sub(r'VALUES \1, ...', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)] if ordered else 0.0
+
+
+class _QueryStats:
+    __slots__ = ('count', 'total', 'max', 'slow', 'recent', 'last_seen', 'explain', 'explained_at')
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slow = 0
+        self.recent = deque(maxlen=window)
+        self.last_seen = 0.0
+        self.explain = None
+        self.explained_at = None
+
+
+class SlowQueryRecorder:
+    """
+    Aggregates execution statistics per query fingerprint: count, total, max and p95 over a
+    window of recent executions. Statements slower than threshold_ms are logged and, at most once
+    per explain_interval seconds per fingerprint, their EXPLAIN plan is captured.
+    """
+
+    def __init__(self, threshold_ms: float = 200, explain: bool = True, explain_interval: float = 300,
+                 window: int = 1000, max_fingerprints: int = 500):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.explain_interval = explain_interval
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self._stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(self, query: str, params, seconds: float, conn=None) -> None:
+        """
+        Records one execution. conn is the connection the statement ran on; it is used to run
+        EXPLAIN (with the same params) when the statement was slow.
+        """
+        key = fingerprint(query)
+        slow = seconds >= self.threshold
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _QueryStats(self.window)
+                if len(self._stats) > self.max_fingerprints:
+                    self._stats.popitem(last=False)
+            else:
+                self._stats.move_to_end(key)
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.recent.append(seconds)
+            stats.last_seen = time.time()
+            if not slow:
+                return
+            stats.slow += 1
+            due = stats.explained_at is None or time.monotonic() - stats.explained_at >= self.explain_interval
+            capture = self.explain and conn is not None and due and key.lower().startswith(_EXPLAINABLE)
+            if capture:
+                stats.explained_at = time.monotonic()
+
+        # Keep this message format in sync with _SLOW_LOG_MESSAGE, which summarize_slow_log parses
+        logger.warning("Slow query (%.1f ms): %s", seconds * 1000, key)
+        if capture:
+            plan = self._explain(conn, query, params)
+            if plan is not None:
+                with self._lock:
+                    stats.explain = plan
+                logger.warning("EXPLAIN for slow query %s: %s", key, plan)
+
+    @staticmethod
+    def _explain(conn, query: str, params):
+        cursor = None
+        try:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"EXPLAIN {query}", params or ())
+            return cursor.fetchall()
+        except Exception as e:
+            logger.warning("Could not capture EXPLAIN for slow query: %s", e)
+            return None
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+    def report(self, limit: int = 20, sort_by: str = 'total') -> list:
+        """
+        Returns the top fingerprints ordered by sort_by ('total', 'p95', 'max', 'count' or 'slow'),
+        with times in milliseconds and the last captured EXPLAIN plan, if any.
+        """
+        with self._lock:
+            rows = [{
+                "fingerprint": key,
+                "count": stats.count,
+                "slow_count": stats.slow,
+                "total_ms": round(stats.total * 1000, 3),
+                "avg_ms": round(stats.total / stats.count * 1000, 3),
+                "p95_ms": round(_percentile(stats.recent, 0.95) * 1000, 3),
+                "max_ms": round(stats.max * 1000, 3),
+                "last_seen": stats.last_seen,
+                "explain": stats.explain,
+            } for key, stats in self._stats.items()]
+        return _top(rows, limit, sort_by)
+
+    def reset(self) -> None:
+        """Clears every collected statistic."""
+        with self._lock:
+            self._stats.clear()
+
+
+def _top(rows: list, limit: int, sort_by: str) -> list:
+    sort_key = {'total': 'total_ms', 'p95': 'p95_ms', 'max': 'max_ms', 'count': 'count', 'slow': 'slow_count'}
+    rows.sort(key=lambda row: row[sort_key.get(sort_by, 'total_ms')], reverse=True)
+    return rows[:limit]
+
+
+def summarize_slow_log(lines, limit: int = 20, sort_by: str = 'total') -> list:
+    """
+    Aggregates the slow-query records found in log lines (text or JSON format) by fingerprint.
+    Unlike report(), this covers every process writing to the log, but only slow executions.
+    """
+    durations = {}
+    for line in lines:
+        if 'Slow query (' not in line:
+            continue
+        if line.startswith('{'):
+            try:
+                line = json.loads(line)['message']
+            except (ValueError, KeyError, TypeError):
+                continue
+        match = _SLOW_LOG_MESSAGE.search(line.rstrip('\n'))
+        if match:
+            durations.setdefault(match.group(2), []).append(float(match.group(1)))
+
+    rows = [{
+        "fingerprint": key,
+        "count": len(values),
+        "slow_count": len(values),
+        "total_ms": round(sum(values), 3),
+        "avg_ms": round(sum(values) / len(values), 3),
+        "p95_ms": _percentile(values, 0.95),
+        "max_ms": max(values),
+    } for key, values in durations.items()]
+    return _top(rows, limit, sort_by)
+
+
+def build_slow_query_recorder(config):
+    """Creates the recorder configured in the [slow_query] section of config.ini, or None when disabled."""
+    if not config.getboolean('slow_query', 'enabled', fallback=True):
+        return None
+    return SlowQueryRecorder(
+        threshold_ms=config.getfloat('slow_query', 'threshold_ms', fallback=200),
+        explain=config.getboolean('slow_query', 'explain', fallback=True),
+        explain_interval=config.getfloat('slow_query', 'explain_interval', fallback=300),
+        window=config.getint('slow_query', 'window', fallback=1000),
+        max_fingerprints=config.getint('slow_query', 'max_fingerprints', fallback=500),
+    )
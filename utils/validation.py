@@ -1,6 +1,9 @@
 from datetime import datetime, date
 from exception.catalog_exception import ValidationError
 from utils.logger import logger
+from dto.catalog import Catalog
+from utils.metrics import timed
+from utils.catalog_schema import catalog_schema
 
 def validate_alphanumeric_string(value: str, field_name: str, min_length: int = 1, max_length: int = 255) -> str:
     """
@@ -8,21 +11,21 @@ def validate_alphanumeric_string(value: str, field_name: str, min_length: int =
     Logs and raises ValidationError on failure.
     """
     if not isinstance(value, str):
-        logger.warning(f"{field_name} must be a string.")
+        logger.warning("%s must be a string.", field_name)
         raise ValidationError(f"{field_name} must be a string.")
     
     value = value.strip()
     if not value:
-        logger.warning(f"{field_name} cannot be empty.")
+        logger.warning("%s cannot be empty.", field_name)
         raise ValidationError(f"{field_name} cannot be empty.")
     
     if not (min_length <= len(value) <= max_length):
-        logger.warning(f"{field_name} length must be between {min_length} and {max_length}.")
+        logger.warning("%s length must be between %s and %s.", field_name, min_length, max_length)
         raise ValidationError(f"{field_name} must be between {min_length} and {max_length} characters.")
 
     allowed_chars = ".,!?'\"-"
     if not all(c.isalnum() or c.isspace() or c in allowed_chars for c in value):
-        logger.warning(f"{field_name} contains invalid characters.")
+        logger.warning("%s contains invalid characters.", field_name)
         raise ValidationError(
             f"{field_name} contains invalid characters. Only alphanumeric, spaces, and basic punctuation (.,!?'\"-) are allowed."
         )
@@ -35,14 +38,14 @@ def validate_date(date_str: str, field_name: str) -> str:
     Logs and raises ValidationError on failure.
     """
     if not isinstance(date_str, str):
-        logger.warning(f"{field_name} must be a string.")
+        logger.warning("%s must be a string.", field_name)
         raise ValidationError(f"{field_name} must be a string.")
 
     try:
         datetime.strptime(date_str, '%Y-%m-%d')
         return date_str
     except ValueError:
-        logger.warning(f"{field_name} is not in valid 'YYYY-MM-DD' format.")
+        logger.warning("%s is not in valid 'YYYY-MM-DD' format.", field_name)
         raise ValidationError(f"{field_name} must be in `YYYY-MM-DD` format.")
 
 def validate_future_date(date_str: str, field_name: str) -> str:
@@ -55,7 +58,7 @@ def validate_future_date(date_str: str, field_name: str) -> str:
     today = date.today()
 
     if input_date < today:
-        logger.warning(f"{field_name} cannot be in the past.")
+        logger.warning("%s cannot be in the past.", field_name)
         raise ValidationError(f"{field_name} cannot be in the past.")
 
     return valid_date_str
@@ -73,7 +76,24 @@ def validate_status(status: str) -> str:
     allowed = ['active', 'inactive']
 
     if normalized not in allowed:
-        logger.warning(f"Invalid status '{status}'. Allowed: {allowed}.")
+        logger.warning("Invalid status '%s'. Allowed: %s.", status, allowed)
         raise ValidationError(f"Invalid status: '{status}'. Allowed values are {', '.join(allowed)}.")
 
     return normalized
+
+@timed('validate')
+def validate_catalog_payload(data: dict) -> Catalog:
+    """
+    Validates a catalog JSON payload (name, description, start_date, end_date, status)
+    and returns it as a Catalog DTO. Raises ValidationError listing every invalid field.
+    """
+    return catalog_schema.validate(data)
+
+@timed('validate')
+def validate_catalog_patch(data: dict) -> dict:
+    """
+    Validates a partial catalog payload containing any subset of the catalog fields.
+    Returns the validated values keyed by catalog column. Unknown fields and empty payloads are rejected.
+    When only one date is sent, its order against the stored date is checked by the update itself.
+    """
+    return catalog_schema.validate_patch(data)
@@ -0,0 +1,65 @@
+"""
+Production WSGI entry point.
+
+    gunicorn -c gunicorn.conf.py wsgi:app      (or simply: python wsgi.py)
+
+gunicorn.conf.py preloads this module once in the master process, so the app, config.ini and the
+compiled templates are shared by every forked worker. Each worker then opens its own connection pool
+(see warm_worker) before it accepts traffic.
+"""
+import os
+import sys
+from flask import Flask
+
+# Add project root to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.db_pool import get_pool
+from utils.logger import logger
+
+
+def warm_templates(flask_app: Flask) -> None:
+    """Compiles every Jinja template up front so no request pays for the first render."""
+    for name in flask_app.jinja_env.list_templates():
+        flask_app.jinja_env.get_template(name)
+
+
+def load_app() -> Flask:
+    """
+    Imports the module-level application from app.py (which builds its config, caches and services
+    on import) and compiles its templates. The app is a process-wide singleton: calling this again
+    returns the same object. Opens no database connections, so it is safe to call before forking.
+    """
+    from app import app as flask_app
+    warm_templates(flask_app)
+    logger.info("Application loaded (pid %s); %s templates compiled.", os.getpid(), len(flask_app.jinja_env.list_templates()))
+    return flask_app
+
+
+def warm_worker() -> None:
+    """
+    Opens the connection pool's min_size connections in the current (worker) process and loads
+    the catalog name index behind /api/catalogs/suggest. A database outage does not stop the worker
+    from starting; connections are then opened, and the index built, on demand.
+    """
+    try:
+        get_pool().prefill()
+        logger.info("Worker %s warmed up: %s database connections ready.", os.getpid(), get_pool().stats()['idle'])
+    except Exception as e:
+        logger.error("Worker %s could not pre-open database connections: %s", os.getpid(), e)
+        return
+    try:
+        from app import catalog_service
+        catalog_service.build_suggest_index()
+    except Exception as e:
+        logger.error("Worker %s could not build the suggestion index: %s", os.getpid(), e)
+
+
+app = load_app()
+
+
+if __name__ == '__main__':
+    from gunicorn.app.wsgiapp import run
+    sys.argv = [sys.argv[0], '-c', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py'),
+                'wsgi:app'] + sys.argv[1:]
+    run()